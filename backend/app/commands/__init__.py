@@ -0,0 +1,3 @@
+"""
+Commands Package - Maintenance commands, run with `python -m app.commands.<name>`
+"""
@@ -0,0 +1,42 @@
+"""
+Backfill Name Keys Command
+Sets users.full_name_lower, which the name= filter of the employee list
+matches, on employees stored before the field existed. Safe to re-run;
+build.sh runs it before manage_indexes.
+
+Usage (from the backend directory):
+    python -m app.commands.backfill_name_keys [--batch-size 1000]
+"""
+import argparse
+import os
+import sys
+from dotenv import load_dotenv
+
+load_dotenv()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.models import User
+from app.utils import connect_database, disconnect_database
+from app.utils.response_cache import invalidate_responses
+
+
+def main(argv=None):
+    """Parse arguments and backfill full_name_lower"""
+    parser = argparse.ArgumentParser(description="Set full_name_lower on existing employees")
+    parser.add_argument('--batch-size', type=int, default=1000, help="Updates per bulk write")
+    args = parser.parse_args(argv)
+    
+    if not connect_database():
+        return 1
+    try:
+        updated = User.backfill_name_keys(args.batch_size)
+        if updated:
+            invalidate_responses('users')
+        print(f"✅ Set full_name_lower on {updated} employees")
+        return 0
+    finally:
+        disconnect_database()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+Cleanup Orphans Command
+Deletes attendance records whose employee no longer exists, reporting
+progress per batch
+
+Usage (from the backend directory):
+    python -m app.commands.cleanup_orphans [--batch-size 1000]
+"""
+import argparse
+import os
+import sys
+from dotenv import load_dotenv
+
+load_dotenv()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.controllers.attendance_controller import delete_orphaned_records
+from app.utils import connect_database, disconnect_database
+
+
+def print_progress(employees_checked, employees_total, orphaned_employees, deleted_records):
+    """Print one progress line per batch"""
+    print(f"  {employees_checked}/{employees_total} employee ids checked, "
+          f"{orphaned_employees} orphaned, {deleted_records} records deleted")
+
+
+def main(argv=None):
+    """Parse arguments and delete orphaned attendance records"""
+    parser = argparse.ArgumentParser(description="Delete attendance records of deleted employees")
+    parser.add_argument('--batch-size', type=int, help="Employee ids per batch (default CLEANUP_BATCH_SIZE)")
+    args = parser.parse_args(argv)
+    
+    if not connect_database():
+        return 1
+    try:
+        result = delete_orphaned_records(args.batch_size, print_progress)
+        print(f"✅ Deleted {result['deleted_records']} records of {result['orphaned_employees']} deleted employees")
+        return 0
+    finally:
+        disconnect_database()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
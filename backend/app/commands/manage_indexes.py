@@ -0,0 +1,98 @@
+"""
+Manage Indexes Command
+Diffs the indexes declared on the models against MongoDB and reports their
+sizes. --apply builds missing indexes in the background; build.sh runs it
+before new workers start. Dropping is a separate step, --drop-redundant
+(and --drop-extra for undeclared indexes), to run by hand once no worker
+of the previous release is left.
+
+Usage (from the backend directory):
+    python -m app.commands.manage_indexes [--apply] [--drop-redundant] [--drop-extra] [--check]
+"""
+import argparse
+import os
+import sys
+from dotenv import load_dotenv
+
+load_dotenv()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.models import User, Attendance, AttendanceRollup
+from app.utils import connect_database, disconnect_database
+from app.utils.indexes import plan_indexes, apply_index_plan, index_sizes
+
+
+def format_size(size):
+    """Human readable byte count"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def print_plan(plan):
+    """Print the diff and index sizes of one collection"""
+    sizes = plan['sizes']
+    print(f"\n{plan['collection']} ({format_size(sum(sizes.values()))} of indexes)" if sizes else f"\n{plan['collection']}")
+    for name, size in sorted(sizes.items(), key=lambda item: -item[1]):
+        print(f"    {name:<60} {format_size(size):>10}")
+    for spec in plan['missing']:
+        print(f"  missing    {', '.join(f'{field} {direction}' for field, direction in spec['fields'])}"
+              f"{' (unique)' if spec.get('unique') else ''}")
+    for index in plan['redundant']:
+        print(f"  redundant  {index['name']} (covered by {index['covered_by']}); kept unless --drop-redundant")
+    for index in plan['extra']:
+        print(f"  extra      {index['name']} ({index['key']}), not declared; kept unless --drop-extra")
+    for conflict in plan['conflicts']:
+        print(f"  conflict   {conflict}; drop it for it to be rebuilt")
+    for warning in plan['warnings']:
+        print(f"  warning    {warning}")
+
+
+def main(argv=None):
+    """Parse arguments, diff every model's indexes and optionally apply"""
+    parser = argparse.ArgumentParser(description="Diff, build and drop MongoDB indexes")
+    parser.add_argument('--apply', action='store_true', help="Build missing indexes")
+    parser.add_argument('--drop-redundant', action='store_true', help="Drop indexes a declared index covers")
+    parser.add_argument('--drop-extra', action='store_true', help="Drop undeclared indexes nothing covers")
+    parser.add_argument('--check', action='store_true', help="Exit 1 if any index is missing or redundant")
+    args = parser.parse_args(argv)
+
+    if not connect_database():
+        return 1
+    try:
+        pending = False
+        conflicts = False
+        for model in (User, Attendance, AttendanceRollup):
+            plan = plan_indexes(model)
+            print_plan(plan)
+            pending = pending or bool(plan['missing'] or plan['redundant'] or plan['conflicts'])
+            conflicts = conflicts or bool(plan['conflicts'])
+            if ((args.apply and plan['missing']) or (args.drop_redundant and plan['redundant'])
+                    or (args.drop_extra and plan['extra'])):
+                changes = apply_index_plan(
+                    model, plan,
+                    build=args.apply,
+                    drop_redundant=args.drop_redundant,
+                    drop_extra=args.drop_extra
+                )
+                sizes = index_sizes(model._get_collection())
+                print(f"  ✅ {len(changes['created'])} built, {len(changes['dropped'])} dropped"
+                      + (f", {format_size(sum(sizes.values()))} of indexes now" if sizes else ""))
+
+        if args.apply and conflicts:
+            print("\n❌ Conflicting indexes need to be dropped by hand")
+            return 1
+        if args.check and pending and not args.apply:
+            print("\n❌ Indexes differ from the models")
+            return 1
+        return 0
+    except Exception as e:
+        print(f"❌ Index management failed: {str(e)}")
+        return 1
+    finally:
+        disconnect_database()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Migrate Attendance Unique Command
+Moves a database from the non-unique (employee_id, attendance_date) index
+to the unique one: deletes duplicate records of the same employee and day,
+repairs the rollups of the affected days, builds the unique index and then
+drops the old one. Safe to re-run; build.sh runs it before manage_indexes.
+
+Usage (from the backend directory):
+    python -m app.commands.migrate_attendance_unique [--dry-run]
+"""
+import argparse
+import os
+import sys
+from dotenv import load_dotenv
+from pymongo.errors import DuplicateKeyError
+
+load_dotenv()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.models import Attendance, AttendanceRollup
+from app.models.attendance_model import UNIQUE_DAY_INDEX, LEGACY_DAY_INDEX
+from app.utils import connect_database, disconnect_database
+from app.utils.indexes import plan_indexes, apply_index_plan
+from app.utils.response_cache import invalidate_responses
+
+# Workers of the previous release can store a new duplicate between the
+# cleanup and the index build, failing the build; it is retried this often
+BUILD_ATTEMPTS = 3
+
+
+def unique_index_exists(collection):
+    """True once the unique (employee_id, attendance_date) index is built"""
+    return any(
+        info.get('unique') and [field for field, _ in info['key']] == ['employee_id', 'attendance_date']
+        for info in collection.index_information().values()
+    )
+
+
+def build_unique_index():
+    """
+    Delete duplicates and build the declared attendance indexes
+
+    Returns:
+        tuple: (records deleted, days affected)
+    """
+    deleted = 0
+    days = set()
+    for attempt in range(1, BUILD_ATTEMPTS + 1):
+        removed, removed_days = Attendance.remove_duplicate_days()
+        deleted += removed
+        days.update(removed_days)
+        print(f"Deleted {removed} duplicate attendance records")
+        try:
+            apply_index_plan(Attendance, plan_indexes(Attendance), build=True)
+            return deleted, days
+        except DuplicateKeyError:
+            if attempt == BUILD_ATTEMPTS:
+                raise
+            print("⚠️ New duplicates were written during the build, retrying")
+
+
+def main(argv=None):
+    """Parse arguments and run the migration"""
+    parser = argparse.ArgumentParser(description="Make attendance unique per employee and day")
+    parser.add_argument('--dry-run', action='store_true', help="Only report whether the migration is needed")
+    args = parser.parse_args(argv)
+
+    if not connect_database():
+        return 1
+    try:
+        collection = Attendance._get_collection()
+        legacy = collection.index_information().get(LEGACY_DAY_INDEX)
+        has_unique = unique_index_exists(collection)
+        if has_unique and (legacy is None or legacy.get('unique')):
+            print("✅ Attendance is already unique per employee and day")
+            return 0
+        if args.dry_run:
+            print(f"Migration needed: unique index {'present' if has_unique else 'missing'}, "
+                  f"{LEGACY_DAY_INDEX} {'present' if legacy else 'absent'}")
+            return 0
+
+        if not has_unique:
+            deleted, days = build_unique_index()
+            if days:
+                # Duplicates were counted in the rollups of their day
+                written = AttendanceRollup.rebuild(min(days), max(days))
+                print(f"Rebuilt {written} rollup documents for {len(days)} affected days")
+            if deleted:
+                invalidate_responses('attendance', 'attendance_rollups')
+
+        # The unique index now serves every lookup the old one did
+        if legacy is not None and not legacy.get('unique'):
+            collection.drop_index(LEGACY_DAY_INDEX)
+            print(f"Dropped {LEGACY_DAY_INDEX}")
+        print(f"✅ Attendance is unique per employee and day ({UNIQUE_DAY_INDEX})")
+        return 0
+    except Exception as e:
+        print(f"❌ Attendance migration failed: {str(e)}")
+        return 1
+    finally:
+        disconnect_database()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
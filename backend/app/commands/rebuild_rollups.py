@@ -0,0 +1,52 @@
+"""
+Rebuild Rollups Command
+Recomputes the daily attendance rollups from raw attendance records
+
+Safe to run while attendance is being marked (see AttendanceRollup.rebuild).
+Deploys run it with --if-empty, which backfills a database whose attendance
+predates the rollups and does nothing once they exist.
+
+Usage (from the backend directory):
+    python -m app.commands.rebuild_rollups [--from YYYY-MM-DD] [--to YYYY-MM-DD] [--if-empty]
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+from dotenv import load_dotenv
+
+load_dotenv()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.models import AttendanceRollup
+from app.utils import connect_database, disconnect_database
+from app.utils.response_cache import invalidate_responses
+
+
+def main(argv=None):
+    """Parse arguments and rebuild the requested date range"""
+    parser = argparse.ArgumentParser(description="Rebuild daily attendance rollups")
+    parser.add_argument('--from', dest='date_from', help="First date to rebuild (YYYY-MM-DD)")
+    parser.add_argument('--to', dest='date_to', help="Last date to rebuild (YYYY-MM-DD)")
+    parser.add_argument('--if-empty', action='store_true', help="Only rebuild when there are no rollups yet")
+    args = parser.parse_args(argv)
+    
+    date_from = datetime.strptime(args.date_from, '%Y-%m-%d') if args.date_from else None
+    date_to = datetime.strptime(args.date_to, '%Y-%m-%d') if args.date_to else None
+    
+    if not connect_database():
+        return 1
+    try:
+        if args.if_empty and AttendanceRollup._get_collection().find_one({}, {'_id': 1}):
+            print("Rollups already exist, nothing to backfill")
+            return 0
+        written = AttendanceRollup.rebuild(date_from, date_to)
+        invalidate_responses('attendance_rollups')
+        print(f"✅ Rebuilt {written} rollup documents")
+        return 0
+    finally:
+        disconnect_database()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,5 +3,19 @@ Controllers Package - Business logic for HRMS Lite
 """
 from .employee_controller import EmployeeController
 from .attendance_controller import AttendanceController
+from .dashboard_controller import DashboardController
+from .report_controller import ReportController
+from .async_employee_controller import AsyncEmployeeController
+from .async_attendance_controller import AsyncAttendanceController
+from .dispatch import call_controller, call_cached
 
-__all__ = ['EmployeeController', 'AttendanceController']
+__all__ = [
+    'EmployeeController',
+    'AttendanceController',
+    'DashboardController',
+    'ReportController',
+    'AsyncEmployeeController',
+    'AsyncAttendanceController',
+    'call_controller',
+    'call_cached'
+]
@@ -0,0 +1,211 @@
+"""
+Async Attendance Controller - Attendance tracking on the native async backend
+Same operations and responses as AttendanceController, backed by AttendanceRepository
+"""
+from datetime import datetime, date
+from pymongo.errors import DuplicateKeyError
+from app.models import Attendance, AttendanceRollup
+from app.repositories import EmployeeRepository, AttendanceRepository
+from app.utils import (
+    error_response, success_response, parse_clock_time,
+    serialize_attendance, get_async_database, run_sync
+)
+from app.utils.pagination import parse_fields
+from app.utils.response_cache import invalidate_responses
+from app.utils.attendance_events import get_event_bus
+
+
+async def _serialize_records(records, employees, fields=None):
+    """Serialize records, resolving employees missing from the given map in one query"""
+    if not fields or {'employee_id', 'employee_name'} & set(fields):
+        missing = {record['employee_id'] for record in records} - set(employees)
+        if missing:
+            employees = dict(employees)
+            employees.update(await EmployeeRepository(get_async_database()).find_by_ids(missing))
+    return [
+        serialize_attendance(record, employees.get(record.get('employee_id')), fields)
+        for record in records
+    ]
+
+
+class AsyncAttendanceController:
+    """Async controller for attendance-related operations"""
+    
+    @staticmethod
+    async def mark_attendance(employee_id, attendance_data):
+        """
+        Mark attendance for an employee - Only for today's date
+        
+        Args:
+            employee_id (str): Employee ID
+            attendance_data (dict): Attendance information
+            
+        Returns:
+            dict: Response with created attendance record
+        """
+        try:
+            db = get_async_database()
+            employee = await EmployeeRepository(db).find_by_employee_id(employee_id)
+            if not employee:
+                return error_response(f"Employee {employee_id} not found", status_code=404)
+            
+            today = date.today()
+            provided_date_str = attendance_data.get('attendance_date', today.isoformat())
+            attendance_date = datetime.strptime(provided_date_str, '%Y-%m-%d').date()
+            
+            if attendance_date != today:
+                return error_response(
+                    f"Attendance can only be marked for today ({today.isoformat()}). "
+                    f"You provided {attendance_date.isoformat()}",
+                    status_code=400
+                )
+            
+            attendance = await AttendanceRepository(db).insert(
+                employee['_id'],
+                today,
+                is_present=attendance_data.get('is_present', True),
+                check_in_time=parse_clock_time(attendance_data.get('check_in_time'), today),
+                check_out_time=parse_clock_time(attendance_data.get('check_out_time'), today),
+                notes=attendance_data.get('notes')
+            )
+            counts = AttendanceRollup.record_counts(
+                attendance['is_present'],
+                attendance.get('check_in_time'),
+                attendance.get('check_out_time')
+            )
+            await run_sync(AttendanceRollup.apply, {(attendance['attendance_date'], employee['department']): counts})
+            await run_sync(invalidate_responses, 'attendance', 'attendance_rollups')
+            record = serialize_attendance(attendance, employee)
+            get_event_bus().publish_local('created', record)
+            
+            return success_response(
+                "Attendance marked successfully for today",
+                data=record,
+                status_code=201
+            )
+        except DuplicateKeyError:
+            # The unique (employee_id, attendance_date) index rejected a second mark
+            return error_response(
+                f"Attendance already marked for {employee_id} today",
+                status_code=409
+            )
+        except ValueError as ve:
+            return error_response(f"Invalid date format. Use YYYY-MM-DD: {str(ve)}", status_code=400)
+        except Exception as e:
+            return error_response(f"Error marking attendance: {str(e)}", status_code=500)
+    
+    @staticmethod
+    async def get_employee_attendance(employee_id, date_from=None, date_to=None, is_present=None):
+        """
+        Get an employee's attendance records, newest first
+        
+        Args:
+            employee_id (str): Employee ID
+            date_from (str): First date to include, YYYY-MM-DD (optional)
+            date_to (str): Last date to include, YYYY-MM-DD (optional)
+            is_present (bool): Only present or only absent records (optional)
+            
+        Returns:
+            dict: Response with attendance records
+        """
+        try:
+            db = get_async_database()
+            employee = await EmployeeRepository(db).find_by_employee_id(employee_id)
+            if not employee:
+                return error_response(f"Employee {employee_id} not found", status_code=404)
+            
+            query = Attendance.range_query(date_from, date_to, is_present)
+            attendance_records = await AttendanceRepository(db).list_for_employee(employee['_id'], query)
+            records = await _serialize_records(attendance_records, {employee['_id']: employee})
+            
+            return success_response(
+                f"Retrieved {len(records)} attendance records",
+                data=records,
+                status_code=200
+            )
+        except ValueError as ve:
+            return error_response(str(ve), status_code=400)
+        except Exception as e:
+            return error_response(f"Error fetching attendance: {str(e)}", status_code=500)
+    
+    @staticmethod
+    async def get_all_attendance(limit=None, cursor=None, fields=None, date_from=None, date_to=None,
+                                 department=None, is_present=None):
+        """
+        Get one page of attendance records, newest attendance_date first
+        
+        Args:
+            limit (int): Page size (capped by MAX_PAGE_SIZE)
+            cursor (str): next_cursor from the previous page (same filters)
+            fields (str): Comma separated output fields to return
+            date_from (str): First date to include, YYYY-MM-DD (optional)
+            date_to (str): Last date to include, YYYY-MM-DD (optional)
+            department (str): Only employees of this department (optional)
+            is_present (bool): Only present or only absent records (optional)
+        
+        Returns:
+            dict: Response with attendance records and next_cursor
+        """
+        try:
+            db = get_async_database()
+            projection = parse_fields(fields, Attendance.SERIALIZED_FIELDS)
+            query = Attendance.range_query(date_from, date_to, is_present)
+            employees = {}
+            if department:
+                employees = await EmployeeRepository(db).find_by_department(department)
+                query['employee_id'] = {'$in': list(employees)}
+            attendance_records, next_cursor = await AttendanceRepository(db).page(
+                query=query,
+                cursor=cursor,
+                limit=limit,
+                projection=Attendance.source_fields(projection) if projection else None
+            )
+            records = await _serialize_records(attendance_records, employees, projection)
+            
+            return success_response(
+                f"Retrieved {len(records)} attendance records",
+                data=records,
+                status_code=200,
+                next_cursor=next_cursor
+            )
+        except ValueError as ve:
+            return error_response(str(ve), status_code=400)
+        except Exception as e:
+            return error_response(f"Error fetching attendance: {str(e)}", status_code=500)
+    
+    @staticmethod
+    async def get_attendance_by_date(target_date_str, department=None, is_present=None):
+        """
+        Get attendance records for a specific date
+        
+        Args:
+            target_date_str (str): Date in YYYY-MM-DD format
+            department (str): Only employees of this department (optional)
+            is_present (bool): Only present or only absent records (optional)
+            
+        Returns:
+            dict: Response with attendance records for that date
+        """
+        try:
+            db = get_async_database()
+            target_date = datetime.strptime(target_date_str, '%Y-%m-%d').date()
+            
+            query = {}
+            if is_present is not None:
+                query['is_present'] = is_present
+            employees = {}
+            if department:
+                employees = await EmployeeRepository(db).find_by_department(department)
+                query['employee_id'] = {'$in': list(employees)}
+            attendance_records = await AttendanceRepository(db).list_for_date(target_date, query)
+            records = await _serialize_records(attendance_records, employees)
+            
+            return success_response(
+                f"Retrieved {len(records)} attendance records for {target_date_str}",
+                data=records,
+                status_code=200
+            )
+        except ValueError:
+            return error_response("Invalid date format. Use YYYY-MM-DD", status_code=400)
+        except Exception as e:
+            return error_response(f"Error fetching attendance: {str(e)}", status_code=500)
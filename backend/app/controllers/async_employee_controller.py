@@ -0,0 +1,215 @@
+"""
+Async Employee Controller - Employee management on the native async backend
+Same operations and responses as EmployeeController, backed by EmployeeRepository
+"""
+from pymongo.errors import DuplicateKeyError
+from app.models import User, AttendanceRollup
+from app.repositories import EmployeeRepository
+from app.utils import (
+    validate_add_employee_data, error_response, success_response,
+    serialize_user, run_sync, get_async_database
+)
+from app.utils.pagination import parse_fields
+from app.utils.response_cache import invalidate_responses
+from app.utils.attendance_events import get_event_bus
+
+STATUS_CHOICES = ["Active", "Inactive", "On Leave"]
+
+
+def _repository():
+    return EmployeeRepository(get_async_database())
+
+
+class AsyncEmployeeController:
+    """Async controller for employee-related operations"""
+    
+    @staticmethod
+    async def add_employee(employee_data):
+        """
+        Add a new employee
+        
+        Args:
+            employee_data (dict): Employee information
+            
+        Returns:
+            dict: Response with success status and data/error
+        """
+        try:
+            # Email validation may hit DNS, keep it off the event loop
+            is_valid, error_msg = await run_sync(validate_add_employee_data, employee_data)
+            if not is_valid:
+                return error_response(error_msg, status_code=400)
+            
+            repository = _repository()
+            existing = await repository.find_by_employee_id(employee_data['employee_id'])
+            if existing:
+                return error_response(f"Employee with ID {employee_data['employee_id']} already exists", status_code=409)
+            
+            employee = await repository.insert({
+                'employee_id': employee_data['employee_id'],
+                'full_name': employee_data['full_name'],
+                'email': employee_data['email'],
+                'department': employee_data['department'],
+                'role': employee_data.get('role', 'Employee'),
+                'status': 'Active'
+            })
+            await run_sync(invalidate_responses, 'users')
+            
+            return success_response(
+                "Employee added successfully",
+                data=serialize_user(employee),
+                status_code=201
+            )
+        except DuplicateKeyError:
+            return error_response("Email already exists", status_code=409)
+        except Exception as e:
+            return error_response(f"Error adding employee: {str(e)}", status_code=500)
+    
+    @staticmethod
+    async def get_all_employees(limit=None, cursor=None, fields=None, department=None, status=None,
+                                role=None, name=None, search=None, sort='-created_at'):
+        """
+        Get one page of employees matching the filters, newest first by default
+        
+        Args:
+            limit (int): Page size (capped by MAX_PAGE_SIZE)
+            cursor (str): next_cursor from the previous page (same filters and sort)
+            fields (str): Comma separated output fields to return
+            department (str): Exact department filter
+            status (str): Exact status filter
+            role (str): Exact role filter
+            name (str): Case-insensitive full name prefix
+            search (str): Words to match in full names
+            sort (str): created_at, full_name or employee_id, '-' prefix for descending
+        
+        Returns:
+            dict: Response with list of employees and next_cursor
+        """
+        try:
+            projection = parse_fields(fields, User.SERIALIZED_FIELDS)
+            query, sort_field, direction = User.list_query(department, status, role, name, search, sort)
+            employees, next_cursor = await _repository().page(
+                query=query,
+                sort_field=sort_field,
+                direction=direction,
+                cursor=cursor,
+                limit=limit,
+                projection=User.source_fields(projection) if projection else None
+            )
+            employee_list = [serialize_user(emp, projection) for emp in employees]
+            
+            return success_response(
+                f"Retrieved {len(employee_list)} employees",
+                data=employee_list,
+                status_code=200,
+                next_cursor=next_cursor
+            )
+        except ValueError as ve:
+            return error_response(str(ve), status_code=400)
+        except Exception as e:
+            return error_response(f"Error fetching employees: {str(e)}", status_code=500)
+    
+    @staticmethod
+    async def get_employee_by_id(employee_id):
+        """
+        Get specific employee by ID
+        
+        Args:
+            employee_id (str): Employee ID
+            
+        Returns:
+            dict: Response with employee data or error
+        """
+        try:
+            employee = await _repository().find_by_employee_id(employee_id)
+            if not employee:
+                return error_response(f"Employee {employee_id} not found", status_code=404)
+            
+            return success_response(
+                "Employee retrieved successfully",
+                data=serialize_user(employee),
+                status_code=200
+            )
+        except Exception as e:
+            return error_response(f"Error fetching employee: {str(e)}", status_code=500)
+    
+    @staticmethod
+    async def update_employee(employee_id, update_data):
+        """
+        Update employee information
+        Cannot update employee_id or email
+        
+        Args:
+            employee_id (str): Employee ID to update
+            update_data (dict): Fields to update
+            
+        Returns:
+            dict: Response with updated employee data
+        """
+        try:
+            allowed_fields = ['full_name', 'department', 'role', 'status']
+            changes = {
+                field: update_data[field]
+                for field in allowed_fields
+                if field in update_data and update_data[field]
+            }
+            if 'status' in changes and changes['status'] not in STATUS_CHOICES:
+                return error_response(
+                    f"Invalid status: must be one of {', '.join(STATUS_CHOICES)}",
+                    status_code=400
+                )
+            
+            repository = _repository()
+            previous = await repository.find_by_employee_id(employee_id)
+            if not previous:
+                return error_response(f"Employee {employee_id} not found", status_code=404)
+            
+            employee = await repository.update(employee_id, changes)
+            if not employee:
+                return error_response(f"Employee {employee_id} not found", status_code=404)
+            
+            # Department rollups count employees under their current department
+            if employee['department'] != previous['department']:
+                await run_sync(
+                    AttendanceRollup.move_employee,
+                    employee['_id'], previous['department'], employee['department']
+                )
+                await run_sync(invalidate_responses, 'users', 'attendance_rollups')
+            else:
+                await run_sync(invalidate_responses, 'users')
+            
+            return success_response(
+                "Employee updated successfully",
+                data=serialize_user(employee),
+                status_code=200
+            )
+        except Exception as e:
+            return error_response(f"Error updating employee: {str(e)}", status_code=500)
+    
+    @staticmethod
+    async def delete_employee(employee_id):
+        """
+        Delete an employee and their attendance records
+        
+        Args:
+            employee_id (str): Employee ID to delete
+            
+        Returns:
+            dict: Response with deletion status
+        """
+        try:
+            repository = _repository()
+            employee = await repository.find_by_employee_id(employee_id)
+            if not employee:
+                return error_response(f"Employee {employee_id} not found", status_code=404)
+            
+            await repository.delete_cascade(employee)
+            await run_sync(invalidate_responses, 'users', 'attendance', 'attendance_rollups')
+            get_event_bus().publish_local('reset', None)
+            
+            return success_response(
+                f"Employee {employee_id} deleted successfully",
+                status_code=200
+            )
+        except Exception as e:
+            return error_response(f"Error deleting employee: {str(e)}", status_code=500)
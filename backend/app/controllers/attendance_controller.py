@@ -2,9 +2,164 @@
 Attendance Controller - Business logic for attendance management
 Handles attendance marking and tracking
 """
-from datetime import datetime
-from app.models import User, Attendance
-from app.utils import error_response, success_response
+import csv
+import io
+from datetime import datetime, date
+from mongoengine import NotUniqueError
+from pymongo.errors import BulkWriteError
+from config import get_settings
+from app.models import User, Attendance, AttendanceRollup
+from app.utils import error_response, success_response, parse_clock_time, serialize_attendance
+from app.utils.employee_cache import find_employee_documents
+from app.utils.response_cache import invalidate_responses
+from app.utils.attendance_events import get_event_bus
+from app.utils.jobs import get_background_jobs
+from app.utils.responses import json_dumps
+from app.utils.pagination import find_page, parse_fields
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+CLEANUP_JOB = 'attendance-cleanup'
+
+
+def _day_start(date_str):
+    """Parse YYYY-MM-DD into the midnight datetime MongoDB stores for DateFields"""
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+
+def _bulk_result(index, employee_id, status_code, message, record_id=None):
+    """Per-item entry of a bulk marking response"""
+    return {
+        'index': index,
+        'employee_id': employee_id,
+        'success': status_code == 201,
+        'status_code': status_code,
+        'message': message,
+        'id': record_id
+    }
+
+
+def _serialize_records(records, known=None, fields=None):
+    """
+    Serialize raw attendance documents, resolving their employees in one query
+    
+    Args:
+        records (iterable): Raw attendance documents or a cursor over them
+        known (dict): Already loaded users documents by _id
+        fields (list): Optional subset of output fields
+    """
+    records = list(records)
+    employees = dict(known or {})
+    if not fields or {'employee_id', 'employee_name'} & set(fields):
+        missing = {record.get('employee_id') for record in records} - set(employees)
+        missing.discard(None)
+        if missing:
+            employees.update(find_employee_documents(missing))
+    return [
+        serialize_attendance(record, employees.get(record.get('employee_id')), fields)
+        for record in records
+    ]
+
+
+def _department_employees(department):
+    """Employees of a department by _id, with the fields serializers need"""
+    users = User._get_collection().find(
+        {'department': department},
+        {'employee_id': 1, 'full_name': 1}
+    )
+    return {user['_id']: user for user in users}
+
+
+def delete_orphaned_records(batch_size=None, report=None):
+    """
+    Delete attendance records whose employee no longer exists
+    
+    Set based: the distinct employee ids referenced by attendance are checked
+    against users one batch at a time with $in, and each batch's orphans are
+    removed with a single delete_many.
+    
+    Args:
+        batch_size (int): Employee ids per batch (defaults to CLEANUP_BATCH_SIZE)
+        report (callable): Called with progress keyword arguments after each batch
+        
+    Returns:
+        dict: orphaned_employees and deleted_records counts
+    """
+    batch_size = batch_size or get_settings().CLEANUP_BATCH_SIZE
+    attendance = Attendance._get_collection()
+    users = User._get_collection()
+    
+    referenced = attendance.distinct('employee_id')
+    progress = {'employees_total': len(referenced), 'employees_checked': 0, 'orphaned_employees': 0, 'deleted_records': 0}
+    if report:
+        report(**progress)
+    for start in range(0, len(referenced), batch_size):
+        batch = referenced[start:start + batch_size]
+        existing = {user['_id'] for user in users.find({'_id': {'$in': batch}}, {'_id': 1})}
+        # A null reference is never found, so those records are removed too
+        orphans = [employee_pk for employee_pk in batch if employee_pk not in existing]
+        if orphans:
+            progress['deleted_records'] += attendance.delete_many({'employee_id': {'$in': orphans}}).deleted_count
+        progress['employees_checked'] += len(batch)
+        progress['orphaned_employees'] += len(orphans)
+        if report:
+            report(**progress)
+    
+    if progress['deleted_records']:
+        invalidate_responses('attendance')
+        get_event_bus().publish_local('reset', None)
+    return {key: progress[key] for key in ('orphaned_employees', 'deleted_records')}
+
+
+def _encode_export_batch(batch, employees, export_format):
+    """
+    Serialize one batch of raw attendance documents into an export chunk
+    
+    Employees referenced by the batch but not yet in the employees map are
+    loaded with a single $in query and kept for later batches.
+    """
+    missing = {doc['employee_id'] for doc in batch} - set(employees)
+    if missing:
+        users = User._get_collection().find(
+            {'_id': {'$in': list(missing)}},
+            {'employee_id': 1, 'full_name': 1}
+        )
+        employees.update((user['_id'], user) for user in users)
+    
+    rows = [serialize_attendance(doc, employees.get(doc['employee_id'])) for doc in batch]
+    if export_format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=Attendance.SERIALIZED_FIELDS)
+        writer.writerows(
+            {key: value.isoformat() if isinstance(value, (date, datetime)) else value for key, value in row.items()}
+            for row in rows
+        )
+        return buffer.getvalue()
+    return b''.join(json_dumps(row) + b'\n' for row in rows)
+
+
+def _export_chunks(query, employees, export_format, batch_size):
+    """
+    Stream attendance rows from a server-side cursor, one chunk per batch
+    
+    Only one batch of documents is held in memory at a time.
+    """
+    if export_format == 'csv':
+        yield ','.join(Attendance.SERIALIZED_FIELDS) + '\r\n'
+    
+    cursor = Attendance._get_collection().find(query, batch_size=batch_size).sort(
+        [('attendance_date', 1), ('_id', 1)]
+    )
+    try:
+        batch = []
+        for doc in cursor:
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                yield _encode_export_batch(batch, employees, export_format)
+                batch = []
+        if batch:
+            yield _encode_export_batch(batch, employees, export_format)
+    finally:
+        cursor.close()
 
 
 class AttendanceController:
@@ -23,7 +178,8 @@ class AttendanceController:
             dict: Response with created attendance record
         """
         try:
-            # Verify employee exists
+            # Verify employee exists; read from the database, not the
+            # per-worker cache, so a deletion on another worker is seen
             employee = User.objects(employee_id=employee_id).first()
             if not employee:
                 return error_response(f"Employee {employee_id} not found", status_code=404)
@@ -44,35 +200,9 @@ class AttendanceController:
                     status_code=400
                 )
             
-            # Check if attendance already marked for today
-            existing = Attendance.objects(
-                employee_id=employee,
-                attendance_date=today
-            ).first()
-            
-            if existing:
-                return error_response(
-                    f"Attendance already marked for {employee_id} today",
-                    status_code=409
-                )
-            
             # Parse check-in and check-out times
-            check_in_time = None
-            check_out_time = None
-            
-            if attendance_data.get('check_in_time'):
-                try:
-                    time_obj = datetime.strptime(attendance_data.get('check_in_time'), '%H:%M').time()
-                    check_in_time = datetime.combine(today, time_obj)
-                except ValueError:
-                    pass
-            
-            if attendance_data.get('check_out_time'):
-                try:
-                    time_obj = datetime.strptime(attendance_data.get('check_out_time'), '%H:%M').time()
-                    check_out_time = datetime.combine(today, time_obj)
-                except ValueError:
-                    pass
+            check_in_time = parse_clock_time(attendance_data.get('check_in_time'), today)
+            check_out_time = parse_clock_time(attendance_data.get('check_out_time'), today)
             
             # Create attendance record
             attendance = Attendance(
@@ -83,11 +213,23 @@ class AttendanceController:
                 check_out_time=check_out_time,
                 notes=attendance_data.get('notes')
             )
-            attendance.save()
+            # Single conditional write: the unique (employee_id, attendance_date)
+            # index rejects a second mark for the same day
+            try:
+                attendance.save(force_insert=True)
+            except NotUniqueError:
+                return error_response(
+                    f"Attendance already marked for {employee_id} today",
+                    status_code=409
+                )
+            AttendanceRollup.add_record(attendance, employee.department)
+            invalidate_responses('attendance', 'attendance_rollups')
+            record = attendance.to_dict()
+            get_event_bus().publish_local('created', record)
             
             return success_response(
                 "Attendance marked successfully for today",
-                data=attendance.to_dict(),
+                data=record,
                 status_code=201
             )
         except ValueError as ve:
@@ -96,75 +238,112 @@ class AttendanceController:
             return error_response(f"Error marking attendance: {str(e)}", status_code=500)
     
     @staticmethod
-    def get_employee_attendance(employee_id):
+    def get_employee_attendance(employee_id, date_from=None, date_to=None, is_present=None):
         """
-        Get all attendance records for an employee
+        Get an employee's attendance records, newest first
         
         Args:
             employee_id (str): Employee ID
+            date_from (str): First date to include, YYYY-MM-DD (optional)
+            date_to (str): Last date to include, YYYY-MM-DD (optional)
+            is_present (bool): Only present or only absent records (optional)
             
         Returns:
             dict: Response with attendance records
         """
         try:
-            employee = User.objects(employee_id=employee_id).first()
+            employee = User._get_collection().find_one({'employee_id': employee_id})
             if not employee:
                 return error_response(f"Employee {employee_id} not found", status_code=404)
             
-            attendance_records = Attendance.objects(
-                employee_id=employee
-            ).order_by('-attendance_date')
+            query = Attendance.range_query(date_from, date_to, is_present)
+            query['employee_id'] = employee['_id']
+            # One range of the (employee_id, -attendance_date) index, already in order
+            attendance_records = Attendance._get_collection().find(query).sort('attendance_date', -1)
             
-            records = [record.to_dict() for record in attendance_records]
+            records = _serialize_records(attendance_records, known={employee['_id']: employee})
             
             return success_response(
                 f"Retrieved {len(records)} attendance records",
                 data=records,
                 status_code=200
             )
+        except ValueError as ve:
+            return error_response(str(ve), status_code=400)
         except Exception as e:
             return error_response(f"Error fetching attendance: {str(e)}", status_code=500)
     
     @staticmethod
-    def get_all_attendance():
+    def get_all_attendance(limit=None, cursor=None, fields=None, date_from=None, date_to=None,
+                           department=None, is_present=None):
         """
-        Get all attendance records from system
+        Get one page of attendance records, newest attendance_date first
+        
+        Args:
+            limit (int): Page size (capped by MAX_PAGE_SIZE)
+            cursor (str): next_cursor from the previous page (same filters)
+            fields (str): Comma separated output fields to return
+            date_from (str): First date to include, YYYY-MM-DD (optional)
+            date_to (str): Last date to include, YYYY-MM-DD (optional)
+            department (str): Only employees of this department (optional)
+            is_present (bool): Only present or only absent records (optional)
         
         Returns:
-            dict: Response with all attendance records
+            dict: Response with attendance records and next_cursor
         """
         try:
-            attendance_records = Attendance.objects().order_by('-attendance_date')
-            records = [record.to_dict() for record in attendance_records]
+            projection = parse_fields(fields, Attendance.SERIALIZED_FIELDS)
+            query = Attendance.range_query(date_from, date_to, is_present)
+            employees = {}
+            if department:
+                employees = _department_employees(department)
+                query['employee_id'] = {'$in': list(employees)}
+            
+            # Raw documents straight from PyMongo: no Document per row
+            page, next_cursor = find_page(
+                Attendance._get_collection(), 'attendance_date',
+                query=query,
+                cursor=cursor,
+                limit=limit,
+                projection=Attendance.source_fields(projection) if projection else None
+            )
+            records = _serialize_records(page, known=employees, fields=projection)
             
             return success_response(
                 f"Retrieved {len(records)} attendance records",
                 data=records,
-                status_code=200
+                status_code=200,
+                next_cursor=next_cursor
             )
+        except ValueError as ve:
+            return error_response(str(ve), status_code=400)
         except Exception as e:
             return error_response(f"Error fetching attendance: {str(e)}", status_code=500)
     
     @staticmethod
-    def get_attendance_by_date(target_date_str):
+    def get_attendance_by_date(target_date_str, department=None, is_present=None):
         """
         Get attendance records for a specific date
         
         Args:
             target_date_str (str): Date in YYYY-MM-DD format
+            department (str): Only employees of this department (optional)
+            is_present (bool): Only present or only absent records (optional)
             
         Returns:
             dict: Response with attendance records for that date
         """
         try:
-            from datetime import datetime
-            target_date = datetime.strptime(target_date_str, '%Y-%m-%d').date()
+            query = {'attendance_date': _day_start(target_date_str)}
+            if is_present is not None:
+                query['is_present'] = is_present
+            employees = {}
+            if department:
+                employees = _department_employees(department)
+                query['employee_id'] = {'$in': list(employees)}
+            attendance_records = Attendance._get_collection().find(query).sort('employee_id', 1)
             
-            attendance_records = Attendance.objects(
-                attendance_date=target_date
-            ).order_by('employee_id')
-            
-            records = [record.to_dict() for record in attendance_records]
+            records = _serialize_records(attendance_records, known=employees)
             
             return success_response(
                 f"Retrieved {len(records)} attendance records for {target_date_str}",
@@ -175,3 +354,226 @@ class AttendanceController:
             return error_response("Invalid date format. Use YYYY-MM-DD", status_code=400)
         except Exception as e:
             return error_response(f"Error fetching attendance: {str(e)}", status_code=500)
+    
+    @staticmethod
+    def cleanup_orphaned_records():
+        """
+        Remove attendance records whose employee no longer exists
+        
+        Returns:
+            dict: Response with number of deleted records
+        """
+        try:
+            result = delete_orphaned_records()
+            
+            return success_response(
+                f"Cleaned up {result['deleted_records']} orphaned attendance records",
+                data=result,
+                status_code=200
+            )
+        except Exception as e:
+            return error_response(f"Error cleaning up records: {str(e)}", status_code=500)
+    
+    @staticmethod
+    def start_cleanup_job():
+        """
+        Start the orphan cleanup as a background job
+        
+        Returns:
+            dict: Response with the job (202), or the job already running (200)
+        """
+        try:
+            job, started = get_background_jobs().start(CLEANUP_JOB, lambda report: delete_orphaned_records(report=report))
+            
+            return success_response(
+                "Cleanup job started" if started else "Cleanup job already running",
+                data=job,
+                status_code=202 if started else 200
+            )
+        except Exception as e:
+            return error_response(f"Error starting cleanup job: {str(e)}", status_code=500)
+    
+    @staticmethod
+    def get_cleanup_job(job_id):
+        """
+        Get the status and progress of a cleanup job
+        
+        Args:
+            job_id (str): Id returned when the job was started
+            
+        Returns:
+            dict: Response with the job
+        """
+        job = get_background_jobs().get(job_id)
+        if not job or job['name'] != CLEANUP_JOB:
+            return error_response(f"Cleanup job {job_id} not found", status_code=404)
+        return success_response("Cleanup job retrieved successfully", data=job, status_code=200)
+    
+    @staticmethod
+    def export_attendance(export_format='ndjson', date_from=None, date_to=None, department=None):
+        """
+        Prepare a streaming export of attendance history
+        
+        Args:
+            export_format (str): 'ndjson' or 'csv'
+            date_from (str): First date to include, YYYY-MM-DD (optional)
+            date_to (str): Last date to include, YYYY-MM-DD (optional)
+            department (str): Only include employees of this department (optional)
+            
+        Returns:
+            dict: Response whose data is an iterator of text chunks
+        """
+        try:
+            if export_format not in EXPORT_FORMATS:
+                return error_response(
+                    f"Unsupported export format: {export_format}. Use one of: {', '.join(EXPORT_FORMATS)}",
+                    status_code=400
+                )
+            
+            query = Attendance.range_query(date_from, date_to)
+            employees = {}
+            if department:
+                employees = _department_employees(department)
+                query['employee_id'] = {'$in': list(employees)}
+            
+            chunks = _export_chunks(query, employees, export_format, get_settings().EXPORT_BATCH_SIZE)
+            
+            return success_response(
+                "Attendance export started",
+                data=chunks,
+                status_code=200
+            )
+        except ValueError as ve:
+            return error_response(str(ve), status_code=400)
+        except Exception as e:
+            return error_response(f"Error exporting attendance: {str(e)}", status_code=500)
+    
+    @staticmethod
+    def bulk_mark_attendance(marks):
+        """
+        Mark today's attendance for many employees in a few round-trips
+        
+        Employees are resolved with one $in query and new records are written
+        with a single unordered insert_many; employees already marked today
+        are reported from the unique index's duplicate-key errors.
+        
+        Args:
+            marks (list): Dicts with employee_id plus the mark_attendance fields
+            
+        Returns:
+            dict: Response with per-item results in submission order
+        """
+        try:
+            max_items = get_settings().BULK_MAX_ITEMS
+            if len(marks) > max_items:
+                return error_response(f"At most {max_items} records per request", status_code=400)
+            
+            today = date.today()
+            today_start = datetime(today.year, today.month, today.day)
+            results = [None] * len(marks)
+            
+            # Validate dates before touching the database
+            pending = []
+            for index, mark in enumerate(marks):
+                employee_id = mark.get('employee_id')
+                try:
+                    provided = datetime.strptime(mark.get('attendance_date') or today.isoformat(), '%Y-%m-%d').date()
+                except ValueError:
+                    results[index] = _bulk_result(index, employee_id, 400, "Invalid date format. Use YYYY-MM-DD")
+                    continue
+                if provided != today:
+                    results[index] = _bulk_result(
+                        index, employee_id, 400,
+                        f"Attendance can only be marked for today ({today.isoformat()})"
+                    )
+                    continue
+                pending.append(index)
+            
+            # One query resolves every referenced employee
+            employee_ids = {marks[index].get('employee_id') for index in pending}
+            employees = {
+                user['employee_id']: user
+                for user in User._get_collection().find(
+                    {'employee_id': {'$in': list(employee_ids)}},
+                    {'employee_id': 1, 'full_name': 1, 'department': 1}
+                )
+            }
+            
+            # Records already in the database are rejected by the unique index;
+            # this only catches the same employee twice in one request
+            marked_in_request = set()
+            
+            now = datetime.utcnow()
+            documents = []
+            document_indexes = []
+            for index in pending:
+                mark = marks[index]
+                employee_id = mark.get('employee_id')
+                employee = employees.get(employee_id)
+                if employee is None:
+                    results[index] = _bulk_result(index, employee_id, 404, f"Employee {employee_id} not found")
+                    continue
+                if employee['_id'] in marked_in_request:
+                    results[index] = _bulk_result(index, employee_id, 409, f"Attendance already marked for {employee_id} today")
+                    continue
+                marked_in_request.add(employee['_id'])
+                
+                document = {
+                    'employee_id': employee['_id'],
+                    'attendance_date': today_start,
+                    'is_present': mark.get('is_present', True),
+                    'check_in_time': parse_clock_time(mark.get('check_in_time'), today),
+                    'check_out_time': parse_clock_time(mark.get('check_out_time'), today),
+                    'notes': mark.get('notes'),
+                    'created_at': now,
+                    'updated_at': now
+                }
+                # MongoEngine does not store unset optional fields
+                documents.append({key: value for key, value in document.items() if value is not None})
+                document_indexes.append(index)
+            
+            failed_writes = {}
+            if documents:
+                try:
+                    Attendance._get_collection().insert_many(documents, ordered=False)
+                except BulkWriteError as bwe:
+                    failed_writes = {error['index']: error for error in bwe.details.get('writeErrors', [])}
+            
+            increments = {}
+            bus = get_event_bus()
+            for position, (index, document) in enumerate(zip(document_indexes, documents)):
+                employee_id = marks[index].get('employee_id')
+                error = failed_writes.get(position)
+                if error is not None:
+                    if error.get('code') == 11000:
+                        results[index] = _bulk_result(index, employee_id, 409, f"Attendance already marked for {employee_id} today")
+                    else:
+                        results[index] = _bulk_result(index, employee_id, 500, error.get('errmsg', 'Write failed'))
+                    continue
+                
+                results[index] = _bulk_result(index, employee_id, 201, "Attendance marked", str(document['_id']))
+                bus.publish_local('created', serialize_attendance(document, employees[employee_id]))
+                counts = AttendanceRollup.record_counts(
+                    document['is_present'], document.get('check_in_time'), document.get('check_out_time')
+                )
+                key = (today_start, employees[employee_id]['department'])
+                increments[key] = {
+                    field: increments.get(key, {}).get(field, 0) + value
+                    for field, value in counts.items()
+                }
+            AttendanceRollup.apply(increments)
+            
+            created = sum(1 for result in results if result['success'])
+            if created:
+                invalidate_responses('attendance', 'attendance_rollups')
+            return success_response(
+                f"Marked attendance for {created} of {len(marks)} employees",
+                data={
+                    'created': created,
+                    'failed': len(marks) - created,
+                    'results': results
+                },
+                status_code=200
+            )
+        except Exception as e:
+            return error_response(f"Error marking attendance: {str(e)}", status_code=500)
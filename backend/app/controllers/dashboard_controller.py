@@ -0,0 +1,124 @@
+"""
+Dashboard Controller - Business logic for the dashboard overview
+Computes headcount and attendance statistics with MongoDB aggregations
+"""
+from datetime import date, datetime, timedelta
+from app.models import User, Attendance
+from app.utils import error_response, success_response
+
+# Months of history shown in the dashboard attendance chart
+CHART_MONTHS = 6
+
+
+def _midnight(day):
+    """DateField values are stored as midnight datetimes"""
+    return datetime(day.year, day.month, day.day)
+
+
+def _months_back(day, months):
+    """First day of the month `months` months before day's month"""
+    month_index = day.year * 12 + day.month - 1 - months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _attendance_rate(bucket):
+    """Present percentage of a {present, total} facet result"""
+    if not bucket or not bucket[0]['total']:
+        return 0.0
+    return round(bucket[0]['present'] / bucket[0]['total'] * 100, 1)
+
+
+class DashboardController:
+    """Controller for dashboard statistics"""
+    
+    @staticmethod
+    def get_summary():
+        """
+        Get headcount and attendance statistics for the dashboard
+        
+        Returns:
+            dict: Response with employee and attendance summary
+        """
+        try:
+            today = date.today()
+            
+            employee_stats = next(User.objects.aggregate([
+                {'$facet': {
+                    'total': [{'$count': 'count'}],
+                    'by_department': [{'$group': {'_id': '$department', 'count': {'$sum': 1}}}],
+                    'by_status': [{'$group': {'_id': '$status', 'count': {'$sum': 1}}}]
+                }}
+            ]))
+            
+            present_sum = {'$sum': {'$cond': ['$is_present', 1, 0]}}
+            since_30_days = _midnight(today - timedelta(days=29))
+            since_7_days = _midnight(today - timedelta(days=6))
+            chart_start = _midnight(_months_back(today, CHART_MONTHS - 1))
+            
+            attendance_stats = next(Attendance.objects.aggregate([
+                {'$match': {'attendance_date': {'$gte': min(since_30_days, chart_start)}}},
+                {'$facet': {
+                    'today': [
+                        {'$match': {'attendance_date': _midnight(today)}},
+                        {'$group': {'_id': None, 'present': present_sum, 'total': {'$sum': 1}}}
+                    ],
+                    'last_7_days': [
+                        {'$match': {'attendance_date': {'$gte': since_7_days}}},
+                        {'$group': {'_id': None, 'present': present_sum, 'total': {'$sum': 1}}}
+                    ],
+                    'last_30_days': [
+                        {'$match': {'attendance_date': {'$gte': since_30_days}}},
+                        {'$group': {'_id': None, 'present': present_sum, 'total': {'$sum': 1}}}
+                    ],
+                    'monthly': [
+                        {'$match': {'attendance_date': {'$gte': chart_start}}},
+                        {'$group': {
+                            '_id': {'year': {'$year': '$attendance_date'}, 'month': {'$month': '$attendance_date'}},
+                            'present': present_sum,
+                            'total': {'$sum': 1}
+                        }}
+                    ]
+                }}
+            ]))
+            
+            today_bucket = attendance_stats['today'][0] if attendance_stats['today'] else {'present': 0, 'total': 0}
+            monthly_counts = {
+                (bucket['_id']['year'], bucket['_id']['month']): bucket
+                for bucket in attendance_stats['monthly']
+            }
+            monthly = []
+            for months_ago in range(CHART_MONTHS - 1, -1, -1):
+                month_start = _months_back(today, months_ago)
+                bucket = monthly_counts.get((month_start.year, month_start.month), {'present': 0, 'total': 0})
+                monthly.append({
+                    'month': month_start.strftime('%Y-%m'),
+                    'present': bucket['present'],
+                    'absent': bucket['total'] - bucket['present']
+                })
+            
+            summary = {
+                'employees': {
+                    'total': employee_stats['total'][0]['count'] if employee_stats['total'] else 0,
+                    'by_department': {row['_id']: row['count'] for row in employee_stats['by_department']},
+                    'by_status': {row['_id']: row['count'] for row in employee_stats['by_status']}
+                },
+                'attendance': {
+                    'total_records': Attendance._get_collection().estimated_document_count(),
+                    'today': {
+                        'date': today.isoformat(),
+                        'present': today_bucket['present'],
+                        'absent': today_bucket['total'] - today_bucket['present']
+                    },
+                    'rate_7_days': _attendance_rate(attendance_stats['last_7_days']),
+                    'rate_30_days': _attendance_rate(attendance_stats['last_30_days']),
+                    'monthly': monthly
+                }
+            }
+            
+            return success_response(
+                "Dashboard summary retrieved successfully",
+                data=summary,
+                status_code=200
+            )
+        except Exception as e:
+            return error_response(f"Error building dashboard summary: {str(e)}", status_code=500)
@@ -0,0 +1,81 @@
+"""
+Controller Dispatch - Route controller calls to the configured data backend
+"""
+from config import get_settings
+from app.utils import run_sync
+from app.utils.response_cache import get_response_cache
+from .employee_controller import EmployeeController
+from .attendance_controller import AttendanceController
+from .async_employee_controller import AsyncEmployeeController
+from .async_attendance_controller import AsyncAttendanceController
+
+# Native async counterparts, looked up by sync controller class name
+_ASYNC_CONTROLLERS = {
+    EmployeeController.__name__: AsyncEmployeeController,
+    AttendanceController.__name__: AsyncAttendanceController,
+}
+
+
+async def call_controller(method, *args, **kwargs):
+    """
+    Call a controller method on the configured data backend
+    
+    With DATA_BACKEND=motor, the method of the same name on the matching
+    Async* controller is awaited directly on the event loop. Otherwise (or
+    if no async counterpart exists) the sync method runs on the bounded
+    I/O executor.
+    
+    Args:
+        method: Sync controller staticmethod, e.g. EmployeeController.add_employee
+        
+    Returns:
+        dict: The controller's response
+    """
+    if get_settings().use_async_backend():
+        owner, name = method.__qualname__.split('.')[-2:]
+        async_method = getattr(_ASYNC_CONTROLLERS.get(owner), name, None)
+        if async_method is not None:
+            return await async_method(*args, **kwargs)
+    return await run_sync(method, *args, **kwargs)
+
+
+async def call_cached(collections, method, *args, collection_state=None, **kwargs):
+    """
+    call_controller() through the shared response cache
+    
+    Successful responses are cached under the method, its arguments and the
+    current versions of the collections they were read from; writes to any
+    of those collections invalidate them.
+    
+    Endpoints that send an ETag pass the collection state it was built
+    from, which joins the key too. The versions are bumped only after a
+    write, so without it a request could see the write in its ETag yet
+    still get the body cached before it, and clients would keep that body
+    (304) until the next write.
+    
+    Args:
+        collections (tuple): Collection names the response is read from
+        method: Sync controller staticmethod
+        collection_state (str): request.state.collection_state set by
+            conditional_get() (optional)
+        
+    Returns:
+        dict: The controller's (possibly cached) response
+    """
+    cache = get_response_cache()
+    if cache is None:
+        return await call_controller(method, *args, **kwargs)
+    
+    async def backend_call(func, *call_args):
+        if cache.backend.blocking:
+            return await run_sync(func, *call_args)
+        return func(*call_args)
+    
+    key = await backend_call(cache.key, method.__qualname__, collections, [args, kwargs, collection_state])
+    cached = await backend_call(cache.get, key)
+    if cached is not None:
+        return cached
+    result = await call_controller(method, *args, **kwargs)
+    if result['success']:
+        await backend_call(cache.set, key, result)
+    return result
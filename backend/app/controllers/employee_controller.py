@@ -2,10 +2,120 @@
 Employee Controller - Business logic for employee management
 Handles employee CRUD operations
 """
-from mongoengine import NotUniqueError, DoesNotExist
+import csv
+import io
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from mongoengine import NotUniqueError, DoesNotExist, ValidationError
 from datetime import datetime
-from app.models import User
-from app.utils import validate_add_employee_data, error_response, success_response
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError
+from config import get_settings
+from app.models import User, Attendance, AttendanceRollup
+from app.utils import (
+    validate_add_employee_data, error_response, success_response, serialize_user, supports_transactions
+)
+from app.utils.employee_cache import get_employee_cache
+from app.utils.response_cache import invalidate_responses
+from app.utils.attendance_events import get_event_bus
+from app.utils.pagination import find_page, parse_fields
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+# Columns read from each import row; NDJSON values must be JSON strings
+IMPORT_FIELDS = ('employee_id', 'full_name', 'email', 'department', 'role')
+
+
+def _delete_employee_cascade(employee_pk, department):
+    """
+    Delete an employee, their attendance records and their rollup counts
+    
+    Runs as one transaction on replica sets. Elsewhere the steps run in
+    order: the per-day totals are read first and subtracted from the
+    rollups only once the employee is gone. A retry after a partial failure
+    therefore never subtracts them twice; at worst the rollups keep counts
+    that `python -m app.commands.rebuild_rollups` repairs.
+    """
+    users = User._get_collection()
+    attendance = Attendance._get_collection()
+    
+    def cascade(session=None):
+        totals = AttendanceRollup.employee_totals(employee_pk, session)
+        attendance.delete_many({'employee_id': employee_pk}, session=session)
+        users.delete_one({'_id': employee_pk}, session=session)
+        AttendanceRollup.apply(AttendanceRollup.move_increments(totals, from_department=department), session)
+    
+    client = users.database.client
+    if supports_transactions(client):
+        with client.start_session() as session:
+            session.with_transaction(cascade)
+    else:
+        cascade()
+
+
+def _import_rows(upload, import_format):
+    """
+    Lazily parse an uploaded file into (row_number, row dict or None, error)
+    
+    Row numbers count data rows from 1, so they match the file for NDJSON
+    and the line after the header for CSV.
+    """
+    text = io.TextIOWrapper(upload, encoding='utf-8-sig', newline='')
+    if import_format == 'csv':
+        for row_number, row in enumerate(csv.DictReader(text), start=1):
+            yield row_number, {key.strip(): (value or '').strip() for key, value in row.items() if key}, None
+        return
+    
+    row_number = 0
+    for line in text:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield row_number, None, f"Invalid JSON: {str(e)}"
+            continue
+        if not isinstance(row, dict):
+            yield row_number, None, "Each line must be a JSON object"
+            continue
+        yield row_number, row, None
+
+
+def _import_document(row):
+    """
+    Validate one import row as add_employee and the User model would
+    
+    Rows are inserted with a raw bulk_write, which skips MongoEngine's
+    validation, so the model is validated here instead.
+    
+    Returns:
+        tuple: (users document or None, error message or None)
+    """
+    wrong_types = [
+        field for field in IMPORT_FIELDS
+        if row.get(field) is not None and not isinstance(row[field], str)
+    ]
+    if wrong_types:
+        return None, f"Fields must be strings: {', '.join(wrong_types)}"
+    
+    is_valid, error_msg = validate_add_employee_data(row)
+    if not is_valid:
+        return None, error_msg
+    
+    user = User(
+        employee_id=row['employee_id'],
+        full_name=row['full_name'],
+        email=row['email'],
+        department=row['department'],
+        role=row.get('role') or 'Employee'
+    )
+    try:
+        user.validate()
+    except ValidationError as e:
+        return None, "; ".join(f"Invalid {field}: {message}" for field, message in e.to_dict().items())
+    return user.to_mongo().to_dict(), None
 
 
 class EmployeeController:
@@ -43,6 +153,7 @@ class EmployeeController:
                 status='Active'
             )
             employee.save()
+            invalidate_responses('users')
             
             return success_response(
                 "Employee added successfully",
@@ -55,22 +166,48 @@ class EmployeeController:
             return error_response(f"Error adding employee: {str(e)}", status_code=500)
     
     @staticmethod
-    def get_all_employees():
+    def get_all_employees(limit=None, cursor=None, fields=None, department=None, status=None,
+                          role=None, name=None, search=None, sort='-created_at'):
         """
-        Get all employees
+        Get one page of employees matching the filters, newest first by default
+        
+        Args:
+            limit (int): Page size (capped by MAX_PAGE_SIZE)
+            cursor (str): next_cursor from the previous page (same filters and sort)
+            fields (str): Comma separated output fields to return
+            department (str): Exact department filter
+            status (str): Exact status filter
+            role (str): Exact role filter
+            name (str): Case-insensitive full name prefix
+            search (str): Words to match in full names
+            sort (str): created_at, full_name or employee_id, '-' prefix for descending
         
         Returns:
-            dict: Response with list of all employees
+            dict: Response with list of employees and next_cursor
         """
         try:
-            employees = User.objects().order_by('-created_at')
-            employee_list = [emp.to_dict() for emp in employees]
+            projection = parse_fields(fields, User.SERIALIZED_FIELDS)
+            query, sort_field, direction = User.list_query(department, status, role, name, search, sort)
+            
+            # Raw documents straight from PyMongo: no Document per row
+            page, next_cursor = find_page(
+                User._get_collection(), sort_field,
+                query=query,
+                cursor=cursor,
+                limit=limit,
+                projection=User.source_fields(projection) if projection else None,
+                direction=direction
+            )
+            employee_list = [serialize_user(doc, projection) for doc in page]
             
             return success_response(
                 f"Retrieved {len(employee_list)} employees",
                 data=employee_list,
-                status_code=200
+                status_code=200,
+                next_cursor=next_cursor
             )
+        except ValueError as ve:
+            return error_response(str(ve), status_code=400)
         except Exception as e:
             return error_response(f"Error fetching employees: {str(e)}", status_code=500)
     
@@ -123,6 +260,7 @@ class EmployeeController:
                     del update_data[field]
             
             # Update allowed fields
+            previous_department = employee.department
             allowed_fields = ['full_name', 'department', 'role', 'status']
             for field in allowed_fields:
                 if field in update_data and update_data[field]:
@@ -130,6 +268,14 @@ class EmployeeController:
             
             employee.updated_at = datetime.utcnow()
             employee.save()
+            get_employee_cache().invalidate(employee_id)
+            
+            # Department rollups count employees under their current department
+            if employee.department != previous_department:
+                AttendanceRollup.move_employee(employee.pk, previous_department, employee.department)
+                invalidate_responses('users', 'attendance_rollups')
+            else:
+                invalidate_responses('users')
             
             return success_response(
                 "Employee updated successfully",
@@ -151,17 +297,15 @@ class EmployeeController:
             dict: Response with deletion status
         """
         try:
-            from app.models import Attendance
-            
-            employee = User.objects(employee_id=employee_id).first()
+            employee = User._get_collection().find_one({'employee_id': employee_id}, {'department': 1})
             if not employee:
                 return error_response(f"Employee {employee_id} not found", status_code=404)
             
-            # Delete all attendance records for this employee (cascade delete)
-            Attendance.objects(employee_id=employee).delete()
-            
-            # Now delete the employee
-            employee.delete()
+            # Rollup counts, attendance records, then the employee
+            _delete_employee_cascade(employee['_id'], employee['department'])
+            get_employee_cache().invalidate(employee_id)
+            invalidate_responses('users', 'attendance', 'attendance_rollups')
+            get_event_bus().publish_local('reset', None)
             
             return success_response(
                 f"Employee {employee_id} deleted successfully",
@@ -169,3 +313,130 @@ class EmployeeController:
             )
         except Exception as e:
             return error_response(f"Error deleting employee: {str(e)}", status_code=500)
+    
+    @staticmethod
+    def import_employees(upload, import_format='csv'):
+        """
+        Import employees from a CSV or NDJSON file
+        
+        The file is read in batches of IMPORT_BATCH_SIZE rows. Each batch is
+        validated on a thread pool, checked against existing employee_ids and
+        emails with one $in query, and inserted with one unordered bulk_write.
+        
+        Args:
+            upload: Binary file object with the uploaded data
+            import_format (str): 'csv' or 'ndjson'
+            
+        Returns:
+            dict: Response with created/failed counts and per-row errors
+        """
+        try:
+            if import_format not in IMPORT_FORMATS:
+                return error_response(
+                    f"Unsupported import format: {import_format}. Use one of: {', '.join(IMPORT_FORMATS)}",
+                    status_code=400
+                )
+            
+            settings = get_settings()
+            started = time.perf_counter()
+            rows = _import_rows(upload, import_format)
+            seen_ids = set()
+            seen_emails = set()
+            errors = []
+            total = 0
+            created = 0
+            
+            with ThreadPoolExecutor(max_workers=settings.IMPORT_VALIDATION_WORKERS) as validators:
+                while True:
+                    batch = list(islice(rows, settings.IMPORT_BATCH_SIZE))
+                    if not batch:
+                        break
+                    total += len(batch)
+                    
+                    parsed = []
+                    for row_number, row, parse_error in batch:
+                        if parse_error:
+                            errors.append({'row': row_number, 'employee_id': None, 'message': parse_error})
+                        else:
+                            parsed.append((row_number, row))
+                    
+                    # Email validation may hit DNS, so rows are checked in parallel
+                    verdicts = validators.map(lambda item: _import_document(item[1]), parsed)
+                    candidates = []
+                    for (row_number, row), (document, error_msg) in zip(parsed, verdicts):
+                        if document is None:
+                            employee_id = row.get('employee_id')
+                            errors.append({
+                                'row': row_number,
+                                'employee_id': employee_id if isinstance(employee_id, str) else None,
+                                'message': error_msg
+                            })
+                        elif row['employee_id'] in seen_ids:
+                            errors.append({'row': row_number, 'employee_id': row['employee_id'], 'message': "Duplicate employee_id in file"})
+                        elif row['email'] in seen_emails:
+                            errors.append({'row': row_number, 'employee_id': row['employee_id'], 'message': "Duplicate email in file"})
+                        else:
+                            seen_ids.add(row['employee_id'])
+                            seen_emails.add(row['email'])
+                            candidates.append((row_number, row, document))
+                    if not candidates:
+                        continue
+                    
+                    # One query finds every employee_id/email that already exists
+                    existing_ids = set()
+                    existing_emails = set()
+                    for user in User._get_collection().find(
+                        {'$or': [
+                            {'employee_id': {'$in': [row['employee_id'] for _, row, _ in candidates]}},
+                            {'email': {'$in': [row['email'] for _, row, _ in candidates]}}
+                        ]},
+                        {'employee_id': 1, 'email': 1}
+                    ):
+                        existing_ids.add(user['employee_id'])
+                        existing_emails.add(user['email'])
+                    
+                    now = datetime.utcnow()
+                    inserts = []
+                    for row_number, row, document in candidates:
+                        if row['employee_id'] in existing_ids:
+                            errors.append({'row': row_number, 'employee_id': row['employee_id'], 'message': f"Employee with ID {row['employee_id']} already exists"})
+                        elif row['email'] in existing_emails:
+                            errors.append({'row': row_number, 'employee_id': row['employee_id'], 'message': "Email already exists"})
+                        else:
+                            inserts.append((row_number, row, dict(document, created_at=now, updated_at=now)))
+                    if not inserts:
+                        continue
+                    
+                    try:
+                        result = User._get_collection().bulk_write(
+                            [InsertOne(document) for _, _, document in inserts],
+                            ordered=False
+                        )
+                        created += result.inserted_count
+                    except BulkWriteError as bwe:
+                        write_errors = bwe.details.get('writeErrors', [])
+                        created += bwe.details.get('nInserted', 0)
+                        for error in write_errors:
+                            row_number, row, _ = inserts[error['index']]
+                            message = "Employee ID or email already exists" if error.get('code') == 11000 else error.get('errmsg', 'Write failed')
+                            errors.append({'row': row_number, 'employee_id': row.get('employee_id'), 'message': message})
+            
+            if created:
+                invalidate_responses('users')
+            elapsed = time.perf_counter() - started
+            errors.sort(key=lambda error: error['row'])
+            return success_response(
+                f"Imported {created} of {total} employees",
+                data={
+                    'total': total,
+                    'created': created,
+                    'failed': total - created,
+                    'rows_per_second': round(total / elapsed, 1) if elapsed else None,
+                    'errors': errors
+                },
+                status_code=200
+            )
+        except (UnicodeDecodeError, csv.Error) as e:
+            return error_response(f"Could not read import file: {str(e)}", status_code=400)
+        except Exception as e:
+            return error_response(f"Error importing employees: {str(e)}", status_code=500)
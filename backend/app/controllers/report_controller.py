@@ -0,0 +1,279 @@
+"""
+Report Controller - Business logic for attendance reports
+Reads the materialized daily rollups instead of raw attendance records
+"""
+from datetime import datetime, date, timedelta
+from config import get_settings
+from app.models import User, Attendance, AttendanceRollup
+from app.utils import error_response, success_response
+
+
+def _parse_day(date_str):
+    """Parse YYYY-MM-DD into the midnight datetime MongoDB stores for DateFields"""
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+
+def _totals(rows):
+    """Sum rollup rows into one totals dict with an attendance rate"""
+    totals = {'present': 0, 'absent': 0, 'total': 0, 'worked_minutes': 0}
+    for row in rows:
+        for key in totals:
+            totals[key] += row[key]
+    totals['attendance_rate'] = round(totals['present'] / totals['total'] * 100, 1) if totals['total'] else 0.0
+    return totals
+
+
+def _date_window(date_from, date_to):
+    """Inclusive report window as midnight datetimes, defaulting to the last 30 days"""
+    today = date.today()
+    start = _parse_day(date_from) if date_from else datetime.combine(today - timedelta(days=29), datetime.min.time())
+    end = _parse_day(date_to) if date_to else datetime.combine(today, datetime.min.time())
+    return start, end
+
+
+def _hours_pipeline(match, late_after, standard_minutes):
+    """
+    Aggregation reducing attendance records to one summary per employee
+    
+    Args:
+        match (dict): $match filter on attendance
+        late_after (int): Minutes after midnight; later check-ins are late
+        standard_minutes (int): Working day length; time beyond it is overtime
+    """
+    worked = {'$max': [0, {'$floor': {'$divide': [
+        {'$subtract': ['$check_out_time', '$check_in_time']}, 60000
+    ]}}]}
+    return [
+        {'$match': match},
+        {'$project': {
+            '_id': 0,
+            'employee_id': 1,
+            'is_present': 1,
+            # Missing or null times are falsy, so these stay null without them
+            'check_in': {'$cond': [
+                '$check_in_time',
+                {'$add': [{'$multiply': [{'$hour': '$check_in_time'}, 60]}, {'$minute': '$check_in_time'}]},
+                None
+            ]},
+            'worked': {'$cond': [
+                {'$and': ['$check_in_time', '$check_out_time']}, worked, None
+            ]}
+        }},
+        # $sum skips nulls, so records without times add nothing
+        {'$group': {
+            '_id': '$employee_id',
+            'records': {'$sum': 1},
+            'present_days': {'$sum': {'$cond': ['$is_present', 1, 0]}},
+            'worked_minutes': {'$sum': '$worked'},
+            'check_in_minutes': {'$sum': '$check_in'},
+            'check_ins': {'$sum': {'$cond': [{'$eq': ['$check_in', None]}, 0, 1]}},
+            'late_arrivals': {'$sum': {'$cond': [{'$gt': ['$check_in', late_after]}, 1, 0]}},
+            'overtime_minutes': {'$sum': {'$max': [0, {'$subtract': ['$worked', standard_minutes]}]}}
+        }}
+    ]
+
+
+def _hours_totals(rows):
+    """Combine per-employee sums into report figures"""
+    sums = {key: 0 for key in (
+        'records', 'present_days', 'worked_minutes', 'check_in_minutes',
+        'check_ins', 'late_arrivals', 'overtime_minutes'
+    )}
+    for row in rows:
+        for key in sums:
+            sums[key] += row[key]
+    average_check_in = None
+    if sums['check_ins']:
+        minutes = round(sums['check_in_minutes'] / sums['check_ins'])
+        average_check_in = f"{minutes // 60:02d}:{minutes % 60:02d}"
+    return {
+        'records': sums['records'],
+        'present_days': sums['present_days'],
+        'worked_hours': round(sums['worked_minutes'] / 60, 2),
+        'average_check_in': average_check_in,
+        'late_arrivals': sums['late_arrivals'],
+        'overtime_hours': round(sums['overtime_minutes'] / 60, 2)
+    }
+
+
+class ReportController:
+    """Controller for attendance reports"""
+    
+    @staticmethod
+    def get_monthly_report(month, department=None):
+        """
+        Get daily and per-department attendance totals for a month
+        
+        Args:
+            month (str): Month in YYYY-MM format
+            department (str): Restrict to one department (optional)
+            
+        Returns:
+            dict: Response with daily totals, department totals and overall totals
+        """
+        try:
+            month_start = datetime.strptime(month, '%Y-%m')
+            next_month = (month_start + timedelta(days=32)).replace(day=1)
+            
+            query = {'date': {'$gte': month_start, '$lt': next_month}}
+            if department:
+                query['department'] = department
+            rollups = list(AttendanceRollup._get_collection().find(query, {'_id': 0, 'updated_at': 0}))
+            
+            by_day = {}
+            by_department = {}
+            for row in rollups:
+                by_day.setdefault(row['date'].date().isoformat(), []).append(row)
+                by_department.setdefault(row['department'], []).append(row)
+            
+            report = {
+                'month': month,
+                'department': department,
+                'days': [dict(_totals(rows), date=day) for day, rows in sorted(by_day.items())],
+                'departments': {name: _totals(rows) for name, rows in sorted(by_department.items())},
+                'totals': _totals(rollups)
+            }
+            
+            return success_response(
+                f"Monthly attendance report for {month}",
+                data=report,
+                status_code=200
+            )
+        except ValueError:
+            return error_response("Invalid month format. Use YYYY-MM", status_code=400)
+        except Exception as e:
+            return error_response(f"Error building monthly report: {str(e)}", status_code=500)
+    
+    @staticmethod
+    def get_department_report(date_from=None, date_to=None):
+        """
+        Get attendance totals per department for a date range
+        
+        Args:
+            date_from (str): First date, YYYY-MM-DD (defaults to 30 days ago)
+            date_to (str): Last date, YYYY-MM-DD (defaults to today)
+            
+        Returns:
+            dict: Response with per-department totals
+        """
+        try:
+            start, end = _date_window(date_from, date_to)
+            
+            rows = AttendanceRollup._get_collection().aggregate([
+                {'$match': {'date': {'$gte': start, '$lte': end}}},
+                {'$group': {
+                    '_id': '$department',
+                    'present': {'$sum': '$present'},
+                    'absent': {'$sum': '$absent'},
+                    'total': {'$sum': '$total'},
+                    'worked_minutes': {'$sum': '$worked_minutes'}
+                }},
+                {'$sort': {'_id': 1}}
+            ])
+            departments = {row.pop('_id'): _totals([row]) for row in rows}
+            
+            report = {
+                'from': start.date().isoformat(),
+                'to': end.date().isoformat(),
+                'departments': departments,
+                'totals': _totals(departments.values())
+            }
+            
+            return success_response(
+                "Department attendance report retrieved successfully",
+                data=report,
+                status_code=200
+            )
+        except ValueError:
+            return error_response("Invalid date format. Use YYYY-MM-DD", status_code=400)
+        except Exception as e:
+            return error_response(f"Error building department report: {str(e)}", status_code=500)
+    
+    @staticmethod
+    def get_hours_report(date_from=None, date_to=None, department=None):
+        """
+        Get worked hours, average check-in, late arrivals and overtime per
+        employee and per department for a date range
+        
+        The database reduces the records to one row per employee; Python only
+        combines those rows. Records of deleted employees are left out.
+        
+        Args:
+            date_from (str): First date, YYYY-MM-DD (defaults to 30 days ago)
+            date_to (str): Last date, YYYY-MM-DD (defaults to today)
+            department (str): Restrict to one department (optional)
+            
+        Returns:
+            dict: Response with per-employee, per-department and overall figures
+        """
+        try:
+            settings = get_settings()
+            start, end = _date_window(date_from, date_to)
+            work_start = datetime.strptime(settings.WORK_START_TIME, '%H:%M')
+            late_after = work_start.hour * 60 + work_start.minute + settings.LATE_GRACE_MINUTES
+            
+            users = User._get_collection()
+            match = {'attendance_date': {'$gte': start, '$lte': end}}
+            employees = None
+            if department:
+                employees = {
+                    user['_id']: user
+                    for user in users.find({'department': department}, {'employee_id': 1, 'full_name': 1, 'department': 1})
+                }
+                match['employee_id'] = {'$in': list(employees)}
+            
+            rows = list(Attendance._get_collection().aggregate(
+                _hours_pipeline(match, late_after, settings.STANDARD_WORK_MINUTES),
+                allowDiskUse=True
+            ))
+            if employees is None:
+                employees = {
+                    user['_id']: user
+                    for user in users.find(
+                        {'_id': {'$in': [row['_id'] for row in rows]}},
+                        {'employee_id': 1, 'full_name': 1, 'department': 1}
+                    )
+                }
+            
+            per_employee = []
+            by_department = {}
+            for row in rows:
+                employee = employees.get(row['_id'])
+                if employee is None:
+                    continue
+                per_employee.append(dict(
+                    _hours_totals([row]),
+                    employee_id=employee['employee_id'],
+                    employee_name=employee['full_name'],
+                    department=employee['department']
+                ))
+                by_department.setdefault(employee['department'], []).append(row)
+            per_employee.sort(key=lambda entry: entry['employee_id'])
+            
+            report = {
+                'from': start.date().isoformat(),
+                'to': end.date().isoformat(),
+                'department': department,
+                'work_start': settings.WORK_START_TIME,
+                'late_grace_minutes': settings.LATE_GRACE_MINUTES,
+                'standard_hours': round(settings.STANDARD_WORK_MINUTES / 60, 2),
+                'employees': per_employee,
+                'departments': {
+                    name: dict(_hours_totals(dept_rows), employees=len(dept_rows))
+                    for name, dept_rows in sorted(by_department.items())
+                },
+                'totals': dict(
+                    _hours_totals([row for dept_rows in by_department.values() for row in dept_rows]),
+                    employees=len(per_employee)
+                )
+            }
+            
+            return success_response(
+                "Worked hours report retrieved successfully",
+                data=report,
+                status_code=200
+            )
+        except ValueError:
+            return error_response("Invalid date format. Use YYYY-MM-DD", status_code=400)
+        except Exception as e:
+            return error_response(f"Error building hours report: {str(e)}", status_code=500)
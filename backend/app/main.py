@@ -2,11 +2,13 @@
 FastAPI Main Application
 Entry point for HRMS Lite backend server
 """
-from fastapi import FastAPI # pyright: ignore[reportMissingImports]
+from fastapi import FastAPI, Request, Response # pyright: ignore[reportMissingImports]
+from fastapi.responses import JSONResponse # pyright: ignore[reportMissingImports]
 from fastapi.middleware.cors import CORSMiddleware # pyright: ignore[reportMissingImports]
 import os
 import sys
 from dotenv import load_dotenv
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 
 # Load environment variables
 load_dotenv()
@@ -23,14 +25,23 @@ except ImportError:
     settings = None
 
 # Import database and routes
-from app.utils import connect_database, disconnect_database
-from app.routes import employee_router, attendance_router
+from app.utils import (
+    connect_database, disconnect_database, shutdown_executor,
+    connect_async_database, disconnect_async_database, error_response, ExecutorSaturatedError
+)
+from app.utils.employee_cache import get_employee_cache
+from app.utils.readiness import get_readiness
+from app.utils.responses import FastJSONResponse
+from app.utils.attendance_events import start_change_stream, stop_change_stream
+from app.middleware import QueueWaitMiddleware, MetricsMiddleware
+from app.routes import employee_router, attendance_router, dashboard_router, report_router
 
 # Create FastAPI application
 app = FastAPI(
     title="HRMS Lite API",
     description="Human Resource Management System - Backend API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
 # CORS Middleware Configuration - use settings if available, otherwise allow all
@@ -41,11 +52,32 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Queue-Wait-Ms"],
 )
 
+# Report executor queue-wait time on every response
+app.add_middleware(QueueWaitMiddleware)
+
+# Request count/latency/database time per route, scraped from /metrics
+if not settings or settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(employee_router)
 app.include_router(attendance_router)
+app.include_router(dashboard_router)
+app.include_router(report_router)
+
+
+# Executor saturation - shed load instead of queueing without bound
+@app.exception_handler(ExecutorSaturatedError)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+    """Answer 503 when the blocking I/O executor queue is full"""
+    return JSONResponse(
+        status_code=503,
+        content=error_response(str(exc), status_code=503),
+        headers={"Retry-After": "1"}
+    )
 
 
 # Startup Event
@@ -54,6 +86,16 @@ async def startup_event():
     """Initialize database connection on startup"""
     print(" Starting HRMS Lite Backend...")
     connect_database()
+    if settings and settings.use_async_backend():
+        connect_async_database()
+    # Uvicorn only accepts connections once startup returns, so the pool is
+    # open before the first request. Missing unique indexes (which back the
+    # duplicate checks) are built here; if MongoDB is down or one can't be
+    # built, /ready stays 503 and the warm-up is retried by the next ping
+    # that succeeds.
+    await get_readiness().warm_up()
+    if settings and settings.ATTENDANCE_CHANGE_STREAMS:
+        start_change_stream()
 
 
 # Shutdown Event
@@ -61,20 +103,44 @@ async def startup_event():
 async def shutdown_event():
     """Close database connection on shutdown"""
     print("Shutting down HRMS Lite Backend...")
+    stop_change_stream()
+    shutdown_executor()
+    disconnect_async_database()
     disconnect_database()
 
 
 # Health Check Endpoint
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
+    """Liveness: the process is serving (see /ready for the database)"""
     return {
         "status": "healthy",
         "service": "HRMS Lite API",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "employee_cache": get_employee_cache().stats()
     }
 
 
+# Readiness Endpoint
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: warmed up and MongoDB answering (ping result cached briefly)"""
+    database = await get_readiness().check()
+    return JSONResponse(
+        status_code=200 if database['ready'] else 503,
+        content={"status": "ready" if database['ready'] else "not ready", "database": database}
+    )
+
+
+# Prometheus Metrics Endpoint
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics for this worker process"""
+    if settings and not settings.METRICS_ENABLED:
+        return JSONResponse(status_code=404, content=error_response("Metrics are disabled", status_code=404))
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 # Root Endpoint
 @app.get("/")
 async def root():
@@ -82,7 +148,8 @@ async def root():
     return {
         "message": "HRMS Lite Backend API",
         "documentation": "/docs",
-        "health": "/health"
+        "health": "/health",
+        "ready": "/ready"
     }
 
 
@@ -1,3 +1,7 @@
 """
 Middleware Package - Application middleware
 """
+from .queue_wait import QueueWaitMiddleware
+from .metrics import MetricsMiddleware
+
+__all__ = ['QueueWaitMiddleware', 'MetricsMiddleware']
@@ -0,0 +1,46 @@
+"""
+Metrics Middleware
+Records request counts, latency and MongoDB time per route
+"""
+import time
+
+from app.utils.metrics import HTTP_REQUESTS, HTTP_LATENCY, HTTP_DB_TIME, start_db_time_tracking
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware observing every HTTP request into the Prometheus metrics
+
+    Requests are labelled with their route template (e.g.
+    /api/attendance/employee/{employee_id}), never the raw path, so label
+    cardinality stays bounded. Requests that match no route share the
+    "unmatched" label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        db_time = start_db_time_tracking()
+        status = [500]
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # FastAPI stores the matched route in the scope while routing
+            route = scope.get("route")
+            route = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_REQUESTS.labels(method, route, str(status[0])).inc()
+            HTTP_LATENCY.labels(method, route).observe(time.perf_counter() - started)
+            HTTP_DB_TIME.labels(method, route).observe(sum(db_time))
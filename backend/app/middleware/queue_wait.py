@@ -0,0 +1,36 @@
+"""
+Queue Wait Middleware
+Reports how long each request waited for a free executor thread
+"""
+from app.utils.executor import start_queue_wait_tracking
+
+
+class QueueWaitMiddleware:
+    """
+    ASGI middleware adding an X-Queue-Wait-Ms header to every HTTP response
+
+    The value is the total time the request's controller calls spent queued
+    on the blocking I/O executor before a worker thread picked them up.
+    """
+
+    header_name = b"x-queue-wait-ms"
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        samples = start_queue_wait_tracking()
+
+        async def send_with_queue_wait(message):
+            if message["type"] == "http.response.start":
+                waited_ms = f"{sum(samples) * 1000:.2f}".encode()
+                headers = list(message.get("headers", []))
+                headers.append((self.header_name, waited_ms))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_queue_wait)
@@ -3,5 +3,6 @@ Models Package - Database schemas for HRMS Lite
 """
 from .user_model import User
 from .attendance_model import Attendance
+from .attendance_rollup_model import AttendanceRollup
 
-__all__ = ['User', 'Attendance']
+__all__ = ['User', 'Attendance', 'AttendanceRollup']
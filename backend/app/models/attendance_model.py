@@ -4,8 +4,15 @@ Tracks daily attendance and time tracking for employees
 """
 from mongoengine import Document, StringField, DateField, BooleanField, ReferenceField, DateTimeField
 from datetime import datetime
+from bson import DBRef
+from app.utils.employee_cache import find_employees_by_pk
 from .user_model import User
 
+# Unique (employee, day) index; named so it never collides with the
+# non-unique employee_id_1_attendance_date_1 index of older deployments
+UNIQUE_DAY_INDEX = 'attendance_employee_day_unique'
+LEGACY_DAY_INDEX = 'employee_id_1_attendance_date_1'
+
 
 class Attendance(Document):
     """
@@ -33,36 +40,178 @@ class Attendance(Document):
     
     meta = {
         'collection': 'attendance',
+        # Indexes are managed by app.commands.manage_indexes
+        'auto_create_index': False,
         'indexes': [
-            'employee_id',
-            'attendance_date',
-            ('employee_id', 'attendance_date'),  # Compound index for unique daily records
-            'created_at'
+            # Keyset pages of the list endpoint, newest day first
+            ('-attendance_date', '-id'),
+            # One record per employee per day; enforced by the database. Ordered
+            # for an employee's history newest first, so a from/to window is one
+            # contiguous index range. Also serves lookups by employee alone
+            {'fields': ('employee_id', '-attendance_date'), 'unique': True, 'name': UNIQUE_DAY_INDEX},
+            # Covers the worked-hours report pipeline: it reads index keys only
+            ('attendance_date', 'employee_id', 'is_present', 'check_in_time', 'check_out_time'),
+            'created_at',
+            # Latest change lookup for conditional GETs (ETag/Last-Modified)
+            'updated_at'
         ]
     }
     
-    def to_dict(self):
-        """Convert document to dictionary for JSON serialization"""
+    # Keys produced by to_dict(), selectable through fields= projections
+    SERIALIZED_FIELDS = (
+        'id', 'employee_id', 'employee_name', 'attendance_date', 'is_present',
+        'check_in_time', 'check_out_time', 'notes', 'created_at', 'updated_at'
+    )
+    
+    def to_dict(self, employees=None, fields=None):
+        """
+        Convert document to dictionary for JSON serialization
+        
+        Args:
+            employees (dict): Optional map of User id -> User prefetched by
+                resolve_employees(); when given, no per-record lookup is made
+            fields (list): Optional subset of SERIALIZED_FIELDS to include
+        """
         try:
-            employee_id = self.employee_id.employee_id
-            employee_name = self.employee_id.full_name
+            if employees is not None:
+                employee = employees[self._employee_pk()]
+            else:
+                employee = self.employee_id
+            employee_id = employee.employee_id
+            employee_name = employee.full_name
         except:
             # Handle case where employee reference is broken (deleted)
             employee_id = "Unknown"
             employee_name = "Deleted Employee"
         
-        return {
+        data = {
             'id': str(self.id),
             'employee_id': employee_id,
             'employee_name': employee_name,
-            'attendance_date': self.attendance_date.isoformat(),
+            'attendance_date': self.attendance_date.isoformat() if self.attendance_date else None,
             'is_present': self.is_present,
             'check_in_time': self.check_in_time.isoformat() if self.check_in_time else None,
             'check_out_time': self.check_out_time.isoformat() if self.check_out_time else None,
             'notes': self.notes,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+        if fields:
+            return {field: data[field] for field in fields}
+        return data
+    
+    @classmethod
+    def source_fields(cls, fields):
+        """Document fields to load for a to_dict() projection"""
+        sources = {'employee_name': 'employee_id'}
+        return list(dict.fromkeys(sources.get(field, field) for field in fields if field != 'id'))
+    
+    @staticmethod
+    def range_query(date_from=None, date_to=None, is_present=None):
+        """
+        Raw filter for an inclusive attendance_date window and presence
+        
+        Args:
+            date_from (str): First date, YYYY-MM-DD (optional)
+            date_to (str): Last date, YYYY-MM-DD (optional)
+            is_present (bool): Only present (True) or absent (False) records
+            
+        Returns:
+            dict: PyMongo filter
+            
+        Raises:
+            ValueError: Invalid date or a window that ends before it starts
+        """
+        query = {}
+        date_range = {}
+        try:
+            if date_from:
+                date_range['$gte'] = datetime.strptime(date_from, '%Y-%m-%d')
+            if date_to:
+                date_range['$lte'] = datetime.strptime(date_to, '%Y-%m-%d')
+        except ValueError:
+            raise ValueError("Invalid date format. Use YYYY-MM-DD")
+        if date_from and date_to and date_range['$gte'] > date_range['$lte']:
+            raise ValueError("'from' must not be after 'to'")
+        if date_range:
+            query['attendance_date'] = date_range
+        if is_present is not None:
+            query['is_present'] = is_present
+        return query
+    
+    @classmethod
+    def remove_duplicate_days(cls, batch_size=1000):
+        """
+        Delete all but the first record of each employee and day
+        
+        Older releases checked for an existing record before inserting, so
+        concurrent marks could store the same day twice, and the unique
+        index cannot be built over them. The earliest record (lowest _id)
+        is kept, matching the 409 a later mark now gets.
+        
+        Returns:
+            tuple: (records deleted, sorted list of the days affected)
+        """
+        collection = cls._get_collection()
+        duplicates = collection.aggregate([
+            {'$group': {
+                '_id': {'employee_id': '$employee_id', 'attendance_date': '$attendance_date'},
+                'ids': {'$push': '$_id'},
+                'count': {'$sum': 1}
+            }},
+            {'$match': {'count': {'$gt': 1}}}
+        ], allowDiskUse=True)
+        
+        deleted = 0
+        days = set()
+        pending = []
+        for group in duplicates:
+            pending.extend(sorted(group['ids'])[1:])
+            days.add(group['_id']['attendance_date'])
+            if len(pending) >= batch_size:
+                deleted += collection.delete_many({'_id': {'$in': pending}}).deleted_count
+                pending = []
+        if pending:
+            deleted += collection.delete_many({'_id': {'$in': pending}}).deleted_count
+        return deleted, sorted(days)
+    
+    def _employee_pk(self):
+        """Referenced User id, without dereferencing it"""
+        reference = self._data.get('employee_id')
+        return getattr(reference, 'id', None) if isinstance(reference, DBRef) else getattr(reference, 'pk', None)
+    
+    @staticmethod
+    def resolve_employees(records, known=None):
+        """
+        Fetch the employees referenced by records with a single query
+        
+        Employees already in the lookup cache are not queried again.
+        
+        Records should come from a no_dereference() queryset so iterating
+        them does not trigger a lookup per record.
+        
+        Args:
+            records (list): Attendance documents
+            known (dict): Already loaded User id -> User entries to reuse
+            
+        Returns:
+            dict: User id -> User; ids of deleted employees are absent
+        """
+        employees = dict(known or {})
+        missing = {record._employee_pk() for record in records} - set(employees)
+        missing.discard(None)
+        if missing:
+            employees.update(find_employees_by_pk(missing))
+        return employees
+    
+    @classmethod
+    def to_dict_many(cls, records, known=None, fields=None):
+        """Serialize records, resolving all employee references in one query"""
+        records = list(records)
+        if fields and not {'employee_id', 'employee_name'} & set(fields):
+            return [record.to_dict({}, fields) for record in records]
+        employees = cls.resolve_employees(records, known)
+        return [record.to_dict(employees, fields) for record in records]
     
     def __repr__(self):
         status = "Present" if self.is_present else "Absent"
@@ -0,0 +1,303 @@
+"""
+Attendance Rollup Model - Materialized daily attendance totals
+One document per (date, department), maintained incrementally on write
+"""
+from mongoengine import Document, StringField, DateField, IntField, DateTimeField
+from datetime import datetime
+from pymongo import UpdateOne, ReplaceOne
+from pymongo.errors import BulkWriteError
+from .user_model import User
+from .attendance_model import Attendance
+
+
+# Worked minutes of one attendance document; 0 without both clock times
+WORKED_MINUTES_EXPR = {
+    '$cond': [
+        {'$and': ['$check_in_time', '$check_out_time']},
+        {'$max': [0, {'$floor': {'$divide': [{'$subtract': ['$check_out_time', '$check_in_time']}, 60000]}}]},
+        0
+    ]
+}
+
+# Passes of rebuild() over rollups that changed while they were recomputed
+REBUILD_ATTEMPTS = 5
+
+
+class AttendanceRollup(Document):
+    """
+    Daily attendance totals per department
+
+    Fields:
+    - date: Attendance date (required)
+    - department: Department of the employees counted (required)
+    - present: Number of present records
+    - absent: Number of absent records
+    - total: Number of records
+    - worked_minutes: Sum of check_out_time - check_in_time over the records
+    - revision: Bumped by every change, so rebuild() can detect concurrent ones
+    - updated_at: Timestamp when the rollup last changed
+    """
+
+    date = DateField(required=True)
+    department = StringField(required=True)
+    present = IntField(default=0)
+    absent = IntField(default=0)
+    total = IntField(default=0)
+    worked_minutes = IntField(default=0)
+    revision = IntField(default=0)
+    updated_at = DateTimeField(default=datetime.utcnow)
+
+    meta = {
+        'collection': 'attendance_rollups',
+        # Deploy-time index builds, see app.commands.manage_indexes
+        'auto_create_index': False,
+        'indexes': [
+            # One document per day and department; rebuild() also relies on
+            # it to detect rollups changed while it recomputed them
+            {'fields': ('date', 'department'), 'unique': True},
+            ('department', 'date')
+        ]
+    }
+
+    @staticmethod
+    def record_counts(is_present, check_in_time=None, check_out_time=None):
+        """Rollup contribution of a single attendance record"""
+        worked_minutes = 0
+        if check_in_time and check_out_time:
+            worked_minutes = max(0, int((check_out_time - check_in_time).total_seconds() // 60))
+        return {
+            'present': 1 if is_present else 0,
+            'absent': 0 if is_present else 1,
+            'total': 1,
+            'worked_minutes': worked_minutes
+        }
+
+    @staticmethod
+    def update_operations(increments):
+        """
+        Upserts adding counts to rollup documents
+
+        Args:
+            increments (dict): (day as datetime, department) -> counts dict
+
+        Returns:
+            list: PyMongo UpdateOne operations, for either client's bulk_write
+        """
+        now = datetime.utcnow()
+        return [
+            UpdateOne(
+                {'date': day, 'department': department},
+                {'$inc': dict(counts, revision=1), '$set': {'updated_at': now}},
+                upsert=True
+            )
+            for (day, department), counts in increments.items()
+        ]
+
+    @classmethod
+    def apply(cls, increments, session=None):
+        """
+        Add counts to rollup documents, creating them as needed
+
+        Args:
+            increments (dict): (day as datetime, department) -> counts dict
+            session: PyMongo ClientSession to run in (optional)
+        """
+        if not increments:
+            return
+        cls._get_collection().bulk_write(cls.update_operations(increments), ordered=False, session=session)
+
+    @classmethod
+    def add_record(cls, attendance, department):
+        """Count one newly created attendance record"""
+        day = datetime(attendance.attendance_date.year, attendance.attendance_date.month, attendance.attendance_date.day)
+        counts = cls.record_counts(attendance.is_present, attendance.check_in_time, attendance.check_out_time)
+        cls.apply({(day, department): counts})
+
+    @staticmethod
+    def employee_totals_pipeline(employee_pk):
+        """Aggregation of one employee's attendance into per-day totals"""
+        return [
+            {'$match': {'employee_id': employee_pk}},
+            {'$group': {
+                '_id': '$attendance_date',
+                'present': {'$sum': {'$cond': ['$is_present', 1, 0]}},
+                'total': {'$sum': 1},
+                'worked_minutes': {'$sum': WORKED_MINUTES_EXPR}
+            }}
+        ]
+
+    @classmethod
+    def employee_totals(cls, employee_pk, session=None):
+        """Per-day totals of one employee's attendance, computed in MongoDB"""
+        return list(Attendance._get_collection().aggregate(cls.employee_totals_pipeline(employee_pk), session=session))
+
+    @staticmethod
+    def move_increments(totals, from_department=None, to_department=None):
+        """
+        Rollup changes moving per-day totals between departments
+
+        Pass only from_department to take the totals away (employee deleted),
+        both to move them (department changed).
+
+        Args:
+            totals (list): employee_totals() rows
+
+        Returns:
+            dict: Increments for apply() / update_operations()
+        """
+        increments = {}
+        for row in totals:
+            counts = {
+                'present': row['present'],
+                'absent': row['total'] - row['present'],
+                'total': row['total'],
+                'worked_minutes': row['worked_minutes']
+            }
+            if from_department:
+                increments[(row['_id'], from_department)] = {key: -value for key, value in counts.items()}
+            if to_department:
+                increments[(row['_id'], to_department)] = counts
+        return increments
+
+    @classmethod
+    def move_employee(cls, employee_pk, from_department=None, to_department=None, session=None):
+        """
+        Move an employee's attendance between department rollups
+
+        Pass only from_department when the employee (and their records) is
+        being deleted, both when their department changes.
+        """
+        cls.apply(cls.move_increments(cls.employee_totals(employee_pk, session), from_department, to_department), session)
+
+    @staticmethod
+    def _totals_by_day(employee_pks, date_range):
+        """
+        Per-day totals of some employees' attendance, computed in MongoDB
+
+        Returns:
+            dict: day -> counts dict
+        """
+        match = {'employee_id': {'$in': employee_pks}}
+        if date_range:
+            match['attendance_date'] = date_range
+        return {
+            row['_id']: {
+                'present': row['present'],
+                'absent': row['total'] - row['present'],
+                'total': row['total'],
+                'worked_minutes': row['worked_minutes']
+            }
+            for row in Attendance._get_collection().aggregate([
+                {'$match': match},
+                {'$group': {
+                    '_id': '$attendance_date',
+                    'present': {'$sum': {'$cond': ['$is_present', 1, 0]}},
+                    'total': {'$sum': 1},
+                    'worked_minutes': {'$sum': WORKED_MINUTES_EXPR}
+                }}
+            ])
+        }
+
+    @classmethod
+    def rebuild(cls, date_from=None, date_to=None):
+        """
+        Recompute rollups from raw attendance records (backfill / repair)
+
+        Safe while attendance is being marked. Each (day, department) rollup
+        is replaced only if its revision is still the one read before its
+        totals were aggregated. A rollup an $inc changed in between fails
+        the unique (date, department) index instead of being overwritten,
+        and is recomputed on the next pass. What remains is a record whose
+        insert was counted but whose own $inc lands after the replace: its
+        rollup keeps one extra count until the next rebuild.
+
+        Totals come from one grouped aggregation per department, so the
+        work done in Python is proportional to days x departments, not to
+        records.
+
+        Args:
+            date_from (datetime): First day to rebuild (optional)
+            date_to (datetime): Last day to rebuild (optional)
+
+        Returns:
+            int: Number of rollup documents written
+
+        Raises:
+            RuntimeError: If rollups kept changing for REBUILD_ATTEMPTS passes
+        """
+        date_range = {}
+        if date_from:
+            date_range['$gte'] = date_from
+        if date_to:
+            date_range['$lte'] = date_to
+        query = {'date': date_range} if date_range else {}
+
+        departments = {}
+        for user in User._get_collection().find({}, {'department': 1}):
+            departments.setdefault(user.get('department'), []).append(user['_id'])
+
+        collection = cls._get_collection()
+        # Rollups whose records are all gone are zeroed, then deleted below
+        empty = {'present': 0, 'absent': 0, 'total': 0, 'worked_minutes': 0}
+        pending = None  # keys left to write; None for every rollup in the range
+        written = 0
+        for _ in range(REBUILD_ATTEMPTS):
+            revisions = {
+                (rollup['date'], rollup['department']): rollup.get('revision')
+                for rollup in collection.find(query, {'date': 1, 'department': 1, 'revision': 1})
+            }
+            totals = {}
+            for department, employee_pks in departments.items():
+                if pending is None or any(key[1] == department for key in pending):
+                    for day, counts in cls._totals_by_day(employee_pks, date_range).items():
+                        totals[(day, department)] = counts
+
+            keys = list((set(totals) | set(revisions)) if pending is None else pending)
+            now = datetime.utcnow()
+            operations = [
+                ReplaceOne(
+                    {'date': day, 'department': department, 'revision': revisions.get((day, department))},
+                    dict(
+                        totals.get((day, department), empty),
+                        date=day,
+                        department=department,
+                        revision=(revisions.get((day, department)) or 0) + 1,
+                        updated_at=now
+                    ),
+                    upsert=True
+                )
+                for day, department in keys
+            ]
+            if not operations:
+                break
+            try:
+                collection.bulk_write(operations, ordered=False)
+                pending = set()
+            except BulkWriteError as bwe:
+                errors = bwe.details.get('writeErrors', [])
+                if any(error.get('code') != 11000 for error in errors):
+                    raise
+                pending = {keys[error['index']] for error in errors}
+            written += len(operations) - len(pending)
+            if not pending:
+                break
+        else:
+            raise RuntimeError(f"{len(pending)} rollups kept changing during the rebuild; run it again")
+
+        # An $inc arriving after this simply upserts the rollup again
+        collection.delete_many(dict(query, total=0))
+        return written
+
+    def to_dict(self):
+        """Convert document to dictionary for JSON serialization"""
+        return {
+            'date': self.date.isoformat(),
+            'department': self.department,
+            'present': self.present,
+            'absent': self.absent,
+            'total': self.total,
+            'worked_minutes': self.worked_minutes
+        }
+
+    def __repr__(self):
+        return f'<AttendanceRollup {self.date} {self.department}: {self.present}/{self.total}>'
@@ -2,7 +2,9 @@
 User Model - Employee document schema
 Represents employee information in the HRMS system
 """
+import re
 from mongoengine import Document, StringField, EmailField, DateTimeField
+from pymongo import UpdateOne
 from datetime import datetime
 
 
@@ -17,6 +19,7 @@ class User(Document):
     - department: Department assignment (required)
     - role: Job role/position (optional, defaults to "Employee")
     - status: Employment status (optional, defaults to "Active")
+    - full_name_lower: Lowercased full_name for prefix filters (maintained on save)
     - created_at: Timestamp when employee was added
     - updated_at: Timestamp when employee was last updated
     """
@@ -27,21 +30,84 @@ class User(Document):
     department = StringField(required=True, min_length=2, max_length=50)
     role = StringField(default="Employee", max_length=50)
     status = StringField(default="Active", choices=["Active", "Inactive", "On Leave"])
+    full_name_lower = StringField(max_length=100)
     created_at = DateTimeField(default=datetime.utcnow)
     updated_at = DateTimeField(default=datetime.utcnow)
     
     meta = {
         'collection': 'users',
+        # Built at deploy time by app.commands.manage_indexes, not lazily per process
+        'auto_create_index': False,
         'indexes': [
             'employee_id',
             'email',
-            'created_at'
+            # Keyset pages of the list endpoint, one per sort key (SORT_FIELDS)
+            ('-created_at', '-id'),
+            ('full_name', 'id'),
+            ('employee_id', 'id'),
+            # Equality filters of the list endpoint, in default page order
+            ('department', '-created_at', '-id'),
+            ('status', '-created_at', '-id'),
+            ('role', '-created_at', '-id'),
+            # Case-insensitive name prefix filter (name=), an anchored
+            # case-sensitive regex on the lowercased copy has tight bounds
+            'full_name_lower',
+            # Word search on names (search=)
+            '$full_name',
+            # Latest change lookup for conditional GETs (ETag/Last-Modified)
+            'updated_at'
         ]
     }
     
-    def to_dict(self):
-        """Convert document to dictionary for JSON serialization"""
-        return {
+    # Sort keys accepted by list_query() ('-' prefix for descending)
+    SORT_FIELDS = ('created_at', 'full_name', 'employee_id')
+    
+    # Keys produced by to_dict(), selectable through fields= projections
+    SERIALIZED_FIELDS = (
+        'id', 'employee_id', 'full_name', 'email', 'department',
+        'role', 'status', 'created_at', 'updated_at'
+    )
+    
+    @staticmethod
+    def name_key(full_name):
+        """Value stored in full_name_lower; raw inserts/updates must set it too"""
+        return full_name.lower() if full_name else None
+    
+    def clean(self):
+        """Keep full_name_lower in step with full_name on every save()"""
+        self.full_name_lower = self.name_key(self.full_name)
+    
+    @classmethod
+    def backfill_name_keys(cls, batch_size=1000):
+        """
+        Set full_name_lower on documents written before the field existed
+        
+        Returns:
+            int: Number of documents updated
+        """
+        collection = cls._get_collection()
+        updated = 0
+        operations = []
+        for document in collection.find({'full_name_lower': {'$exists': False}}, {'full_name': 1}):
+            operations.append(UpdateOne(
+                {'_id': document['_id']},
+                {'$set': {'full_name_lower': cls.name_key(document.get('full_name'))}}
+            ))
+            if len(operations) >= batch_size:
+                updated += collection.bulk_write(operations, ordered=False).modified_count
+                operations = []
+        if operations:
+            updated += collection.bulk_write(operations, ordered=False).modified_count
+        return updated
+    
+    def to_dict(self, fields=None):
+        """
+        Convert document to dictionary for JSON serialization
+        
+        Args:
+            fields (list): Optional subset of SERIALIZED_FIELDS to include
+        """
+        data = {
             'id': str(self.id),
             'employee_id': self.employee_id,
             'full_name': self.full_name,
@@ -49,9 +115,53 @@ class User(Document):
             'department': self.department,
             'role': self.role,
             'status': self.status,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+        if fields:
+            return {field: data[field] for field in fields}
+        return data
+    
+    @classmethod
+    def source_fields(cls, fields):
+        """Document fields to load for a to_dict() projection"""
+        return [field for field in fields if field != 'id']
+    
+    @classmethod
+    def list_query(cls, department=None, status=None, role=None, name=None, search=None, sort='-created_at'):
+        """
+        Raw filter and order for the employee list endpoint
+        
+        Args:
+            department (str): Exact department
+            status (str): Exact status
+            role (str): Exact role
+            name (str): Case-insensitive full_name prefix (matched on full_name_lower)
+            search (str): Words to match in full_name (text index)
+            sort (str): One of SORT_FIELDS, '-' prefix for descending
+            
+        Returns:
+            tuple: (filter dict, sort field, direction)
+            
+        Raises:
+            ValueError: Unknown sort key, including '' and '-'
+        """
+        if sort is None:
+            sort = '-created_at'
+        sort_field = sort[1:] if sort.startswith('-') else sort
+        if sort_field not in cls.SORT_FIELDS:
+            raise ValueError(f"Invalid sort: '{sort}'. Allowed: {', '.join(cls.SORT_FIELDS)}, '-' prefix for descending")
+        direction = -1 if sort.startswith('-') else 1
+        
+        query = {}
+        for field, value in (('department', department), ('status', status), ('role', role)):
+            if value:
+                query[field] = value
+        if name:
+            query['full_name_lower'] = {'$regex': f'^{re.escape(cls.name_key(name))}'}
+        if search:
+            query['$text'] = {'$search': search}
+        return query, sort_field, direction
     
     def __repr__(self):
         return f'<User {self.employee_id}: {self.full_name}>'
@@ -0,0 +1,8 @@
+"""
+Repositories Package - Native async data access for HRMS Lite
+Used instead of the MongoEngine Documents when DATA_BACKEND=motor
+"""
+from .employee_repository import EmployeeRepository
+from .attendance_repository import AttendanceRepository
+
+__all__ = ['EmployeeRepository', 'AttendanceRepository']
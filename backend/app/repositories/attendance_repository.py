@@ -0,0 +1,70 @@
+"""
+Attendance Repository - Async access to the attendance collection
+Mirrors the storage layout of the Attendance MongoEngine Document
+"""
+from datetime import datetime
+from app.models import Attendance
+from .base import find_page
+
+
+def _as_datetime(day):
+    """DateField values are stored as midnight datetimes"""
+    return datetime(day.year, day.month, day.day)
+
+
+class AttendanceRepository:
+    """
+    Async repository for attendance documents
+    
+    Args:
+        db: Async database handle (Motor, or mongomock-motor for tests)
+    """
+    
+    def __init__(self, db):
+        self.collection = db[Attendance._get_collection_name()]
+    
+    async def list(self, query=None, order_by='-attendance_date'):
+        """List attendance records matching query ordered by a field"""
+        direction = -1 if order_by.startswith('-') else 1
+        cursor = self.collection.find(query or {}).sort(order_by.lstrip('-'), direction)
+        return [doc async for doc in cursor]
+    
+    async def page(self, query=None, cursor=None, limit=None, projection=None):
+        """One keyset page of records, newest attendance_date first"""
+        return await find_page(
+            self.collection, 'attendance_date', query=query,
+            cursor=cursor, limit=limit, projection=projection
+        )
+    
+    async def list_for_employee(self, employee_oid, query=None):
+        """List an employee's records matching query, newest attendance_date first"""
+        return await self.list(dict(query or {}, employee_id=employee_oid))
+    
+    async def list_for_date(self, day, query=None):
+        """List the records for one date matching query, ordered by employee"""
+        return await self.list(dict(query or {}, attendance_date=_as_datetime(day)), order_by='employee_id')
+    
+    async def insert(self, employee_oid, day, is_present, check_in_time=None,
+                     check_out_time=None, notes=None):
+        """
+        Insert a new attendance record
+        
+        Raises:
+            pymongo.errors.DuplicateKeyError: Already marked for that day
+        """
+        now = datetime.utcnow()
+        doc = {
+            'employee_id': employee_oid,
+            'attendance_date': _as_datetime(day),
+            'is_present': is_present,
+            'check_in_time': check_in_time,
+            'check_out_time': check_out_time,
+            'notes': notes,
+            'created_at': now,
+            'updated_at': now
+        }
+        # MongoEngine does not store unset optional fields
+        doc = {key: value for key, value in doc.items() if value is not None}
+        result = await self.collection.insert_one(doc)
+        doc['_id'] = result.inserted_id
+        return doc
@@ -0,0 +1,26 @@
+"""
+Repository Helpers - Query helpers shared by the async repositories
+"""
+from app.utils.pagination import clamp_limit, keyset_query, split_page
+
+
+async def find_page(collection, sort_field, query=None, cursor=None, limit=None, projection=None, direction=-1):
+    """
+    Fetch one keyset page keyed on (sort_field, _id)
+    
+    Args:
+        collection: Async collection
+        sort_field (str): Field the page is ordered by
+        query (dict): Base filter
+        cursor (str): Cursor returned with the previous page
+        limit (int): Requested page size
+        projection (list): Stored fields to load (sort key and _id are added)
+        direction (int): -1 for descending (newest first), 1 for ascending
+        
+    Returns:
+        tuple: (documents, next_cursor or None)
+    """
+    limit = clamp_limit(limit)
+    mongo_filter, fields = keyset_query(sort_field, query, cursor, projection, direction)
+    results = collection.find(mongo_filter, fields).sort([(sort_field, direction), ('_id', direction)]).limit(limit + 1)
+    return split_page([doc async for doc in results], limit, sort_field)
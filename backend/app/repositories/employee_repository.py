@@ -0,0 +1,147 @@
+"""
+Employee Repository - Async access to the users collection
+Mirrors the storage layout of the User MongoEngine Document
+"""
+from datetime import datetime
+from pymongo import ReturnDocument
+from app.models import User, Attendance, AttendanceRollup
+from app.utils.database import supports_transactions
+from app.utils.employee_cache import get_employee_cache
+from .base import find_page
+
+
+class EmployeeRepository:
+    """
+    Async repository for employee documents
+    
+    Args:
+        db: Async database handle (Motor, or mongomock-motor for tests)
+    """
+    
+    def __init__(self, db):
+        self.collection = db[User._get_collection_name()]
+        self.attendance = db[Attendance._get_collection_name()]
+        self.rollups = db[AttendanceRollup._get_collection_name()]
+    
+    async def find_by_employee_id(self, employee_id):
+        """Find one employee by business employee_id"""
+        return await self.collection.find_one({'employee_id': employee_id})
+    
+    async def find_by_ids(self, object_ids):
+        """
+        Fetch several employees by _id in one round-trip
+        
+        Employees already in the lookup cache are not queried again.
+        
+        Returns:
+            dict: _id -> users document (missing ids are absent)
+        """
+        cache = get_employee_cache()
+        employees = {}
+        missing = []
+        for object_id in object_ids:
+            doc = cache.get_by_pk(object_id)
+            if doc is not None:
+                employees[object_id] = doc
+            else:
+                missing.append(object_id)
+        if missing:
+            async for doc in self.collection.find({'_id': {'$in': missing}}):
+                cache.put(doc)
+                employees[doc['_id']] = doc
+        return employees
+    
+    async def find_by_department(self, department):
+        """
+        Employees of a department, with the fields attendance serializers need
+        
+        Returns:
+            dict: _id -> users document
+        """
+        cursor = self.collection.find({'department': department}, {'employee_id': 1, 'full_name': 1})
+        return {doc['_id']: doc async for doc in cursor}
+    
+    async def list(self, order_by='-created_at'):
+        """List all employees ordered by a field ('-' prefix for descending)"""
+        direction = -1 if order_by.startswith('-') else 1
+        cursor = self.collection.find().sort(order_by.lstrip('-'), direction)
+        return [doc async for doc in cursor]
+    
+    async def page(self, query=None, sort_field='created_at', direction=-1,
+                   cursor=None, limit=None, projection=None):
+        """One keyset page of employees matching query, newest created_at first by default"""
+        return await find_page(
+            self.collection, sort_field, query=query,
+            cursor=cursor, limit=limit, projection=projection, direction=direction
+        )
+    
+    async def insert(self, employee):
+        """
+        Insert a new employee with the same defaults as the User Document
+        
+        Raises:
+            pymongo.errors.DuplicateKeyError: employee_id or email already exists
+        """
+        now = datetime.utcnow()
+        doc = {
+            'employee_id': employee['employee_id'],
+            'full_name': employee['full_name'],
+            'full_name_lower': User.name_key(employee['full_name']),
+            'email': employee['email'],
+            'department': employee['department'],
+            'role': employee.get('role') or 'Employee',
+            'status': employee.get('status') or 'Active',
+            'created_at': now,
+            'updated_at': now
+        }
+        result = await self.collection.insert_one(doc)
+        doc['_id'] = result.inserted_id
+        return doc
+    
+    async def update(self, employee_id, fields):
+        """
+        Set fields on an employee and bump updated_at
+        
+        Returns:
+            dict or None: Updated document, or None if not found
+        """
+        changes = dict(fields, updated_at=datetime.utcnow())
+        if 'full_name' in changes:
+            changes['full_name_lower'] = User.name_key(changes['full_name'])
+        employee = await self.collection.find_one_and_update(
+            {'employee_id': employee_id},
+            {'$set': changes},
+            return_document=ReturnDocument.AFTER
+        )
+        get_employee_cache().invalidate(employee_id)
+        return employee
+    
+    async def delete_cascade(self, employee):
+        """
+        Delete an employee, all of their attendance records and their rollup counts
+        
+        Everything shares one transaction on replica sets. Elsewhere the
+        per-day totals are read first, the records and then the employee
+        are deleted, and the totals are subtracted last, so a retry after a
+        partial failure never subtracts them twice.
+        """
+        async def cascade(session=None):
+            totals = await self.attendance.aggregate(
+                AttendanceRollup.employee_totals_pipeline(employee['_id']), session=session
+            ).to_list(None)
+            await self.attendance.delete_many({'employee_id': employee['_id']}, session=session)
+            await self.collection.delete_one({'_id': employee['_id']}, session=session)
+            increments = AttendanceRollup.move_increments(totals, from_department=employee['department'])
+            if increments:
+                await self.rollups.bulk_write(
+                    AttendanceRollup.update_operations(increments), ordered=False, session=session
+                )
+        
+        client = self.collection.database.client
+        if supports_transactions(client):
+            async with await client.start_session() as session:
+                async with session.start_transaction():
+                    await cascade(session)
+        else:
+            await cascade()
+        get_employee_cache().invalidate(employee['employee_id'])
@@ -3,5 +3,7 @@ Routes Package - API endpoint routers
 """
 from .employee_routes import router as employee_router
 from .attendance_routes import router as attendance_router
+from .dashboard_routes import router as dashboard_router
+from .report_routes import router as report_router
 
-__all__ = ['employee_router', 'attendance_router']
+__all__ = ['employee_router', 'attendance_router', 'dashboard_router', 'report_router']
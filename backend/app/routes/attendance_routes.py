@@ -1,11 +1,17 @@
 """
 Attendance Routes - API endpoints for attendance management
 """
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime, time
-from app.controllers import AttendanceController
+from app.controllers import AttendanceController, call_controller, call_cached
+from app.utils import iterate_sync
+from app.utils.coalescing import coalesce
+from app.utils.conditional import conditional_get
+from app.utils.attendance_events import stream_events
+from app.utils.responses import json_response
 
 router = APIRouter(prefix="/api/attendance", tags=["attendance"])
 
@@ -20,6 +26,16 @@ class MarkAttendanceRequest(BaseModel):
     notes: Optional[str] = Field(None, max_length=500, description="Additional notes")
 
 
+class BulkAttendanceItem(MarkAttendanceRequest):
+    """One entry of a bulk attendance request"""
+    employee_id: str = Field(..., description="Employee ID")
+
+
+class BulkMarkAttendanceRequest(BaseModel):
+    """Request model for marking attendance for many employees"""
+    records: List[BulkAttendanceItem] = Field(..., min_length=1, description="Attendance marks")
+
+
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def mark_attendance(
     employee_id: str = Query(..., description="Employee ID"),
@@ -32,7 +48,8 @@ async def mark_attendance(
             detail="Attendance data is required"
         )
     
-    result = AttendanceController.mark_attendance(
+    result = await call_controller(
+        AttendanceController.mark_attendance,
         employee_id,
         attendance.dict()
     )
@@ -43,13 +60,52 @@ async def mark_attendance(
             detail=result['message']
         )
     
-    return result
+    return json_response(result)
+
+
+@router.post("/bulk")
+async def bulk_mark_attendance(request: BulkMarkAttendanceRequest):
+    """Mark attendance for many employees in one request"""
+    result = await call_controller(
+        AttendanceController.bulk_mark_attendance,
+        [record.dict() for record in request.records]
+    )
+    
+    if not result['success']:
+        raise HTTPException(
+            status_code=result.get('status_code', 400),
+            detail=result['message']
+        )
+    
+    return json_response(result)
 
 
 @router.get("/")
-async def get_all_attendance():
-    """Get all attendance records"""
-    result = AttendanceController.get_all_attendance()
+async def get_all_attendance(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma separated fields to return"),
+    date_from: Optional[str] = Query(None, alias="from", description="First date (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, alias="to", description="Last date (YYYY-MM-DD)"),
+    department: Optional[str] = Query(None, description="Only this department"),
+    is_present: Optional[bool] = Query(None, description="Only present (true) or absent (false) records")
+):
+    """Get attendance records, one page at a time (newest first)"""
+    not_modified, headers = await conditional_get(request, ('attendance', 'users'))
+    if not_modified:
+        return not_modified
+    
+    result = await coalesce(request, lambda: call_controller(
+        AttendanceController.get_all_attendance,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+        date_from=date_from,
+        date_to=date_to,
+        department=department,
+        is_present=is_present
+    ))
     
     if not result['success']:
         raise HTTPException(
@@ -57,13 +113,79 @@ async def get_all_attendance():
             detail=result['message']
         )
     
-    return result
+    return json_response(result, headers)
+
+
+@router.get("/export")
+async def export_attendance(
+    export_format: str = Query("ndjson", alias="format", description="ndjson or csv"),
+    date_from: Optional[str] = Query(None, alias="from", description="First date (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, alias="to", description="Last date (YYYY-MM-DD)"),
+    department: Optional[str] = Query(None, description="Only this department")
+):
+    """Stream the full attendance history as NDJSON or CSV"""
+    result = await call_controller(
+        AttendanceController.export_attendance,
+        export_format,
+        date_from,
+        date_to,
+        department
+    )
+    
+    if not result['success']:
+        raise HTTPException(
+            status_code=result.get('status_code', 400),
+            detail=result['message']
+        )
+    
+    if export_format == "csv":
+        return StreamingResponse(
+            iterate_sync(result['data']),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="attendance.csv"'}
+        )
+    return StreamingResponse(iterate_sync(result['data']), media_type="application/x-ndjson")
+
+
+@router.get("/stream")
+async def stream_attendance(
+    request: Request,
+    last_event_id: Optional[str] = Query(None, description="Resume after this event id")
+):
+    """
+    Push attendance changes as Server-Sent Events
+    
+    Events: "created" / "updated" carry the attendance record, "reset" means
+    the client should refetch (records were deleted or the resume id is gone).
+    """
+    resume_from = request.headers.get("last-event-id") or last_event_id
+    return StreamingResponse(
+        stream_events(request, resume_from),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/employee/{employee_id}")
-async def get_employee_attendance(employee_id: str):
-    """Get attendance records for specific employee"""
-    result = AttendanceController.get_employee_attendance(employee_id)
+async def get_employee_attendance(
+    employee_id: str,
+    request: Request,
+    date_from: Optional[str] = Query(None, alias="from", description="First date (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, alias="to", description="Last date (YYYY-MM-DD)"),
+    is_present: Optional[bool] = Query(None, description="Only present (true) or absent (false) records")
+):
+    """Get attendance records for specific employee, optionally within a date window"""
+    not_modified, headers = await conditional_get(request, ('attendance', 'users'))
+    if not_modified:
+        return not_modified
+    
+    result = await coalesce(request, lambda: call_controller(
+        AttendanceController.get_employee_attendance,
+        employee_id,
+        date_from=date_from,
+        date_to=date_to,
+        is_present=is_present
+    ))
     
     if not result['success']:
         raise HTTPException(
@@ -71,13 +193,29 @@ async def get_employee_attendance(employee_id: str):
             detail=result['message']
         )
     
-    return result
+    return json_response(result, headers)
 
 
 @router.get("/date/{attendance_date}")
-async def get_attendance_by_date(attendance_date: str):
+async def get_attendance_by_date(
+    attendance_date: str,
+    request: Request,
+    department: Optional[str] = Query(None, description="Only this department"),
+    is_present: Optional[bool] = Query(None, description="Only present (true) or absent (false) records")
+):
     """Get attendance records for specific date (YYYY-MM-DD)"""
-    result = AttendanceController.get_attendance_by_date(attendance_date)
+    not_modified, headers = await conditional_get(request, ('attendance', 'users'))
+    if not_modified:
+        return not_modified
+    
+    result = await coalesce(request, lambda: call_cached(
+        ('attendance', 'users'),
+        AttendanceController.get_attendance_by_date,
+        attendance_date,
+        department=department,
+        is_present=is_present,
+        collection_state=request.state.collection_state
+    ))
     
     if not result['success']:
         raise HTTPException(
@@ -85,33 +223,37 @@ async def get_attendance_by_date(attendance_date: str):
             detail=result['message']
         )
     
-    return result
+    return json_response(result, headers)
 
 
 @router.delete("/cleanup")
-async def cleanup_orphaned_records():
-    """Remove all attendance records for deleted employees (development cleanup)"""
-    from app.models import Attendance, User
-    from app.utils import success_response, error_response
-    
-    try:
-        deleted_count = 0
-        attendance_records = list(Attendance.objects())
-        
-        # Find and delete orphaned records (those with broken employee references)
-        for record in attendance_records:
-            try:
-                # Try to access the employee reference
-                _ = record.employee_id.employee_id
-            except:
-                # This record has a broken reference, delete it
-                record.delete()
-                deleted_count += 1
-        
-        return success_response(
-            f"Cleaned up {deleted_count} orphaned attendance records",
-            data={"deleted_records": deleted_count},
-            status_code=200
+async def cleanup_orphaned_records(
+    background: bool = Query(False, description="Run as a background job and return its id")
+):
+    """Remove all attendance records for deleted employees"""
+    if background:
+        result = await call_controller(AttendanceController.start_cleanup_job)
+    else:
+        result = await call_controller(AttendanceController.cleanup_orphaned_records)
+    
+    if not result['success']:
+        raise HTTPException(
+            status_code=result.get('status_code', 500),
+            detail=result['message']
         )
-    except Exception as e:
-        return error_response(f"Error cleaning up records: {str(e)}", status_code=500)
+    
+    return json_response(result)
+
+
+@router.get("/cleanup/jobs/{job_id}")
+async def get_cleanup_job(job_id: str):
+    """Get the status and progress of a background cleanup job"""
+    result = await call_controller(AttendanceController.get_cleanup_job, job_id)
+    
+    if not result['success']:
+        raise HTTPException(
+            status_code=result.get('status_code', 404),
+            detail=result['message']
+        )
+    
+    return json_response(result)
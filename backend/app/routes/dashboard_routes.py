@@ -0,0 +1,23 @@
+"""
+Dashboard Routes - API endpoints for the dashboard overview
+"""
+from fastapi import APIRouter, HTTPException, Request
+from app.controllers import DashboardController, call_controller
+from app.utils.coalescing import coalesce
+from app.utils.responses import json_response
+
+router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
+
+
+@router.get("/summary")
+async def get_dashboard_summary(request: Request):
+    """Get headcount and attendance statistics"""
+    result = await coalesce(request, lambda: call_controller(DashboardController.get_summary))
+    
+    if not result['success']:
+        raise HTTPException(
+            status_code=result.get('status_code', 500),
+            detail=result['message']
+        )
+    
+    return json_response(result)
@@ -1,10 +1,13 @@
 """
 Employee Routes - API endpoints for employee management
 """
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, status, Query, UploadFile, File, Request
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
-from app.controllers import EmployeeController
+from app.controllers import EmployeeController, call_controller, call_cached
+from app.utils.coalescing import coalesce
+from app.utils.conditional import conditional_get
+from app.utils.responses import json_response
 
 router = APIRouter(prefix="/api/employees", tags=["employees"])
 
@@ -30,7 +33,7 @@ class UpdateEmployeeRequest(BaseModel):
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def add_employee(employee: AddEmployeeRequest):
     """Add a new employee"""
-    result = EmployeeController.add_employee(employee.dict())
+    result = await call_controller(EmployeeController.add_employee, employee.dict())
     
     if not result['success']:
         raise HTTPException(
@@ -38,13 +41,62 @@ async def add_employee(employee: AddEmployeeRequest):
             detail=result['message']
         )
     
-    return result
+    return json_response(result)
+
+
+@router.post("/import")
+async def import_employees(
+    file: UploadFile = File(..., description="CSV (with header) or NDJSON file"),
+    import_format: Optional[str] = Query(None, alias="format", description="csv or ndjson (default: from file name)")
+):
+    """Bulk import employees from an uploaded file"""
+    if import_format is None:
+        filename = (file.filename or '').lower()
+        import_format = 'ndjson' if filename.endswith(('.ndjson', '.jsonl', '.json')) else 'csv'
+    
+    result = await call_controller(EmployeeController.import_employees, file.file, import_format)
+    
+    if not result['success']:
+        raise HTTPException(
+            status_code=result.get('status_code', 400),
+            detail=result['message']
+        )
+    
+    return json_response(result)
 
 
 @router.get("/")
-async def get_all_employees():
-    """Get all employees"""
-    result = EmployeeController.get_all_employees()
+async def get_all_employees(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma separated fields to return"),
+    department: Optional[str] = Query(None, description="Exact department"),
+    status: Optional[str] = Query(None, description="Exact status"),
+    role: Optional[str] = Query(None, description="Exact role"),
+    name: Optional[str] = Query(None, description="Full name prefix (case-insensitive)"),
+    search: Optional[str] = Query(None, description="Words to match in full names"),
+    sort: str = Query("-created_at", description="created_at, full_name or employee_id; '-' prefix for descending")
+):
+    """Get employees, one page at a time (newest first unless sorted)"""
+    not_modified, headers = await conditional_get(request, ('users',))
+    if not_modified:
+        return not_modified
+    
+    result = await coalesce(request, lambda: call_cached(
+        ('users',),
+        EmployeeController.get_all_employees,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+        department=department,
+        status=status,
+        role=role,
+        name=name,
+        search=search,
+        sort=sort,
+        collection_state=request.state.collection_state
+    ))
     
     if not result['success']:
         raise HTTPException(
@@ -52,13 +104,17 @@ async def get_all_employees():
             detail=result['message']
         )
     
-    return result
+    return json_response(result, headers)
 
 
 @router.get("/{employee_id}")
-async def get_employee(employee_id: str):
+async def get_employee(employee_id: str, request: Request):
     """Get specific employee by ID"""
-    result = EmployeeController.get_employee_by_id(employee_id)
+    not_modified, headers = await conditional_get(request, ('users',))
+    if not_modified:
+        return not_modified
+    
+    result = await coalesce(request, lambda: call_controller(EmployeeController.get_employee_by_id, employee_id))
     
     if not result['success']:
         raise HTTPException(
@@ -66,13 +122,14 @@ async def get_employee(employee_id: str):
             detail=result['message']
         )
     
-    return result
+    return json_response(result, headers)
 
 
 @router.put("/{employee_id}")
 async def update_employee(employee_id: str, update_data: UpdateEmployeeRequest):
     """Update employee information"""
-    result = EmployeeController.update_employee(
+    result = await call_controller(
+        EmployeeController.update_employee,
         employee_id,
         update_data.dict(exclude_unset=True)
     )
@@ -83,13 +140,13 @@ async def update_employee(employee_id: str, update_data: UpdateEmployeeRequest):
             detail=result['message']
         )
     
-    return result
+    return json_response(result)
 
 
 @router.delete("/{employee_id}", status_code=status.HTTP_200_OK)
 async def delete_employee(employee_id: str):
     """Delete an employee"""
-    result = EmployeeController.delete_employee(employee_id)
+    result = await call_controller(EmployeeController.delete_employee, employee_id)
     
     if not result['success']:
         raise HTTPException(
@@ -97,4 +154,4 @@ async def delete_employee(employee_id: str):
             detail=result['message']
         )
     
-    return result
+    return json_response(result)
@@ -0,0 +1,81 @@
+"""
+Report Routes - API endpoints for attendance reports
+"""
+from fastapi import APIRouter, HTTPException, Query, Request
+from typing import Optional
+from app.controllers import ReportController, call_cached
+from app.utils.coalescing import coalesce
+from app.utils.responses import json_response
+
+router = APIRouter(prefix="/api/reports", tags=["reports"])
+
+
+@router.get("/monthly")
+async def get_monthly_report(
+    request: Request,
+    month: str = Query(..., description="Month in YYYY-MM format"),
+    department: Optional[str] = Query(None, description="Only this department")
+):
+    """Get daily and per-department attendance totals for a month"""
+    result = await coalesce(request, lambda: call_cached(
+        ('attendance_rollups',),
+        ReportController.get_monthly_report,
+        month,
+        department
+    ))
+    
+    if not result['success']:
+        raise HTTPException(
+            status_code=result.get('status_code', 400),
+            detail=result['message']
+        )
+    
+    return json_response(result)
+
+
+@router.get("/departments")
+async def get_department_report(
+    request: Request,
+    date_from: Optional[str] = Query(None, alias="from", description="First date (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, alias="to", description="Last date (YYYY-MM-DD)")
+):
+    """Get attendance totals per department for a date range"""
+    result = await coalesce(request, lambda: call_cached(
+        ('attendance_rollups',),
+        ReportController.get_department_report,
+        date_from,
+        date_to
+    ))
+    
+    if not result['success']:
+        raise HTTPException(
+            status_code=result.get('status_code', 400),
+            detail=result['message']
+        )
+    
+    return json_response(result)
+
+
+@router.get("/hours")
+async def get_hours_report(
+    request: Request,
+    date_from: Optional[str] = Query(None, alias="from", description="First date (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, alias="to", description="Last date (YYYY-MM-DD)"),
+    department: Optional[str] = Query(None, description="Only this department")
+):
+    """Get worked hours, average check-in, late arrivals and overtime per employee and department"""
+    result = await coalesce(request, lambda: call_cached(
+        ('attendance', 'users'),
+        ReportController.get_hours_report,
+        date_from,
+        date_to,
+        department
+    ))
+    
+    if not result['success']:
+        raise HTTPException(
+            status_code=result.get('status_code', 400),
+            detail=result['message']
+        )
+    
+    return json_response(result)
@@ -1,15 +1,35 @@
 """
 Utils Package - Helper functions for HRMS Lite backend
 """
-from .database import connect_database, disconnect_database
-from .validators import validate_add_employee_data, validate_email_format
+from .database import (
+    connect_database, disconnect_database, ensure_model_indexes, supports_transactions,
+    warm_up_database, connect_async_database, disconnect_async_database, get_async_database,
+    warm_up_async_database
+)
+from .validators import validate_add_employee_data, validate_email_format, parse_clock_time
 from .error_handler import success_response, error_response
+from .serializers import serialize_user, serialize_attendance
+from .executor import run_sync, iterate_sync, shutdown_executor, ExecutorSaturatedError
 
 __all__ = [
     'connect_database',
     'disconnect_database',
+    'ensure_model_indexes',
+    'supports_transactions',
+    'warm_up_database',
+    'connect_async_database',
+    'disconnect_async_database',
+    'get_async_database',
+    'warm_up_async_database',
     'validate_add_employee_data',
     'validate_email_format',
+    'parse_clock_time',
     'success_response',
-    'error_response'
+    'error_response',
+    'serialize_user',
+    'serialize_attendance',
+    'run_sync',
+    'iterate_sync',
+    'shutdown_executor',
+    'ExecutorSaturatedError'
 ]
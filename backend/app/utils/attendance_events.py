@@ -0,0 +1,214 @@
+"""
+Attendance Events
+In-process publish/subscribe feed of attendance changes for the SSE stream,
+optionally driven by a MongoDB change stream instead of controller hooks
+"""
+import asyncio
+import itertools
+import threading
+import uuid
+from collections import deque
+
+from config import get_settings
+from .responses import json_dumps
+
+SUBSCRIBER_QUEUE_SIZE = 1000
+# Client reconnect delay advertised to EventSource, in milliseconds
+RECONNECT_DELAY_MS = 3000
+
+
+class AttendanceEventBus:
+    """
+    Fan-out of attendance events to async subscribers
+
+    publish() may be called from executor threads or the event loop. Recent
+    events are kept in a ring buffer so a reconnecting client can resume
+    from its Last-Event-ID. Event ids are "<epoch>-<sequence>"; the epoch
+    changes on every process start, so ids from another process (or older
+    than the buffer) are answered with a "reset" event instead of a gap.
+    """
+
+    def __init__(self, buffer_size):
+        self.epoch = uuid.uuid4().hex[:8]
+        self._sequence = itertools.count(1)
+        self._buffer = deque(maxlen=buffer_size)
+        self._subscribers = {}  # asyncio.Queue -> event loop
+        self._lock = threading.Lock()
+        # False while a change stream watcher is the source of events
+        self.local_publishing = True
+
+    def publish(self, event_type, data):
+        """Record an event and deliver it to every subscriber"""
+        with self._lock:
+            event = {
+                'id': f'{self.epoch}-{next(self._sequence)}',
+                'event': event_type,
+                'data': data
+            }
+            self._buffer.append(event)
+            subscribers = list(self._subscribers.items())
+        for queue, loop in subscribers:
+            loop.call_soon_threadsafe(self._deliver, queue, event)
+
+    def publish_local(self, event_type, data):
+        """publish() from a controller hook, unless a change stream feeds the bus"""
+        if self.local_publishing:
+            self.publish(event_type, data)
+
+    def subscribe(self, last_event_id=None):
+        """
+        Register a subscriber on the running event loop
+
+        Args:
+            last_event_id (str): Last id the client received, to resume after
+
+        Returns:
+            tuple: (events to replay first, asyncio.Queue of live events)
+        """
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers[queue] = asyncio.get_running_loop()
+            replay = self._replay_after(last_event_id) if last_event_id else []
+        return replay, queue
+
+    def unsubscribe(self, queue):
+        """Stop delivering to a subscriber"""
+        with self._lock:
+            self._subscribers.pop(queue, None)
+
+    def _replay_after(self, last_event_id):
+        """Buffered events after last_event_id, or a reset if it can't be resumed"""
+        epoch, _, sequence = last_event_id.partition('-')
+        if epoch == self.epoch and sequence.isdigit():
+            sequence = int(sequence)
+            buffered = [int(event['id'].split('-')[1]) for event in self._buffer]
+            if not buffered or buffered[0] <= sequence + 1:
+                return [event for event, number in zip(self._buffer, buffered) if number > sequence]
+        return [self._reset_event()]
+
+    def _reset_event(self):
+        last_id = self._buffer[-1]['id'] if self._buffer else f'{self.epoch}-0'
+        return {'id': last_id, 'event': 'reset', 'data': None}
+
+    def _deliver(self, queue, event):
+        """Queue an event on the subscriber's loop; overflowing subscribers are cut off"""
+        if queue not in self._subscribers:
+            return
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.unsubscribe(queue)
+            # Emptied so the sentinel fits; the client resumes via Last-Event-ID
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+
+_event_bus = None
+
+
+def get_event_bus():
+    """Get the process-wide attendance event bus"""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = AttendanceEventBus(get_settings().ATTENDANCE_EVENT_BUFFER)
+    return _event_bus
+
+
+def format_sse(event):
+    """Encode an event in the text/event-stream wire format"""
+    return f"id: {event['id']}\nevent: {event['event']}\ndata: {json_dumps(event['data']).decode()}\n\n"
+
+
+async def stream_events(request, last_event_id=None):
+    """
+    Server-Sent Events body: replayed events, then live ones until disconnect
+
+    A comment line is sent every SSE_HEARTBEAT_SECONDS so proxies keep the
+    connection open. A subscriber that falls too far behind is disconnected
+    and resumes through its Last-Event-ID.
+    """
+    bus = get_event_bus()
+    heartbeat = get_settings().SSE_HEARTBEAT_SECONDS
+    replay, queue = bus.subscribe(last_event_id)
+    try:
+        yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+        for event in replay:
+            yield format_sse(event)
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                return
+            yield format_sse(event)
+    finally:
+        bus.unsubscribe(queue)
+
+
+_change_stream = None
+
+
+def _watch_attendance(bus, stream):
+    """Change stream loop: publish inserts/updates as events, deletes as resets"""
+    from pymongo.errors import PyMongoError
+    from app.models import Attendance
+    from app.utils.employee_cache import find_employees_by_pk
+    try:
+        for change in stream:
+            operation = change['operationType']
+            if operation in ('insert', 'update', 'replace') and change.get('fullDocument'):
+                document = change['fullDocument']
+                record = Attendance._from_son(document)
+                employees = find_employees_by_pk([document.get('employee_id')])
+                bus.publish(
+                    'created' if operation == 'insert' else 'updated',
+                    record.to_dict(employees)
+                )
+            elif operation in ('delete', 'drop', 'invalidate'):
+                bus.publish('reset', None)
+    except PyMongoError as e:
+        if stream.alive:
+            print(f"⚠️ Attendance change stream stopped, using in-process events: {e}")
+    finally:
+        # Hand publishing back to the controller hooks; clients refetch once
+        bus.local_publishing = True
+        bus.publish('reset', None)
+
+
+def start_change_stream():
+    """
+    Feed the event bus from a MongoDB change stream on the attendance collection
+
+    Change streams need a replica set (or sharded cluster). On a standalone
+    server this logs a warning and the controller hooks stay in charge.
+
+    Returns:
+        bool: True if the watcher was started
+    """
+    global _change_stream
+    from pymongo.errors import PyMongoError
+    from app.models import Attendance
+    bus = get_event_bus()
+    try:
+        _change_stream = Attendance._get_collection().watch(full_document='updateLookup')
+    except PyMongoError as e:
+        print(f"⚠️ Attendance change stream unavailable, using in-process events: {e}")
+        return False
+    bus.local_publishing = False
+    threading.Thread(
+        target=_watch_attendance, args=(bus, _change_stream),
+        name='attendance-change-stream', daemon=True
+    ).start()
+    print("✅ Attendance change stream started")
+    return True
+
+
+def stop_change_stream():
+    """Close the change stream watcher, if running (called on application shutdown)"""
+    global _change_stream
+    if _change_stream is not None:
+        _change_stream.close()
+        _change_stream = None
@@ -0,0 +1,135 @@
+"""
+Request Coalescing
+Single-flight for read endpoints: concurrent identical requests share one
+in-flight controller call and one encoded response body
+"""
+import asyncio
+from urllib.parse import urlencode
+
+from config import get_settings
+from .responses import EncodedResult
+
+
+class RequestCoalescer:
+    """
+    Registry of in-flight read calls, keyed by request
+
+    The first request for a key (the leader) starts the call; requests with
+    the same key arriving before it finishes await the same task instead of
+    querying again. Nothing is kept once the call completes. A request can
+    still join a call that started before a write it has already seen, so
+    endpoints with validators put the collection state behind their ETag
+    in the key (see coalesce()): a body is then never shared with a
+    request holding a newer ETag.
+    State is per worker process and per event loop.
+    """
+
+    def __init__(self, ignored_params=()):
+        self.ignored_params = frozenset(ignored_params)
+        self._in_flight = {}  # key -> asyncio.Task
+        self.executed = {}  # label -> calls started by a leader
+        self.coalesced = {}  # label -> requests that joined a leader's call
+
+    def request_key(self, request):
+        """
+        Key of a request: method, path and sorted query parameters
+
+        Parameters listed in COALESCE_IGNORED_PARAMS (e.g. cache busters)
+        are left out, so requests differing only in those still coalesce.
+        """
+        params = sorted(
+            (name, value) for name, value in request.query_params.multi_items()
+            if name not in self.ignored_params
+        )
+        return f"{request.method} {request.url.path}?{urlencode(params)}"
+
+    async def run(self, key, call, label=''):
+        """
+        Await call(), or the identical call already in flight
+
+        Args:
+            key (str): Identity of the call; equal keys must mean equal results
+            call (callable): Coroutine function producing the result
+            label (str): Metrics label, e.g. the route template
+
+        Returns:
+            object: The call's result; successful controller results are
+                shared as EncodedResult, whose body is encoded once for
+                every waiter
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._execute(call))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+            self.executed[label] = self.executed.get(label, 0) + 1
+        else:
+            self.coalesced[label] = self.coalesced.get(label, 0) + 1
+        # Shielded so one client disconnecting doesn't cancel everyone's call
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _execute(call):
+        result = await call()
+        if isinstance(result, dict) and result.get('success'):
+            return EncodedResult(result)
+        return result
+
+    def _finished(self, key, task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark a failure as retrieved even if every waiter went away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self):
+        """Calls executed and requests coalesced per label, and calls in flight"""
+        return {
+            'in_flight': len(self._in_flight),
+            'executed': dict(self.executed),
+            'coalesced': dict(self.coalesced)
+        }
+
+
+_request_coalescer = None
+
+
+def get_request_coalescer():
+    """
+    Get the process-wide coalescer, creating it from settings on first use
+
+    Returns:
+        RequestCoalescer or None: None when COALESCE_ENABLED is false
+    """
+    global _request_coalescer
+    settings = get_settings()
+    if _request_coalescer is None and settings.COALESCE_ENABLED:
+        ignored = [name.strip() for name in settings.COALESCE_IGNORED_PARAMS.split(',') if name.strip()]
+        _request_coalescer = RequestCoalescer(ignored)
+    return _request_coalescer
+
+
+async def coalesce(request, call):
+    """
+    Run a read endpoint's controller call through the coalescer
+
+    Args:
+        request: Incoming request; its method, path and query form the key,
+            with the collection state conditional_get() based its ETag on
+        call (callable): Coroutine function returning the controller result,
+            e.g. lambda: call_cached(('users',), EmployeeController.get_all_employees)
+
+    Returns:
+        dict: The controller result
+    """
+    coalescer = get_request_coalescer()
+    if coalescer is None:
+        return await call()
+    route = request.scope.get('route')
+    label = route.path if route is not None else request.url.path
+    key = coalescer.request_key(request)
+    # Only requests that saw the same state (and so sent the same ETag) share a body
+    collection_state = getattr(request.state, 'collection_state', None)
+    if collection_state:
+        key = f"{key} {collection_state}"
+    return await coalescer.run(key, call, label)
@@ -0,0 +1,116 @@
+"""
+Conditional Requests
+ETag / Last-Modified validators for read endpoints, derived from the newest
+updated_at and the document count of the collections a response reads
+"""
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Response
+from mongoengine.connection import get_db
+
+from .coalescing import get_request_coalescer
+from .executor import run_sync
+
+
+def collection_state(collection_names):
+    """
+    Newest updated_at and document count of each collection
+
+    Uses the updated_at index (one key, no documents loaded) and the
+    collection's metadata count, so the cost does not grow with its size.
+
+    Returns:
+        list: (latest updated_at or None, count) per collection
+    """
+    db = get_db()
+    states = []
+    for name in collection_names:
+        collection = db[name]
+        latest = collection.find_one({}, {'_id': 0, 'updated_at': 1}, sort=[('updated_at', -1)])
+        states.append((latest.get('updated_at') if latest else None, collection.estimated_document_count()))
+    return states
+
+
+def state_tag(states):
+    """Compact text form of a collection_state() snapshot"""
+    return '|'.join(f'{latest.isoformat() if latest else "-"}:{count}' for latest, count in states)
+
+
+def build_validators(states, request):
+    """
+    ETag and Last-Modified for a response
+
+    Args:
+        states (list): collection_state() result
+        request: Incoming request; its path and query are part of the ETag
+
+    Returns:
+        tuple: (ETag header value, Last-Modified datetime or None)
+    """
+    parts = [request.url.path, str(sorted(request.query_params.multi_items())), state_tag(states)]
+    etag = 'W/"' + hashlib.sha1('|'.join(parts).encode()).hexdigest() + '"'
+    modified = [latest for latest, _ in states if latest is not None]
+    last_modified = max(modified).replace(microsecond=0, tzinfo=timezone.utc) if modified else None
+    return etag, last_modified
+
+
+def is_not_modified(request, etag, last_modified):
+    """
+    Check If-None-Match, or If-Modified-Since when there is no ETag
+
+    Last-Modified only tracks the newest updated_at, which a delete leaves
+    unchanged; the ETag also covers document counts. With an ETag,
+    If-Modified-Since is therefore ignored, or clients would get 304 for
+    lists that still contain deleted documents.
+    """
+    if_none_match = request.headers.get('if-none-match')
+    if etag is not None:
+        if if_none_match is None:
+            return False
+        candidates = [value.strip() for value in if_none_match.split(',')]
+        weak = etag[2:] if etag.startswith('W/') else etag
+        return '*' in candidates or any(
+            (value[2:] if value.startswith('W/') else value) == weak for value in candidates
+        )
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since and last_modified is not None:
+        try:
+            return last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+async def conditional_get(request, collection_names):
+    """
+    Validate a conditional GET before doing the real read
+
+    Args:
+        request: Incoming request
+        collection_names (tuple): Collections the response is read from
+
+    Returns:
+        tuple: (body-less 304 Response if the client's copy is still
+            current, else None; ETag/Last-Modified headers for the response)
+    """
+    coalescer = get_request_coalescer()
+    if coalescer is None:
+        states = await run_sync(collection_state, collection_names)
+    else:
+        # Every concurrent read of these collections needs the same state
+        states = await coalescer.run(
+            f"collection_state:{','.join(collection_names)}",
+            lambda: run_sync(collection_state, collection_names),
+            'collection_state'
+        )
+    # The snapshot behind the ETag, for keying shared work on the same state
+    request.state.collection_state = state_tag(states)
+    etag, last_modified = build_validators(states, request)
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+    if last_modified is not None:
+        headers['Last-Modified'] = format_datetime(last_modified, usegmt=True)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers), headers
+    return None, headers
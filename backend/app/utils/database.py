@@ -2,8 +2,34 @@
 Database Connection Manager
 Handles MongoDB connection setup and teardown
 """
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from mongoengine import connect, disconnect
+from mongoengine.connection import get_connection
+from config import get_settings
+from .metrics import mongo_event_listeners
+
+
+def mongo_client_options():
+    """
+    Pool size and timeout options for the PyMongo and Motor clients
+    
+    Returns:
+        dict: Keyword arguments for MongoClient/AsyncIOMotorClient
+    """
+    settings = get_settings()
+    return {
+        'maxPoolSize': settings.MONGO_MAX_POOL_SIZE,
+        'minPoolSize': settings.MONGO_MIN_POOL_SIZE,
+        # PyMongo takes None (not 0) for "no timeout"
+        'maxIdleTimeMS': settings.MONGO_MAX_IDLE_TIME_MS or None,
+        'waitQueueTimeoutMS': settings.MONGO_WAIT_QUEUE_TIMEOUT_MS or None,
+        'connectTimeoutMS': settings.MONGO_CONNECT_TIMEOUT_MS,
+        'socketTimeoutMS': settings.MONGO_SOCKET_TIMEOUT_MS or None,
+        'serverSelectionTimeoutMS': settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        'event_listeners': mongo_event_listeners()
+    }
 
 
 def connect_database():
@@ -14,7 +40,7 @@ def connect_database():
     try:
         mongodb_uri = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/hrms')
         print(f"🔗 Attempting to connect to MongoDB with URI: {mongodb_uri}")
-        connect(host=mongodb_uri, serverSelectionTimeoutMS=5000)
+        connect(host=mongodb_uri, **mongo_client_options())
         print(f"✅ Connected to MongoDB")
         return True
     except Exception as e:
@@ -34,3 +60,148 @@ def disconnect_database():
     except Exception as e:
         print(f"⚠️ Error disconnecting from MongoDB: {str(e)}")
         return False
+
+
+def ensure_model_indexes():
+    """
+    Create the indexes declared in the Documents' meta
+    
+    Runtime auto-creation is disabled on the models, so this is only for
+    scripts seeding a fresh database; deploys run app.commands.manage_indexes.
+    """
+    from app.models import User, Attendance, AttendanceRollup
+    try:
+        for model in (User, Attendance, AttendanceRollup):
+            model.ensure_indexes()
+        return True
+    except Exception as e:
+        print(f"❌ Failed to create indexes: {str(e)}")
+        return False
+
+
+def ping_database():
+    """Round-trip to MongoDB on the MongoEngine client; raises if unreachable"""
+    get_connection().admin.command('ping')
+
+
+def warm_up_database():
+    """
+    Open the minimum pool and check indexes before the worker takes traffic
+    
+    The client connects lazily, so without this the first requests after a
+    deploy or scale-out pay for server selection and TLS handshakes.
+    Concurrent pings make the pool open several connections at once;
+    PyMongo's pool maintenance tops it up to MONGO_MIN_POOL_SIZE afterwards.
+    app.commands.manage_indexes builds the indexes at deploy time; here
+    only missing unique indexes (the duplicate checks) are built, and other
+    missing ones are logged.
+    
+    Returns:
+        bool: True if the database answered and every unique index exists
+    """
+    from .indexes import check_model_indexes, ensure_unique_indexes
+    connections = max(1, get_settings().MONGO_MIN_POOL_SIZE)
+    try:
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            list(pool.map(lambda _: ping_database(), range(connections)))
+        print(f"✅ Warmed up MongoDB connection pool ({connections} connections)")
+        unique_enforced = ensure_unique_indexes()
+        check_model_indexes()
+        return unique_enforced
+    except Exception as e:
+        print(f"❌ MongoDB warm-up failed: {str(e)}")
+        return False
+
+
+def supports_transactions(client):
+    """
+    Check if a client is connected to a deployment with multi-document transactions
+    
+    Transactions need a replica set or sharded cluster; standalone servers
+    (and in-process stand-in clients) report False.
+    
+    Args:
+        client: PyMongo MongoClient or Motor AsyncIOMotorClient
+    """
+    description = getattr(client, 'topology_description', None)
+    return description is not None and description.topology_type_name in ('ReplicaSetWithPrimary', 'Sharded')
+
+
+# Native async (Motor) client, only created when DATA_BACKEND=motor
+_async_client = None
+_async_database = None
+
+
+def connect_async_database(client=None):
+    """
+    Create the Motor client used by the async repositories
+    
+    Args:
+        client: Optional pre-built async client (e.g. an in-process
+            mongomock-motor client for tests); defaults to a Motor client
+            for MONGODB_URI
+        
+    Returns:
+        bool: True if the client was created
+    """
+    global _async_client, _async_database
+    try:
+        if client is None:
+            from motor.motor_asyncio import AsyncIOMotorClient
+            mongodb_uri = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/hrms')
+            client = AsyncIOMotorClient(mongodb_uri, **mongo_client_options())
+        _async_client = client
+        # Same fallback database name as MongoEngine so both backends share
+        # data; indexing by name keeps stand-in clients on their async wrapper
+        database_name = client.get_default_database(default='test').name
+        _async_database = client[database_name]
+        print("✅ Async MongoDB client ready")
+        return True
+    except Exception as e:
+        print(f"❌ Failed to create async MongoDB client: {str(e)}")
+        return False
+
+
+def get_async_database():
+    """
+    Get the database handle for the async repositories
+    
+    Raises:
+        RuntimeError: If connect_async_database() has not been called
+    """
+    if _async_database is None:
+        raise RuntimeError("Async database is not connected")
+    return _async_database
+
+
+async def ping_async_database():
+    """Round-trip to MongoDB on the Motor client; raises if unreachable"""
+    await get_async_database().command('ping')
+
+
+async def warm_up_async_database():
+    """
+    Open the Motor client's minimum pool with concurrent pings
+    
+    Returns:
+        bool: True if the database answered
+    """
+    connections = max(1, get_settings().MONGO_MIN_POOL_SIZE)
+    try:
+        await asyncio.gather(*(ping_async_database() for _ in range(connections)))
+    except Exception as e:
+        print(f"❌ Async MongoDB warm-up failed: {str(e)}")
+        return False
+    print(f"✅ Warmed up async MongoDB connection pool ({connections} connections)")
+    return True
+
+
+def disconnect_async_database():
+    """Close the Motor client, if one was created"""
+    global _async_client, _async_database
+    if _async_client is not None:
+        _async_client.close()
+        _async_client = None
+        _async_database = None
+        print("✅ Disconnected async MongoDB client")
+    return True
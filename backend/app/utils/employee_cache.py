@@ -0,0 +1,152 @@
+"""
+Employee Cache
+Bounded in-process LRU/TTL cache of the employees that attendance records
+reference, looked up by Mongo _id when listings and events are serialized,
+and invalidated by employee_id when the employee controllers update or
+delete one
+
+Each worker has its own cache and only sees its own invalidations, so an
+entry can outlive an update or delete made on another worker by up to
+EMPLOYEE_CACHE_TTL. It is therefore only used to fill employee fields into
+serialized attendance records; lookups that decide a write or return the
+employee itself (mark_attendance, get_employee_by_id, ...) read MongoDB.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from config import get_settings
+
+
+class EmployeeCache:
+    """
+    Thread-safe LRU cache of raw users documents with a time-to-live
+
+    Entries are the documents as stored in MongoDB, so both the MongoEngine
+    and the async backend can share them. Callers get a copy on every hit.
+    """
+
+    def __init__(self, max_size, ttl_seconds, enabled=True):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._entries = OrderedDict()  # employee_id -> (expires_at, document)
+        self._by_pk = {}  # _id -> employee_id
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_by_pk(self, pk):
+        """Cached document for a Mongo _id, or None"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._lookup(self._by_pk.get(pk))
+
+    def put(self, document):
+        """Cache a complete users document"""
+        if not self.enabled:
+            return
+        with self._lock:
+            employee_id = document['employee_id']
+            if employee_id in self._entries:
+                self._remove(employee_id)
+            self._entries[employee_id] = (time.monotonic() + self.ttl_seconds, dict(document))
+            self._by_pk[document['_id']] = employee_id
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, employee_id):
+        """Drop an employee after it was updated or deleted"""
+        with self._lock:
+            if employee_id in self._entries:
+                self._remove(employee_id)
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+            self._by_pk.clear()
+
+    def stats(self):
+        """Hit/miss/eviction counters and current size"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+    def _lookup(self, employee_id):
+        """Fetch a live entry and count the hit/miss (lock must be held)"""
+        entry = self._entries.get(employee_id) if employee_id is not None else None
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._remove(employee_id)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(employee_id)
+        self.hits += 1
+        return dict(entry[1])
+
+    def _remove(self, employee_id):
+        """Remove an entry and its _id mapping (lock must be held)"""
+        _, document = self._entries.pop(employee_id)
+        self._by_pk.pop(document['_id'], None)
+
+
+_employee_cache = None
+
+
+def get_employee_cache():
+    """Get the process-wide employee cache, creating it from settings on first use"""
+    global _employee_cache
+    if _employee_cache is None:
+        settings = get_settings()
+        _employee_cache = EmployeeCache(
+            max_size=settings.EMPLOYEE_CACHE_SIZE,
+            ttl_seconds=settings.EMPLOYEE_CACHE_TTL,
+            enabled=settings.EMPLOYEE_CACHE_ENABLED
+        )
+    return _employee_cache
+
+
+def find_employee_documents(pks):
+    """
+    Look up several raw users documents by _id, querying only the ones not cached
+
+    Returns:
+        dict: _id -> users document (ids of deleted employees are absent)
+    """
+    from app.models import User
+    cache = get_employee_cache()
+    documents = {}
+    missing = []
+    for pk in pks:
+        document = cache.get_by_pk(pk)
+        if document is not None:
+            documents[pk] = document
+        else:
+            missing.append(pk)
+    if missing:
+        for document in User._get_collection().find({'_id': {'$in': missing}}):
+            cache.put(document)
+            documents[document['_id']] = document
+    return documents
+
+
+def find_employees_by_pk(pks):
+    """
+    Look up several Users by _id, querying only the ones not cached
+
+    Returns:
+        dict: _id -> User (ids of deleted employees are absent)
+    """
+    from app.models import User
+    return {pk: User._from_son(document) for pk, document in find_employee_documents(pks).items()}
@@ -5,7 +5,7 @@ Creates consistent response format for success and error cases
 from fastapi import status
 
 
-def success_response(message, data=None, status_code=status.HTTP_200_OK):
+def success_response(message, data=None, status_code=status.HTTP_200_OK, **meta):
     """
     Create a standardized success response
     
@@ -13,6 +13,7 @@ def success_response(message, data=None, status_code=status.HTTP_200_OK):
         message (str): Success message
         data (any): Response data (optional)
         status_code (int): HTTP status code
+        **meta: Extra envelope fields, e.g. next_cursor for paged lists
         
     Returns:
         dict: Standardized success response
@@ -21,7 +22,8 @@ def success_response(message, data=None, status_code=status.HTTP_200_OK):
         'success': True,
         'message': message,
         'status_code': status_code,
-        'data': data
+        'data': data,
+        **meta
     }
 
 
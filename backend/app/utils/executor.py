@@ -0,0 +1,154 @@
+"""
+Blocking I/O Executor
+Runs synchronous controller calls (MongoEngine/PyMongo I/O) on a bounded
+thread pool so they never block the event loop
+"""
+import asyncio
+import contextvars
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+
+from config import get_settings
+
+
+# Per-request accumulator for time spent waiting on the pool, set by
+# QueueWaitMiddleware and filled in by every run_sync() call of that request
+_queue_wait = ContextVar('executor_queue_wait', default=None)
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when the executor queue is full and the policy is 'reject'"""
+
+
+class BoundedExecutor:
+    """
+    Thread pool with a bounded admission queue
+
+    At most max_workers calls run at once and at most queue_size more wait
+    for a free thread. When both are taken, new calls are either rejected
+    (ExecutorSaturatedError) or held until a slot frees, depending on
+    reject_policy ("reject" or "wait").
+    """
+
+    def __init__(self, max_workers, queue_size, reject_policy="reject"):
+        if reject_policy not in ("reject", "wait"):
+            raise ValueError(f"Unknown executor reject policy: {reject_policy}")
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.reject_policy = reject_policy
+        self.capacity = max_workers + queue_size
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hrms-io")
+        self._slots = asyncio.Semaphore(self.capacity)
+        self.in_flight = 0
+        self.rejected = 0
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) on the pool and await its result
+
+        Returns:
+            any: Whatever func returns
+
+        Raises:
+            ExecutorSaturatedError: Queue is full and policy is 'reject'
+        """
+        if self.reject_policy == "reject" and self._slots.locked():
+            self.rejected += 1
+            raise ExecutorSaturatedError(
+                f"Server busy: {self.capacity} requests already queued"
+            )
+
+        await self._slots.acquire()
+        self.in_flight += 1
+        try:
+            submitted_at = time.perf_counter()
+            # Run in a copy of the caller's context so per-request state
+            # (e.g. MongoDB time tracking) is visible on the worker thread
+            context = contextvars.copy_context()
+            call = functools.partial(context.run, _timed_call, submitted_at, func, *args, **kwargs)
+            loop = asyncio.get_running_loop()
+            queue_wait, result = await loop.run_in_executor(self._pool, call)
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+        holder = _queue_wait.get()
+        if holder is not None:
+            holder.append(queue_wait)
+        return result
+
+    def stats(self):
+        """Snapshot of pool occupancy counters"""
+        return {
+            'max_workers': self.max_workers,
+            'queue_size': self.queue_size,
+            'in_flight': self.in_flight,
+            'rejected': self.rejected
+        }
+
+    def shutdown(self):
+        """Stop accepting work and wait for running calls to finish"""
+        self._pool.shutdown(wait=True)
+
+
+def _timed_call(submitted_at, func, *args, **kwargs):
+    """Worker-side wrapper: measure how long the call sat in the queue"""
+    queue_wait = time.perf_counter() - submitted_at
+    return queue_wait, func(*args, **kwargs)
+
+
+_executor = None
+
+
+def get_executor():
+    """Get the process-wide executor, creating it from settings on first use"""
+    global _executor
+    if _executor is None:
+        settings = get_settings()
+        _executor = BoundedExecutor(
+            max_workers=settings.EXECUTOR_MAX_WORKERS,
+            queue_size=settings.EXECUTOR_QUEUE_SIZE,
+            reject_policy=settings.EXECUTOR_REJECT_POLICY
+        )
+    return _executor
+
+
+async def run_sync(func, *args, **kwargs):
+    """Run a blocking callable on the shared executor"""
+    return await get_executor().run(func, *args, **kwargs)
+
+
+async def iterate_sync(iterator):
+    """
+    Drive a blocking iterator from async code, one next() per executor call
+    
+    Used for streaming responses whose chunks come from database cursors.
+    """
+    exhausted = object()
+    while True:
+        item = await run_sync(next, iterator, exhausted)
+        if item is exhausted:
+            return
+        yield item
+
+
+def shutdown_executor():
+    """Shut down the shared executor (called on application shutdown)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+
+
+def start_queue_wait_tracking():
+    """
+    Begin collecting queue-wait samples for the current request
+
+    Returns:
+        list: Queue-wait durations in seconds, appended as calls complete
+    """
+    holder = []
+    _queue_wait.set(holder)
+    return holder
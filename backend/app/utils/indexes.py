@@ -0,0 +1,256 @@
+"""
+Index Management
+Diffs the indexes declared in the Documents' meta against those that exist
+in MongoDB, builds the missing ones and, on request, drops the ones a
+declared index makes redundant. Runtime auto-creation is disabled on the models; deploys
+run app.commands.manage_indexes instead, and workers only build the unique
+indexes the duplicate checks rely on when a database lacks them.
+"""
+
+
+def _managed_models():
+    from app.models import User, Attendance, AttendanceRollup
+    return (User, Attendance, AttendanceRollup)
+
+
+def _normalize_key(key, weights=None):
+    """
+    Comparable form of an index key pattern
+
+    Text indexes are stored as _fts/_ftsx keys with the indexed fields in
+    weights; both forms normalize to (field, 'text') entries.
+    """
+    normalized = []
+    for field, direction in key:
+        if field == '_fts':
+            normalized.extend((text_field, 'text') for text_field in sorted(weights or {}))
+        elif field != '_ftsx':
+            normalized.append((field, direction))
+    return tuple(normalized)
+
+
+def _is_plain(key):
+    """True for ascending/descending keys (no text, hashed or geo parts)"""
+    return all(direction in (1, -1) for _, direction in key)
+
+
+def _reversed(key):
+    return tuple((field, -direction) for field, direction in key)
+
+
+def _describe(key):
+    return ", ".join(f"{field} {direction}" for field, direction in key)
+
+
+def _covering_index(existing, declared):
+    """
+    Declared index that makes an existing (undeclared) index unnecessary
+
+    A non-unique index is covered by a declared index that starts with the
+    same keys, in either direction. A unique index is covered by a declared
+    unique index on the same fields, which enforces the same constraint.
+    Partial, sparse and TTL indexes are never treated as covered.
+
+    Returns:
+        dict: The covering declared entry, or None
+    """
+    info = existing['info']
+    if any(option in info for option in ('partialFilterExpression', 'expireAfterSeconds')) or info.get('sparse'):
+        return None
+    key = existing['key']
+    if not _is_plain(key):
+        return None
+    for entry in declared:
+        if not _is_plain(entry['key']):
+            continue
+        if info.get('unique'):
+            if entry['unique'] and {field for field, _ in entry['key']} == {field for field, _ in key}:
+                return entry
+        elif entry['key'][:len(key)] in (key, _reversed(key)):
+            return entry
+    return None
+
+
+def _create_index(collection, spec):
+    """Build one index from a MongoEngine index spec; returns its name"""
+    options = {name: value for name, value in spec.items() if name not in ('fields', 'cls')}
+    # Ignored by MongoDB 4.2+, whose builds only lock briefly at start and end
+    return collection.create_index(spec['fields'], background=True, **options)
+
+
+def index_sizes(collection):
+    """
+    Size in bytes of each index of a collection
+
+    Returns:
+        dict: Index name -> bytes (empty if the server doesn't report sizes)
+    """
+    try:
+        stats = next(collection.aggregate([{'$collStats': {'storageStats': {}}}]), {})
+        return dict(stats.get('storageStats', {}).get('indexSizes', {}))
+    except Exception:
+        return {}
+
+
+def plan_indexes(model):
+    """
+    Compare a Document's declared indexes with the collection's
+
+    Args:
+        model: MongoEngine Document class
+
+    Returns:
+        dict: collection, missing (specs to build), redundant/extra
+            (existing indexes to drop or review), conflicts (same keys,
+            different options), warnings, and sizes in bytes
+    """
+    collection = model._get_collection()
+    declared = [{
+        'key': _normalize_key(spec['fields']),
+        'unique': bool(spec.get('unique')),
+        'sparse': bool(spec.get('sparse')),
+        'spec': spec
+    } for spec in model._meta['index_specs']]
+    existing = [{
+        'name': name,
+        'key': _normalize_key(info['key'], info.get('weights')),
+        'info': info
+    } for name, info in collection.index_information().items() if name != '_id_']
+
+    by_key = {index['key']: index for index in existing}
+    plan = {
+        'collection': collection.name,
+        'missing': [],
+        'redundant': [],
+        'extra': [],
+        'conflicts': [],
+        'warnings': [],
+        'sizes': index_sizes(collection)
+    }
+    for entry in declared:
+        current = by_key.get(entry['key'])
+        if current is None:
+            plan['missing'].append(entry['spec'])
+        elif (bool(current['info'].get('unique')), bool(current['info'].get('sparse'))) != (entry['unique'], entry['sparse']):
+            plan['conflicts'].append(
+                f"{current['name']} exists with different options than declared ({_describe(entry['key'])})"
+            )
+        # A non-unique declared index that prefixes another only costs writes
+        for other in declared:
+            if (other is not entry and not entry['unique'] and _is_plain(entry['key'])
+                    and len(other['key']) > len(entry['key'])
+                    and other['key'][:len(entry['key'])] in (entry['key'], _reversed(entry['key']))):
+                plan['warnings'].append(
+                    f"declared index ({_describe(entry['key'])}) is a prefix of ({_describe(other['key'])})"
+                )
+                break
+
+    declared_keys = {entry['key'] for entry in declared}
+    for index in existing:
+        if index['key'] in declared_keys:
+            continue
+        covering = _covering_index(index, declared)
+        if covering:
+            plan['redundant'].append({'name': index['name'], 'covered_by': _describe(covering['key'])})
+        else:
+            plan['extra'].append({'name': index['name'], 'key': _describe(index['key'])})
+    return plan
+
+
+def apply_index_plan(model, plan, build=True, drop_redundant=False, drop_extra=False, log=print):
+    """
+    Build missing indexes and/or drop redundant ones
+
+    Drops are a separate, explicit step: old workers may still be running
+    queries planned for an index when the build runs. Nothing is dropped
+    while a declared index is still missing, so a unique constraint moving
+    to a new index is never unenforced in between.
+
+    Args:
+        model: MongoEngine Document class the plan was made for
+        plan (dict): Result of plan_indexes(model)
+        build (bool): Build the missing indexes
+        drop_redundant (bool): Drop indexes a declared index covers
+        drop_extra (bool): Also drop undeclared indexes nothing covers
+        log (callable): Progress output
+
+    Returns:
+        dict: Names of the indexes created and dropped
+    """
+    collection = model._get_collection()
+    created = []
+    if build:
+        for spec in plan['missing']:
+            name = _create_index(collection, spec)
+            log(f"  + {plan['collection']}.{name}")
+            created.append(name)
+
+    dropped = []
+    to_drop = (plan['redundant'] if drop_redundant else []) + (plan['extra'] if drop_extra else [])
+    if to_drop and plan['missing'] and not build:
+        log(f"  ! {plan['collection']}: not dropping anything until the missing indexes are built")
+        to_drop = []
+    for index in to_drop:
+        collection.drop_index(index['name'])
+        log(f"  - {plan['collection']}.{index['name']}")
+        dropped.append(index['name'])
+    return {'created': created, 'dropped': dropped}
+
+
+def check_model_indexes(log=print):
+    """
+    Report declared indexes missing from the database, without building them
+
+    Returns:
+        bool: True if every declared index exists
+    """
+    missing = []
+    for model in _managed_models():
+        plan = plan_indexes(model)
+        missing += [f"{plan['collection']}({_describe(spec['fields'])})" for spec in plan['missing']]
+    if missing:
+        log(f"⚠️ Missing indexes (run python -m app.commands.manage_indexes --apply): {'; '.join(missing)}")
+    return not missing
+
+
+def ensure_unique_indexes(log=print):
+    """
+    Build the declared unique indexes a database lacks
+
+    Duplicate employee ids/emails and a second attendance record for the
+    same day are rejected by these indexes, not by a read beforehand, so a
+    worker must not take writes without them (e.g. on a fresh development
+    database that never ran manage_indexes). Other missing indexes only
+    cost speed and are left to manage_indexes.
+
+    A build fails when the collection already holds duplicates, and a
+    non-unique index on the same keys is never replaced here: both need
+    a migration (app.commands.migrate_attendance_unique for attendance).
+
+    Returns:
+        bool: True if every declared unique index exists
+    """
+    enforced = True
+    for model in _managed_models():
+        collection = model._get_collection()
+        existing = {
+            _normalize_key(info['key'], info.get('weights')): bool(info.get('unique'))
+            for name, info in collection.index_information().items() if name != '_id_'
+        }
+        for spec in model._meta['index_specs']:
+            if not spec.get('unique'):
+                continue
+            key = _normalize_key(spec['fields'])
+            if existing.get(key):
+                continue
+            if key in existing:
+                log(f"❌ {collection.name}({_describe(key)}) is indexed but not unique; migrate it before serving writes")
+                enforced = False
+                continue
+            try:
+                name = _create_index(collection, spec)
+                log(f"✅ Built unique index {collection.name}.{name}")
+            except Exception as e:
+                log(f"❌ Could not build unique index {collection.name}({_describe(key)}): {str(e)}")
+                enforced = False
+    return enforced
@@ -0,0 +1,92 @@
+"""
+Background Jobs
+In-process runner for long maintenance operations, with progress that
+clients poll by job id
+"""
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+# Finished jobs kept for polling; older ones are forgotten first
+JOB_HISTORY = 100
+
+
+class BackgroundJobs:
+    """
+    Registry of jobs running on their own daemon threads
+
+    Jobs don't take a slot on the request executor, so a long cleanup can't
+    starve API calls. State lives in this process only: poll the worker that
+    started the job.
+    """
+
+    def __init__(self, history=JOB_HISTORY):
+        self.history = history
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def start(self, name, target):
+        """
+        Run target(report) in the background, unless a job of that name is running
+
+        Args:
+            name (str): Job kind; only one job per name runs at a time
+            target (callable): Called with report(**progress); its return
+                value becomes the job's result
+
+        Returns:
+            tuple: (job snapshot, True if a new job was started)
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                if job['name'] == name and job['status'] == 'running':
+                    return dict(job), False
+            job = {
+                'id': uuid.uuid4().hex,
+                'name': name,
+                'status': 'running',
+                'progress': {},
+                'result': None,
+                'error': None,
+                'started_at': datetime.utcnow(),
+                'finished_at': None
+            }
+            self._jobs[job['id']] = job
+            self._forget_finished()
+        threading.Thread(target=self._run, args=(job, target), name=f'job-{name}', daemon=True).start()
+        return dict(job), True
+
+    def get(self, job_id):
+        """Snapshot of a job, or None if unknown"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job, progress=dict(job['progress'])) if job else None
+
+    def _run(self, job, target):
+        def report(**progress):
+            with self._lock:
+                job['progress'].update(progress)
+        try:
+            result = target(report)
+            status, error = 'completed', None
+        except Exception as e:
+            result, status, error = None, 'failed', str(e)
+        with self._lock:
+            job.update(status=status, result=result, error=error, finished_at=datetime.utcnow())
+
+    def _forget_finished(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job['status'] != 'running']
+        for job_id in finished[:max(0, len(self._jobs) - self.history)]:
+            del self._jobs[job_id]
+
+
+_background_jobs = None
+
+
+def get_background_jobs():
+    """Get the process-wide background job registry"""
+    global _background_jobs
+    if _background_jobs is None:
+        _background_jobs = BackgroundJobs()
+    return _background_jobs
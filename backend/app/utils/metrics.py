@@ -0,0 +1,207 @@
+"""
+Metrics
+Prometheus metrics for HTTP requests, MongoDB commands, the connection pool
+and the in-process executor and caches, exposed on /metrics
+"""
+import threading
+from contextvars import ContextVar
+
+from prometheus_client import Counter, Histogram, REGISTRY
+from prometheus_client.core import GaugeMetricFamily, CounterMetricFamily
+from pymongo import monitoring
+
+from config import get_settings
+
+# Buckets in seconds; MongoDB commands are usually well under the HTTP ones
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+COMMAND_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1, 5)
+
+HTTP_REQUESTS = Counter(
+    'hrms_http_requests_total', "HTTP requests",
+    ['method', 'route', 'status']
+)
+HTTP_LATENCY = Histogram(
+    'hrms_http_request_duration_seconds', "HTTP request latency",
+    ['method', 'route'], buckets=REQUEST_BUCKETS
+)
+HTTP_DB_TIME = Histogram(
+    'hrms_http_request_db_seconds', "MongoDB command time spent per HTTP request",
+    ['method', 'route'], buckets=REQUEST_BUCKETS
+)
+MONGO_COMMANDS = Counter(
+    'hrms_mongodb_commands_total', "MongoDB commands",
+    ['command', 'collection', 'outcome']
+)
+MONGO_LATENCY = Histogram(
+    'hrms_mongodb_command_duration_seconds', "MongoDB command latency",
+    ['command', 'collection'], buckets=COMMAND_BUCKETS
+)
+
+# Per-request accumulator of MongoDB command time, set by MetricsMiddleware.
+# Executor and Motor threads run in a copy of the request's context, so the
+# listener appends to the request's list from whichever thread ran the command.
+_db_time = ContextVar('mongodb_command_time', default=None)
+
+
+def start_db_time_tracking():
+    """
+    Begin collecting MongoDB command durations for the current request
+
+    Returns:
+        list: Command durations in seconds, appended as commands complete
+    """
+    holder = []
+    _db_time.set(holder)
+    return holder
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """Times every MongoDB command per command name and collection"""
+
+    def __init__(self):
+        self._collections = {}  # (connection, request_id) -> collection
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        if not isinstance(collection, str):
+            collection = ''
+        with self._lock:
+            self._collections[(event.connection_id, event.request_id)] = collection
+
+    def succeeded(self, event):
+        self._record(event, 'success')
+
+    def failed(self, event):
+        self._record(event, 'failure')
+
+    def _record(self, event, outcome):
+        with self._lock:
+            collection = self._collections.pop((event.connection_id, event.request_id), '')
+        seconds = event.duration_micros / 1e6
+        MONGO_COMMANDS.labels(event.command_name, collection, outcome).inc()
+        MONGO_LATENCY.labels(event.command_name, collection).observe(seconds)
+        holder = _db_time.get()
+        if holder is not None:
+            holder.append(seconds)
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Tracks open and checked-out connections per server"""
+
+    def __init__(self):
+        self.open = {}
+        self.checked_out = {}
+        self.checkout_failures = {}
+        self._lock = threading.Lock()
+
+    def _add(self, counts, address, delta):
+        with self._lock:
+            key = f'{address[0]}:{address[1]}'
+            counts[key] = counts.get(key, 0) + delta
+
+    def connection_created(self, event):
+        self._add(self.open, event.address, 1)
+
+    def connection_closed(self, event):
+        self._add(self.open, event.address, -1)
+
+    def connection_checked_out(self, event):
+        self._add(self.checked_out, event.address, 1)
+
+    def connection_checked_in(self, event):
+        self._add(self.checked_out, event.address, -1)
+
+    def connection_check_out_failed(self, event):
+        self._add(self.checkout_failures, event.address, 1)
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.checked_out.pop(f'{event.address[0]}:{event.address[1]}', None)
+
+    # Required by the interface; nothing to count
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.open), dict(self.checked_out), dict(self.checkout_failures)
+
+
+class RuntimeCollector:
+    """Gauges read at scrape time: connection pools, executor, caches, coalescing"""
+
+    def __init__(self, pool_listener):
+        self.pool_listener = pool_listener
+
+    def collect(self):
+        from .executor import get_executor
+        from .employee_cache import get_employee_cache
+        from .coalescing import get_request_coalescer
+
+        open_connections, checked_out, failures = self.pool_listener.snapshot()
+        pool_open = GaugeMetricFamily('hrms_mongodb_pool_open_connections', "Open pooled connections", labels=['server'])
+        pool_busy = GaugeMetricFamily('hrms_mongodb_pool_checked_out_connections', "Connections in use", labels=['server'])
+        pool_failed = CounterMetricFamily('hrms_mongodb_pool_checkout_failures', "Failed connection checkouts", labels=['server'])
+        for server, count in open_connections.items():
+            pool_open.add_metric([server], count)
+        for server, count in checked_out.items():
+            pool_busy.add_metric([server], count)
+        for server, count in failures.items():
+            pool_failed.add_metric([server], count)
+        yield from (pool_open, pool_busy, pool_failed)
+
+        executor = get_executor().stats()
+        yield GaugeMetricFamily('hrms_executor_max_workers', "Executor threads", value=executor['max_workers'])
+        yield GaugeMetricFamily('hrms_executor_in_flight', "Calls running or queued on the executor", value=executor['in_flight'])
+        yield CounterMetricFamily('hrms_executor_rejected', "Calls rejected with 503", value=executor['rejected'])
+
+        cache = get_employee_cache().stats()
+        yield GaugeMetricFamily('hrms_employee_cache_entries', "Employee cache entries", value=cache['size'])
+        yield CounterMetricFamily('hrms_employee_cache_hits', "Employee cache hits", value=cache['hits'])
+        yield CounterMetricFamily('hrms_employee_cache_misses', "Employee cache misses", value=cache['misses'])
+        yield CounterMetricFamily('hrms_employee_cache_evictions', "Employee cache evictions", value=cache['evictions'])
+
+        coalescer = get_request_coalescer()
+        if coalescer is not None:
+            coalescing = coalescer.stats()
+            executed = CounterMetricFamily('hrms_coalesce_executed', "Read calls run by a leading request", labels=['route'])
+            coalesced = CounterMetricFamily('hrms_coalesce_coalesced', "Requests that shared an in-flight read call", labels=['route'])
+            for route, count in coalescing['executed'].items():
+                executed.add_metric([route], count)
+            for route, count in coalescing['coalesced'].items():
+                coalesced.add_metric([route], count)
+            yield from (executed, coalesced)
+            yield GaugeMetricFamily('hrms_coalesce_in_flight', "Read calls in flight", value=coalescing['in_flight'])
+
+
+_listeners = None
+
+
+def mongo_event_listeners():
+    """
+    PyMongo event listeners feeding the metrics, shared by every client
+
+    Returns:
+        list: Listeners to pass as event_listeners (empty when METRICS_ENABLED is false)
+    """
+    global _listeners
+    if not get_settings().METRICS_ENABLED:
+        return []
+    if _listeners is None:
+        pool_listener = PoolMetricsListener()
+        REGISTRY.register(RuntimeCollector(pool_listener))
+        _listeners = [CommandMetricsListener(), pool_listener]
+    return _listeners
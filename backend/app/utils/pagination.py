@@ -0,0 +1,173 @@
+"""
+Cursor Pagination
+Keyset pagination helpers shared by the list endpoints
+"""
+import base64
+import json
+from datetime import date, datetime
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from config import get_settings
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def clamp_limit(limit):
+    """
+    Apply the default page size and the configured cap to a requested limit
+    
+    Args:
+        limit (int or None): Requested page size
+        
+    Returns:
+        int: Page size to use
+    """
+    settings = get_settings()
+    if not limit:
+        return settings.DEFAULT_PAGE_SIZE
+    return max(1, min(limit, settings.MAX_PAGE_SIZE))
+
+
+def parse_fields(fields, allowed):
+    """
+    Parse a comma separated fields= projection
+    
+    Args:
+        fields (str or None): e.g. "employee_id,full_name"
+        allowed (iterable): Output fields that may be requested
+        
+    Returns:
+        list or None: Requested fields ('id' always included), or None for all
+        
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(',') if field.strip()]
+    unknown = [field for field in requested if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return ['id'] + [field for field in requested if field != 'id']
+
+
+def encode_cursor(sort_value, object_id):
+    """
+    Encode the position after a row as an opaque cursor
+    
+    Args:
+        sort_value (date, datetime or str): Row's sort key
+        object_id (ObjectId): Row's _id (tie breaker)
+        
+    Returns:
+        str: URL safe cursor
+    """
+    if isinstance(sort_value, str):
+        kind, value = 's', sort_value
+    else:
+        kind = 'dt' if isinstance(sort_value, datetime) else 'd'
+        value = sort_value.isoformat()
+    payload = json.dumps([kind, value, str(object_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor()
+    
+    Returns:
+        tuple: (sort_value, ObjectId)
+        
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        kind, value, object_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        parse = {'dt': datetime.fromisoformat, 'd': date.fromisoformat, 's': str}[kind]
+        return parse(value), ObjectId(object_id)
+    except (ValueError, TypeError, KeyError, InvalidId) as e:
+        raise InvalidCursorError(f"Invalid cursor: {str(e)}")
+
+
+def keyset_filter(sort_field, cursor, direction=-1):
+    """
+    Cursor condition of a keyset page ordered by (sort_field, _id)
+    
+    Date sort keys are compared as the midnight datetimes MongoDB stores.
+    
+    Args:
+        direction (int): -1 for descending pages, 1 for ascending
+    
+    Returns:
+        dict: Filter selecting rows after the cursor ({} without a cursor)
+    """
+    if not cursor:
+        return {}
+    sort_value, object_id = decode_cursor(cursor)
+    if isinstance(sort_value, date) and not isinstance(sort_value, datetime):
+        sort_value = datetime(sort_value.year, sort_value.month, sort_value.day)
+    after = '$lt' if direction < 0 else '$gt'
+    return {'$or': [
+        {sort_field: {after: sort_value}},
+        {sort_field: sort_value, '_id': {after: object_id}}
+    ]}
+
+
+def keyset_query(sort_field, query=None, cursor=None, projection=None, direction=-1):
+    """
+    Filter and projection for one keyset page
+    
+    Args:
+        sort_field (str): Field the page is ordered by
+        query (dict): Base filter
+        cursor (str): Cursor returned with the previous page
+        projection (list): Stored fields to load (sort key and _id are added)
+        direction (int): -1 for descending (newest first), 1 for ascending
+        
+    Returns:
+        tuple: (filter dict, projection dict or None)
+    """
+    conditions = [condition for condition in (query, keyset_filter(sort_field, cursor, direction)) if condition]
+    mongo_filter = {'$and': conditions} if len(conditions) > 1 else (conditions[0] if conditions else {})
+    fields = dict.fromkeys(list(projection) + [sort_field], 1) if projection else None
+    return mongo_filter, fields
+
+
+def split_page(documents, limit, sort_field):
+    """
+    Trim the extra look-ahead row fetched by a page query
+    
+    Returns:
+        tuple: (documents, next_cursor or None)
+    """
+    if len(documents) > limit:
+        documents = documents[:limit]
+        last = documents[-1]
+        return documents, encode_cursor(last[sort_field], last['_id'])
+    return documents, None
+
+
+def find_page(collection, sort_field, query=None, cursor=None, limit=None, projection=None, direction=-1):
+    """
+    Fetch one keyset page of raw documents keyed on (sort_field, _id)
+    
+    Args:
+        collection: PyMongo collection
+        sort_field (str): Field the page is ordered by
+        query (dict): Base filter
+        cursor (str): Cursor returned with the previous page
+        limit (int): Requested page size
+        projection (list): Stored fields to load (sort key and _id are added)
+        direction (int): -1 for descending (newest first), 1 for ascending
+        
+    Returns:
+        tuple: (documents, next_cursor or None)
+    """
+    limit = clamp_limit(limit)
+    mongo_filter, fields = keyset_query(sort_field, query, cursor, projection, direction)
+    results = collection.find(mongo_filter, fields).sort([(sort_field, direction), ('_id', direction)]).limit(limit + 1)
+    return split_page(list(results), limit, sort_field)
@@ -0,0 +1,96 @@
+"""
+Readiness
+Database-aware readiness for /ready: a MongoDB ping whose result is reused
+for a few seconds, so frequent probes from load balancers and orchestrators
+don't each cost a round-trip
+"""
+import asyncio
+import time
+from datetime import datetime
+
+from config import get_settings
+from .database import ping_database, ping_async_database, warm_up_database, warm_up_async_database
+
+
+class DatabaseReadiness:
+    """
+    Cached database ping shared by concurrent probes
+
+    A worker is ready once its warm-up has succeeded and MongoDB answers.
+    If the database was down at startup, the first successful ping runs the
+    warm-up before the worker reports ready.
+    """
+
+    def __init__(self, cache_seconds, timeout_seconds, use_async_client=False):
+        self.cache_seconds = cache_seconds
+        self.timeout_seconds = timeout_seconds
+        self.use_async_client = use_async_client
+        self.warmed_up = False
+        self._result = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def check(self):
+        """
+        Readiness of this worker, pinging MongoDB if the cached result is stale
+
+        Returns:
+            dict: ready, warmed_up, latency_ms or error, checked_at
+        """
+        async with self._lock:
+            if self._result is None or time.monotonic() - self._checked_at >= self.cache_seconds:
+                self._result = await self._probe()
+                self._checked_at = time.monotonic()
+            return dict(self._result)
+
+    async def warm_up(self):
+        """
+        Warm up the clients this worker uses
+
+        Runs off the request executor, like the ping: a worker whose executor
+        is busy is still reachable, and must not be reported as down.
+
+        Returns:
+            bool: True if every client warmed up
+        """
+        warmed_up = await asyncio.to_thread(warm_up_database)
+        if warmed_up and self.use_async_client:
+            warmed_up = await warm_up_async_database()
+        self.warmed_up = warmed_up
+        return warmed_up
+
+    async def _probe(self):
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._ping(), self.timeout_seconds)
+            latency_ms = round((time.perf_counter() - started) * 1000, 2)
+            if not self.warmed_up:
+                await self.warm_up()
+            result = {'ready': self.warmed_up, 'latency_ms': latency_ms}
+        except asyncio.TimeoutError:
+            result = {'ready': False, 'error': f"MongoDB ping timed out after {self.timeout_seconds}s"}
+        except Exception as e:
+            result = {'ready': False, 'error': str(e)}
+        return dict(result, warmed_up=self.warmed_up, checked_at=datetime.utcnow().isoformat())
+
+    async def _ping(self):
+        if self.use_async_client:
+            await ping_async_database()
+        else:
+            await asyncio.to_thread(ping_database)
+
+
+_readiness = None
+
+
+def get_readiness():
+    """Get the process-wide readiness probe, creating it from settings on first use"""
+    global _readiness
+    if _readiness is None:
+        settings = get_settings()
+        _readiness = DatabaseReadiness(
+            cache_seconds=settings.READY_CACHE_SECONDS,
+            timeout_seconds=settings.READY_TIMEOUT_SECONDS,
+            use_async_client=settings.use_async_backend()
+        )
+    return _readiness
@@ -0,0 +1,182 @@
+"""
+Response Cache
+Shared cache for read endpoint responses, invalidated by per-collection
+version counters that every write bumps
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from config import get_settings
+from .responses import json_dumps, json_loads
+
+KEY_PREFIX = 'hrms'
+
+
+class MemoryCacheBackend:
+    """
+    In-process backend: cached responses are private to one worker
+
+    Responses are kept in least-recently-used order and capped at
+    max_entries. Keys superseded by a version bump are never read again,
+    so they are evicted from the cold end (or dropped there once expired)
+    instead of waiting for a read. Version counters are kept apart and
+    never evicted: losing one would make old keys current again.
+
+    Args:
+        max_entries (int): Most responses kept at once
+    """
+
+    blocking = False
+
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+        self._values = OrderedDict()  # key -> (expires_at or None, value)
+        self._counters = {}  # key -> int
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._values)
+
+    def get(self, key):
+        with self._lock:
+            if key in self._counters:
+                return str(self._counters[key]).encode()
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            if entry[0] is not None and entry[0] < time.monotonic():
+                del self._values[key]
+                return None
+            self._values.move_to_end(key)
+            return entry[1]
+
+    def get_many(self, keys):
+        return [self.get(key) for key in keys]
+
+    def set(self, key, value, ttl_seconds=None):
+        now = time.monotonic()
+        expires_at = now + ttl_seconds if ttl_seconds else None
+        with self._lock:
+            self._values[key] = (expires_at, value)
+            self._values.move_to_end(key)
+            while self._values:
+                oldest_expires_at = next(iter(self._values.values()))[0]
+                expired = oldest_expires_at is not None and oldest_expires_at < now
+                if not expired and len(self._values) <= self.max_entries:
+                    break
+                self._values.popitem(last=False)
+
+    def incr(self, key):
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+
+class RedisCacheBackend:
+    """
+    Redis backend: cached responses and versions are shared by all workers
+
+    Args:
+        url (str): Redis URL, e.g. redis://localhost:6379/0
+        client: Ready client with the redis-py interface (e.g. fakeredis),
+            used instead of connecting to url
+    """
+
+    blocking = True
+
+    def __init__(self, url=None, client=None):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url)
+        self.client = client
+
+    def get(self, key):
+        return self.client.get(key)
+
+    def get_many(self, keys):
+        return self.client.mget(keys)
+
+    def set(self, key, value, ttl_seconds=None):
+        self.client.set(key, value, ex=ttl_seconds or None)
+
+    def incr(self, key):
+        return self.client.incr(key)
+
+
+class ResponseCache:
+    """
+    Cache of successful controller responses
+
+    Response keys embed the current version of every collection the
+    response was read from. A write bumps those versions, so all older
+    entries become unreachable at once and simply expire.
+    """
+
+    def __init__(self, backend, ttl_seconds):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    def key(self, namespace, collections, params):
+        """Cache key for a response, at the current collection versions"""
+        versions = self.backend.get_many([_version_key(name) for name in collections])
+        version_tag = '.'.join(str(int(version or 0)) for version in versions)
+        digest = hashlib.sha1(json.dumps(params, default=str).encode()).hexdigest()
+        return f'{KEY_PREFIX}:response:{namespace}:{version_tag}:{digest}'
+
+    def get(self, key):
+        """Cached response, or None"""
+        value = self.backend.get(key)
+        return json_loads(value) if value is not None else None
+
+    def set(self, key, response):
+        """Store a response under a key from key()"""
+        self.backend.set(key, json_dumps(response), self.ttl_seconds)
+
+    def bump(self, *collections):
+        """Invalidate every cached response read from these collections"""
+        for name in collections:
+            self.backend.incr(_version_key(name))
+
+
+def _version_key(collection):
+    return f'{KEY_PREFIX}:version:{collection}'
+
+
+_response_cache = None
+
+
+def get_response_cache():
+    """
+    Get the process-wide response cache, creating it from settings on first use
+
+    Returns:
+        ResponseCache or None: None when RESPONSE_CACHE_BACKEND is "none"
+    """
+    global _response_cache
+    settings = get_settings()
+    if _response_cache is None and settings.RESPONSE_CACHE_BACKEND != 'none':
+        if settings.RESPONSE_CACHE_BACKEND == 'redis':
+            backend = RedisCacheBackend(settings.REDIS_URL)
+        elif settings.RESPONSE_CACHE_BACKEND == 'memory':
+            backend = MemoryCacheBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+        else:
+            raise ValueError(f"Unknown response cache backend: {settings.RESPONSE_CACHE_BACKEND}")
+        _response_cache = ResponseCache(backend, settings.RESPONSE_CACHE_TTL)
+    return _response_cache
+
+
+def set_response_cache(cache):
+    """Replace the process-wide response cache (e.g. with a fake-backed one)"""
+    global _response_cache
+    _response_cache = cache
+
+
+def invalidate_responses(*collections):
+    """Bump collection versions after a write; no-op when caching is off"""
+    cache = get_response_cache()
+    if cache is not None:
+        cache.bump(*collections)
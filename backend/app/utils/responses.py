@@ -0,0 +1,69 @@
+"""
+JSON Responses - orjson encoding for API responses
+Encodes controller results in a single pass, including the datetimes,
+dates and ObjectIds that raw serializers leave in place
+"""
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+
+
+def _default(value):
+    """Encode types orjson does not handle natively"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_dumps(content):
+    """
+    Encode content as JSON bytes
+
+    Naive datetimes and dates come out exactly like isoformat(), so the
+    output matches the models' to_dict() strings.
+    """
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def json_loads(data):
+    """Decode JSON produced by json_dumps()"""
+    return orjson.loads(data)
+
+
+class EncodedResult(dict):
+    """
+    Controller result that carries its own JSON encoding
+
+    Coalesced requests share one of these, so the payload is encoded once
+    however many responses send it. Treat it as read-only.
+    """
+
+    def __init__(self, result):
+        super().__init__(result)
+        self.body = json_dumps(result)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson"""
+
+    def render(self, content):
+        if isinstance(content, EncodedResult):
+            return content.body
+        return json_dumps(content)
+
+
+def json_response(result, headers=None):
+    """
+    Wrap a controller result in a FastJSONResponse
+
+    Returning the response object from a route skips FastAPI's
+    jsonable_encoder walk, so the payload is encoded exactly once.
+
+    Args:
+        result (dict): success_response() envelope
+        headers (dict): Extra response headers (optional)
+
+    Returns:
+        FastJSONResponse: Response with the result's status code
+    """
+    return FastJSONResponse(result, status_code=result.get('status_code', 200), headers=headers)
@@ -0,0 +1,74 @@
+"""
+Raw Document Serializers
+Convert raw PyMongo documents into the same JSON shape as the models' to_dict()
+
+Datetimes and dates are left as objects; json_dumps() (orjson) writes them
+in the same ISO format to_dict() produces, without a Python call per value.
+"""
+
+
+def _select(data, fields):
+    """Restrict a serialized row to a fields= projection"""
+    if fields:
+        return {field: data[field] for field in fields}
+    return data
+
+
+def serialize_user(doc, fields=None):
+    """
+    Serialize a raw users document
+    
+    Args:
+        doc (dict): Document as stored in the users collection
+        fields (list): Optional subset of output fields
+        
+    Returns:
+        dict: Same shape as User.to_dict() once JSON encoded
+    """
+    return _select({
+        'id': str(doc['_id']),
+        'employee_id': doc.get('employee_id'),
+        'full_name': doc.get('full_name'),
+        'email': doc.get('email'),
+        'department': doc.get('department'),
+        'role': doc.get('role'),
+        'status': doc.get('status'),
+        'created_at': doc.get('created_at'),
+        'updated_at': doc.get('updated_at')
+    }, fields)
+
+
+def serialize_attendance(doc, employee=None, fields=None):
+    """
+    Serialize a raw attendance document
+    
+    Args:
+        doc (dict): Document as stored in the attendance collection
+        employee (dict): Referenced users document, or None if it was deleted
+        fields (list): Optional subset of output fields
+        
+    Returns:
+        dict: Same shape as Attendance.to_dict() once JSON encoded
+    """
+    if employee is not None:
+        employee_id = employee.get('employee_id')
+        employee_name = employee.get('full_name')
+    else:
+        employee_id = "Unknown"
+        employee_name = "Deleted Employee"
+    
+    # DateField values are stored as midnight datetimes
+    attendance_date = doc.get('attendance_date')
+    
+    return _select({
+        'id': str(doc['_id']),
+        'employee_id': employee_id,
+        'employee_name': employee_name,
+        'attendance_date': attendance_date.date() if attendance_date else None,
+        'is_present': doc.get('is_present'),
+        'check_in_time': doc.get('check_in_time'),
+        'check_out_time': doc.get('check_out_time'),
+        'notes': doc.get('notes'),
+        'created_at': doc.get('created_at'),
+        'updated_at': doc.get('updated_at')
+    }, fields)
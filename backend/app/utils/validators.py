@@ -3,6 +3,7 @@ Input Validators
 Validates user input for employee and attendance data
 """
 import re
+from datetime import datetime
 from email_validator import validate_email, EmailNotValidError
 
 
@@ -16,6 +17,9 @@ def validate_email_format(email):
     Returns:
         tuple: (is_valid: bool, message: str)
     """
+    if not isinstance(email, str):
+        return False, "Email must be a string"
+    
     try:
         validate_email(email)
         return True, None
@@ -89,6 +93,29 @@ def validate_department(department):
     return True, None
 
 
+def validate_role(role):
+    """
+    Validate job role (optional)
+    Must be at most 50 characters
+    
+    Args:
+        role (str): Role to validate, or None for the default
+        
+    Returns:
+        tuple: (is_valid: bool, message: str)
+    """
+    if role is None:
+        return True, None
+    
+    if not isinstance(role, str):
+        return False, "Role must be a string"
+    
+    if len(role) > 50:
+        return False, "Role must be at most 50 characters"
+    
+    return True, None
+
+
 def validate_add_employee_data(employee_data):
     """
     Comprehensive validation for employee creation data
@@ -122,4 +149,28 @@ def validate_add_employee_data(employee_data):
     if not is_valid:
         return False, f"Invalid department: {msg}"
     
+    is_valid, msg = validate_role(employee_data.get('role'))
+    if not is_valid:
+        return False, f"Invalid role: {msg}"
+    
     return True, None
+
+
+def parse_clock_time(value, on_date):
+    """
+    Parse an HH:MM clock time into a datetime on the given date
+    
+    Args:
+        value (str): Time in HH:MM format (may be empty)
+        on_date (date): Date the time belongs to
+        
+    Returns:
+        datetime or None: Combined datetime, or None if missing/invalid
+    """
+    if not value:
+        return None
+    try:
+        time_obj = datetime.strptime(value, '%H:%M').time()
+    except ValueError:
+        return None
+    return datetime.combine(on_date, time_obj)
@@ -0,0 +1,4 @@
+"""
+Benchmarks Package - Performance measurements for HRMS Lite
+Run from the backend directory against a disposable local MongoDB database
+"""
@@ -0,0 +1,118 @@
+"""
+Attendance Range Benchmark
+Response time of one employee's one-month window (from/to) against loading
+that employee's whole multi-year history, through the controller
+
+Usage (from the backend directory, against a disposable database):
+    MONGODB_URI=mongodb://localhost:27017/hrms_bench python -m benchmarks.bench_attendance_range [--years 3] [--employees 50]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('MONGODB_URI', 'mongodb://localhost:27017/hrms_bench')
+
+from app.controllers import AttendanceController
+from app.models import User, Attendance
+from app.utils import connect_database, disconnect_database
+
+PREFIX = "AR"
+
+
+def seed(employees, years):
+    """Insert employees with one attendance record per weekday for years"""
+    started = datetime(2026, 1, 1) - timedelta(days=365 * years)
+    days = [started + timedelta(days=offset) for offset in range(365 * years)]
+    days = [day for day in days if day.weekday() < 5]
+    users = []
+    for index in range(employees):
+        users.append({
+            '_id': ObjectId(),
+            'employee_id': f"{PREFIX}{index:05d}",
+            'full_name': "Bench Person",
+            'email': f"{PREFIX.lower()}{index}@gmail.com",
+            'department': f"Dept {index % 5}",
+            'role': "Engineer",
+            'status': "Active",
+            'created_at': started,
+            'updated_at': started
+        })
+    User._get_collection().insert_many(users)
+    attendance = Attendance._get_collection()
+    for user in users:
+        attendance.insert_many([{
+            'employee_id': user['_id'],
+            'attendance_date': day,
+            'is_present': day.day % 9 != 0,
+            'created_at': day,
+            'updated_at': day
+        } for day in days])
+    return len(days)
+
+
+def timed(call, repeat):
+    """Median and p95 milliseconds of repeat calls"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = call()
+        samples.append((time.perf_counter() - started) * 1000)
+        assert result['success'], result['message']
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1], len(result['data'])
+
+
+def cleanup():
+    """Remove the benchmark's employees and their records"""
+    users = User._get_collection()
+    pks = [user['_id'] for user in users.find({'employee_id': {'$regex': f'^{PREFIX}'}}, {'_id': 1})]
+    Attendance._get_collection().delete_many({'employee_id': {'$in': pks}})
+    users.delete_many({'_id': {'$in': pks}})
+
+
+def main(argv=None):
+    """Seed a multi-year history, then time full and one-month reads"""
+    parser = argparse.ArgumentParser(description="Benchmark attendance date-range reads")
+    parser.add_argument('--years', type=int, default=3, help="Years of history per employee")
+    parser.add_argument('--employees', type=int, default=50, help="Employees to seed")
+    parser.add_argument('--repeat', type=int, default=50, help="Timed calls per query")
+    args = parser.parse_args(argv)
+
+    if not connect_database():
+        return 1
+    try:
+        cleanup()
+        Attendance.ensure_indexes()
+        per_employee = seed(args.employees, args.years)
+        print(f"seeded {args.employees} employees x {per_employee} records")
+
+        employee_id = f"{PREFIX}{args.employees // 2:05d}"
+        full = timed(lambda: AttendanceController.get_employee_attendance(employee_id), args.repeat)
+        month = timed(lambda: AttendanceController.get_employee_attendance(
+            employee_id, date_from="2025-11-01", date_to="2025-11-30"
+        ), args.repeat)
+        print(f"full history: {full[2]:>6} rows  median {full[0]:>8.2f} ms  p95 {full[1]:>8.2f} ms")
+        print(f"one month:    {month[2]:>6} rows  median {month[0]:>8.2f} ms  p95 {month[1]:>8.2f} ms")
+        print(f"speedup:      {full[0] / month[0]:.1f}x")
+
+        plan = Attendance._get_collection().find({
+            'employee_id': User._get_collection().find_one({'employee_id': employee_id})['_id'],
+            'attendance_date': {'$gte': datetime(2025, 11, 1), '$lte': datetime(2025, 11, 30)}
+        }).sort('attendance_date', -1).explain()
+        stats = plan.get('executionStats', {})
+        print(f"month window: {stats.get('totalKeysExamined')} keys / "
+              f"{stats.get('totalDocsExamined')} docs examined")
+        return 0
+    finally:
+        cleanup()
+        disconnect_database()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Employee Import Benchmark
+Compares rows/sec of the bulk import against one add_employee() call per row
+
+Usage (from the backend directory, against a disposable database):
+    MONGODB_URI=mongodb://localhost:27017/hrms_bench python -m benchmarks.bench_employee_import [--rows 10000]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('MONGODB_URI', 'mongodb://localhost:27017/hrms_bench')
+
+from app.controllers import EmployeeController
+from app.models import User
+from app.utils import connect_database, disconnect_database
+
+
+def build_csv(rows, prefix):
+    """Generate an employee CSV with unique ids and emails"""
+    lines = ["employee_id,full_name,email,department,role"]
+    for index in range(rows):
+        lines.append(f"{prefix}{index:06d},Bench Person,{prefix.lower()}{index}@gmail.com,Dept {index % 20},Engineer")
+    return ("\n".join(lines) + "\n").encode()
+
+
+def bench_import(rows):
+    """Rows/sec of EmployeeController.import_employees"""
+    payload = build_csv(rows, "BI")
+    started = time.perf_counter()
+    result = EmployeeController.import_employees(io.BytesIO(payload), 'csv')
+    elapsed = time.perf_counter() - started
+    assert result['success'], result['message']
+    return result['data']['created'], rows / elapsed
+
+
+def bench_single_inserts(rows):
+    """Rows/sec of one add_employee() call per row (the pre-import path)"""
+    started = time.perf_counter()
+    created = 0
+    for index in range(rows):
+        result = EmployeeController.add_employee({
+            'employee_id': f"BS{index:06d}",
+            'full_name': "Bench Person",
+            'email': f"bs{index}@gmail.com",
+            'department': f"Dept {index % 20}",
+            'role': "Engineer"
+        })
+        created += 1 if result['success'] else 0
+    return created, rows / (time.perf_counter() - started)
+
+
+def main(argv=None):
+    """Run both measurements and print a comparison"""
+    parser = argparse.ArgumentParser(description="Benchmark bulk employee import")
+    parser.add_argument('--rows', type=int, default=10000, help="Rows to import")
+    parser.add_argument('--baseline-rows', type=int, default=1000, help="Rows for the per-row baseline")
+    args = parser.parse_args(argv)
+    
+    if not connect_database():
+        return 1
+    try:
+        User.objects(employee_id__startswith="B").delete()
+        created, import_rate = bench_import(args.rows)
+        print(f"bulk import:    {created:>7} rows  {import_rate:>10.1f} rows/sec")
+        created, single_rate = bench_single_inserts(args.baseline_rows)
+        print(f"single inserts: {created:>7} rows  {single_rate:>10.1f} rows/sec")
+        print(f"speedup:        {import_rate / single_rate:.1f}x")
+        return 0
+    finally:
+        User.objects(employee_id__startswith="B").delete()
+        disconnect_database()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
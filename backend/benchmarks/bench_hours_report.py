@@ -0,0 +1,139 @@
+"""
+Worked Hours Report Benchmark
+Times ReportController.get_hours_report over a year of attendance for many
+employees against the 1 second target, and against summing the same
+records in a Python loop
+
+Usage (from the backend directory, against a disposable database):
+    MONGODB_URI=mongodb://localhost:27017/hrms_bench python -m benchmarks.bench_hours_report [--employees 10000] [--days 365]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('MONGODB_URI', 'mongodb://localhost:27017/hrms_bench')
+
+from app.controllers import ReportController
+from app.models import User, Attendance
+from app.utils import connect_database, disconnect_database
+
+PREFIX = "HR"
+TARGET_SECONDS = 1.0
+FIRST_DAY = datetime(2025, 1, 1)
+
+
+def seed(employees, days, batch_size=50000):
+    """Insert employees and one attendance record per employee per weekday"""
+    users = [{
+        '_id': ObjectId(),
+        'employee_id': f"{PREFIX}{index:06d}",
+        'full_name': "Bench Person",
+        'email': f"{PREFIX.lower()}{index}@gmail.com",
+        'department': f"Dept {index % 20}",
+        'role': "Engineer",
+        'status': "Active",
+        'created_at': FIRST_DAY,
+        'updated_at': FIRST_DAY
+    } for index in range(employees)]
+    User._get_collection().insert_many(users)
+
+    attendance = Attendance._get_collection()
+    batch = []
+    inserted = 0
+    for offset in range(days):
+        day = FIRST_DAY + timedelta(days=offset)
+        if day.weekday() >= 5:
+            continue
+        for index, user in enumerate(users):
+            present = (index + offset) % 11 != 0
+            record = {'employee_id': user['_id'], 'attendance_date': day, 'is_present': present}
+            if present:
+                record['check_in_time'] = day + timedelta(hours=8, minutes=40 + (index * 7 + offset) % 45)
+                record['check_out_time'] = day + timedelta(hours=17, minutes=(index * 13 + offset) % 90)
+            batch.append(record)
+            if len(batch) >= batch_size:
+                attendance.insert_many(batch, ordered=False)
+                inserted += len(batch)
+                batch = []
+    if batch:
+        attendance.insert_many(batch, ordered=False)
+        inserted += len(batch)
+    return inserted
+
+
+def python_loop(date_to):
+    """Baseline: stream projected records and sum worked minutes per employee in Python"""
+    worked = {}
+    cursor = Attendance._get_collection().find(
+        {'attendance_date': {'$gte': FIRST_DAY, '$lte': date_to}},
+        {'_id': 0, 'employee_id': 1, 'check_in_time': 1, 'check_out_time': 1}
+    )
+    for record in cursor:
+        if record.get('check_in_time') and record.get('check_out_time'):
+            minutes = (record['check_out_time'] - record['check_in_time']).total_seconds() // 60
+            worked[record['employee_id']] = worked.get(record['employee_id'], 0) + minutes
+    return worked
+
+
+def cleanup():
+    """Remove the benchmark's employees and their records"""
+    users = User._get_collection()
+    pks = [user['_id'] for user in users.find({'employee_id': {'$regex': f'^{PREFIX}'}}, {'_id': 1})]
+    Attendance._get_collection().delete_many({'employee_id': {'$in': pks}})
+    users.delete_many({'_id': {'$in': pks}})
+
+
+def main(argv=None):
+    """Seed the dataset, then time the report"""
+    parser = argparse.ArgumentParser(description="Benchmark the worked hours report")
+    parser.add_argument('--employees', type=int, default=10000, help="Employees to seed")
+    parser.add_argument('--days', type=int, default=365, help="Days of history (weekdays get records)")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed report runs")
+    parser.add_argument('--skip-baseline', action='store_true', help="Don't time the Python loop")
+    args = parser.parse_args(argv)
+
+    if not connect_database():
+        return 1
+    try:
+        cleanup()
+        Attendance.ensure_indexes()
+        started = time.perf_counter()
+        records = seed(args.employees, args.days)
+        print(f"seeded {records} records for {args.employees} employees in {time.perf_counter() - started:.1f}s")
+
+        date_from = FIRST_DAY.date().isoformat()
+        date_to = (FIRST_DAY + timedelta(days=args.days - 1)).date().isoformat()
+        samples = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            result = ReportController.get_hours_report(date_from, date_to)
+            samples.append(time.perf_counter() - started)
+            assert result['success'], result['message']
+        report_seconds = statistics.median(samples)
+        totals = result['data']['totals']
+        print(f"hours report:  median {report_seconds:.3f}s  best {min(samples):.3f}s  "
+              f"({totals['employees']} employees, {totals['records']} records)")
+
+        if not args.skip_baseline:
+            started = time.perf_counter()
+            python_loop(datetime.strptime(date_to, '%Y-%m-%d'))
+            loop_seconds = time.perf_counter() - started
+            print(f"python loop:   {loop_seconds:.3f}s  (worked minutes only)")
+            print(f"speedup:       {loop_seconds / report_seconds:.1f}x")
+
+        passed = report_seconds < TARGET_SECONDS
+        print(f"{'✅' if passed else '❌'} target {TARGET_SECONDS:.1f}s")
+        return 0 if passed else 1
+    finally:
+        cleanup()
+        disconnect_database()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
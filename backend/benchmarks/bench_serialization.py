@@ -0,0 +1,107 @@
+"""
+Response Serialization Benchmark
+Compares rows/sec of encoding an attendance list response the old way
+(Document hydration, to_dict(), jsonable_encoder, stdlib json) against the
+raw serializer + orjson path. No database is needed.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_serialization [--rows 10000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+
+from app.models import User, Attendance
+from app.utils import success_response, serialize_attendance
+from app.utils.responses import json_dumps
+
+
+def build_documents(rows):
+    """Raw attendance and users documents as PyMongo returns them"""
+    employees = {}
+    records = []
+    started = datetime(2026, 1, 1)
+    for index in range(rows):
+        employee_pk = ObjectId()
+        employees[employee_pk] = {
+            '_id': employee_pk,
+            'employee_id': f"EMP{index:06d}",
+            'full_name': "Bench Person",
+            'email': f"bench{index}@gmail.com",
+            'department': f"Dept {index % 20}",
+            'role': "Engineer",
+            'status': "Active",
+            'created_at': started,
+            'updated_at': started
+        }
+        day = started + timedelta(days=index % 365)
+        records.append({
+            '_id': ObjectId(),
+            'employee_id': employee_pk,
+            'attendance_date': day,
+            'is_present': index % 7 != 0,
+            'check_in_time': day + timedelta(hours=9, minutes=index % 30),
+            'check_out_time': day + timedelta(hours=17, minutes=index % 45),
+            'notes': None,
+            'created_at': day + timedelta(hours=9, microseconds=index),
+            'updated_at': day + timedelta(hours=9, microseconds=index)
+        })
+    return records, employees
+
+
+def encode_documents(records, employees):
+    """Previous path: Documents, to_dict(), jsonable_encoder, json.dumps"""
+    users = {pk: User._from_son(doc) for pk, doc in employees.items()}
+    rows = [Attendance._from_son(doc).to_dict(users) for doc in records]
+    content = jsonable_encoder(success_response(f"Retrieved {len(rows)} attendance records", data=rows))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def encode_raw(records, employees):
+    """Current path: raw serializer and one orjson pass"""
+    rows = [serialize_attendance(doc, employees.get(doc['employee_id'])) for doc in records]
+    return json_dumps(success_response(f"Retrieved {len(rows)} attendance records", data=rows))
+
+
+def measure(encode, records, employees, repeat):
+    """Best rows/sec over repeat runs"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encode(records, employees)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return len(records) / best
+
+
+def main(argv=None):
+    """Check both paths agree, then print a comparison"""
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization")
+    parser.add_argument('--rows', type=int, default=10000, help="Rows per response")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per path (best is reported)")
+    args = parser.parse_args(argv)
+
+    records, employees = build_documents(args.rows)
+    if json.loads(encode_documents(records, employees)) != json.loads(encode_raw(records, employees)):
+        print("❌ Serialization paths produce different JSON")
+        return 1
+
+    before = measure(encode_documents, records, employees, args.repeat)
+    after = measure(encode_raw, records, employees, args.repeat)
+    print(f"documents + json: {before:>12.1f} rows/sec")
+    print(f"raw + orjson:     {after:>12.1f} rows/sec")
+    print(f"speedup:          {after / before:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
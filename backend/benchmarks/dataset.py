@@ -0,0 +1,193 @@
+"""
+Synthetic HR Dataset
+Seeds employees across departments with years of weekday attendance whose
+check-in/out times follow realistic distributions. The same arguments and
+seed always produce the same data.
+
+History ends yesterday, so today's attendance can still be marked.
+
+Usage (from the backend directory, against a disposable database):
+    MONGODB_URI=mongodb://localhost:27017/hrms_bench python -m benchmarks.dataset \\
+        --employees 1000 --departments 10 --years 1 [--seed 42] [--drop]
+"""
+import argparse
+import calendar
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from bson import ObjectId
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('MONGODB_URI', 'mongodb://localhost:27017/hrms_bench')
+
+from app.models import User, Attendance, AttendanceRollup
+from app.utils import connect_database, disconnect_database, ensure_model_indexes
+
+FIRST_NAMES = (
+    "Aarav", "Aisha", "Carlos", "Chen", "Daniel", "Elena", "Fatima", "Hiro",
+    "Ines", "James", "Kavya", "Lucas", "Maria", "Noah", "Olga", "Priya",
+    "Rahul", "Sara", "Tomas", "Yara"
+)
+LAST_NAMES = (
+    "Ahmed", "Brown", "Costa", "Dubois", "Garcia", "Ivanova", "Kim", "Kumar",
+    "Lopez", "Mensah", "Nakamura", "Novak", "Okafor", "Patel", "Rossi",
+    "Schmidt", "Silva", "Singh", "Smith", "Wang"
+)
+DEPARTMENTS = (
+    "Engineering", "Sales", "Marketing", "Finance", "Operations", "Support",
+    "Legal", "Design", "Research", "People"
+)
+ROLES = ("Employee", "Engineer", "Analyst", "Manager", "Lead", "Specialist")
+STATUSES = (("Active", 0.9), ("On Leave", 0.05), ("Inactive", 0.05))
+
+# Shape of a working day, in minutes
+CHECK_IN_MEAN = 9 * 60
+CHECK_IN_STDDEV = 15
+SHIFT_MEAN = 8 * 60 + 30
+SHIFT_STDDEV = 40
+ABSENCE_RATE = 0.05
+MISSING_CHECK_OUT_RATE = 0.02
+
+
+def department_names(count):
+    """count department names, numbered once the built-in names run out"""
+    return [
+        DEPARTMENTS[index] if index < len(DEPARTMENTS) else f"Department {index + 1}"
+        for index in range(count)
+    ]
+
+
+def build_employees(count, departments, rng, started):
+    """Employee documents shaped like the User Document stores them"""
+    employees = []
+    for index in range(count):
+        created_at = started + timedelta(minutes=index)
+        # Deterministic ids: creation second plus the employee's index
+        object_id = calendar.timegm(created_at.timetuple()).to_bytes(4, 'big') + index.to_bytes(8, 'big')
+        full_name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        employees.append({
+            '_id': ObjectId(object_id),
+            'employee_id': f"EMP{index:06d}",
+            'full_name': full_name,
+            'full_name_lower': full_name.lower(),
+            'email': f"emp{index:06d}@gmail.com",
+            'department': departments[index % len(departments)],
+            'role': rng.choice(ROLES),
+            'status': rng.choices([name for name, _ in STATUSES], [weight for _, weight in STATUSES])[0],
+            'created_at': created_at,
+            'updated_at': created_at
+        })
+    return employees
+
+
+def attendance_day(employee_pk, day, rng):
+    """One attendance document; present days get check-in/out times"""
+    record = {
+        'employee_id': employee_pk,
+        'attendance_date': day,
+        'is_present': rng.random() >= ABSENCE_RATE,
+        'created_at': day,
+        'updated_at': day
+    }
+    if record['is_present']:
+        check_in = max(6 * 60, int(rng.gauss(CHECK_IN_MEAN, CHECK_IN_STDDEV)))
+        record['check_in_time'] = day + timedelta(minutes=check_in)
+        if rng.random() >= MISSING_CHECK_OUT_RATE:
+            shift = max(60, int(rng.gauss(SHIFT_MEAN, SHIFT_STDDEV)))
+            record['check_out_time'] = day + timedelta(minutes=min(check_in + shift, 23 * 60 + 59))
+        record['updated_at'] = record.get('check_out_time', record['check_in_time'])
+    return record
+
+
+def weekdays(years, last_day):
+    """Midnight datetimes of every weekday in the years up to last_day"""
+    first_day = last_day - timedelta(days=365 * years - 1)
+    days = (first_day + timedelta(days=offset) for offset in range((last_day - first_day).days + 1))
+    return [datetime(day.year, day.month, day.day) for day in days if day.weekday() < 5]
+
+
+def generate(employees, departments, years, seed=42, batch_size=10000, drop=False, log=print):
+    """
+    Seed the dataset into the connected database
+
+    Args:
+        employees (int): Employees to create
+        departments (int): Departments they are spread across
+        years (int): Years of weekday attendance history per employee
+        seed (int): Random seed; the same seed gives the same data
+        batch_size (int): Documents per insert_many
+        drop (bool): Empty users, attendance and rollups first
+        log (callable): Progress output
+
+    Returns:
+        dict: Counts and seconds taken
+    """
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    if drop:
+        for model in (User, Attendance, AttendanceRollup):
+            model._get_collection().delete_many({})
+    ensure_model_indexes()
+
+    days = weekdays(years, date.today() - timedelta(days=1))
+    people = build_employees(employees, department_names(departments), rng, days[0] if days else datetime.utcnow())
+    users = User._get_collection()
+    for start in range(0, len(people), batch_size):
+        users.insert_many(people[start:start + batch_size], ordered=False)
+    log(f"  {len(people)} employees")
+
+    attendance = Attendance._get_collection()
+    batch = []
+    records = 0
+    for index, person in enumerate(people, 1):
+        for day in days:
+            batch.append(attendance_day(person['_id'], day, rng))
+            if len(batch) >= batch_size:
+                attendance.insert_many(batch, ordered=False)
+                records += len(batch)
+                batch = []
+        if index % 1000 == 0:
+            log(f"  attendance for {index}/{len(people)} employees")
+    if batch:
+        attendance.insert_many(batch, ordered=False)
+        records += len(batch)
+    log(f"  {records} attendance records")
+
+    rollups = AttendanceRollup.rebuild()
+    return {
+        'employees': len(people),
+        'departments': departments,
+        'years': years,
+        'attendance_records': records,
+        'rollups': rollups,
+        'seconds': round(time.perf_counter() - started, 2)
+    }
+
+
+def main(argv=None):
+    """Parse arguments and seed the database"""
+    parser = argparse.ArgumentParser(description="Seed a synthetic HR dataset")
+    parser.add_argument('--employees', type=int, default=1000, help="Employees to create")
+    parser.add_argument('--departments', type=int, default=10, help="Departments")
+    parser.add_argument('--years', type=int, default=1, help="Years of attendance history")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed")
+    parser.add_argument('--batch-size', type=int, default=10000, help="Documents per insert")
+    parser.add_argument('--drop', action='store_true', help="Empty the collections first")
+    args = parser.parse_args(argv)
+
+    if not connect_database():
+        return 1
+    try:
+        summary = generate(args.employees, args.departments, args.years, args.seed, args.batch_size, args.drop)
+        print(f"✅ Seeded {summary['employees']} employees, {summary['attendance_records']} records "
+              f"in {summary['seconds']}s")
+        return 0
+    finally:
+        disconnect_database()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Employee List Query Plans
+Runs explain() on every filter and sort the employee list endpoint accepts
+(first pages and cursor pages) and fails if any plan scans the whole
+collection instead of using the User.meta indexes
+
+Usage (from the backend directory, against a disposable database):
+    MONGODB_URI=mongodb://localhost:27017/hrms_bench python -m benchmarks.explain_employee_queries [--rows 5000]
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('MONGODB_URI', 'mongodb://localhost:27017/hrms_bench')
+
+from app.models import User
+from app.utils import connect_database, disconnect_database
+from app.utils.pagination import encode_cursor, keyset_query
+
+PREFIX = "EX"
+STATUSES = ("Active", "Inactive", "On Leave")
+
+
+def seed(collection, rows):
+    """Insert rows employees shaped like the User Document stores them"""
+    started = datetime(2026, 1, 1)
+    collection.insert_many([{
+        '_id': ObjectId(),
+        'employee_id': f"{PREFIX}{index:06d}",
+        'full_name': f"Person{index % 500} Surname{index % 37}",
+        'full_name_lower': f"person{index % 500} surname{index % 37}",
+        'email': f"{PREFIX.lower()}{index}@gmail.com",
+        'department': f"Dept {index % 20}",
+        'role': f"Role {index % 8}",
+        'status': STATUSES[index % len(STATUSES)],
+        'created_at': started + timedelta(minutes=index),
+        'updated_at': started + timedelta(minutes=index)
+    } for index in range(rows)])
+
+
+def filter_cases():
+    """(label, list_query kwargs) for every filter and sort combination"""
+    cases = []
+    for sort_field in User.SORT_FIELDS:
+        for sort in (sort_field, f'-{sort_field}'):
+            cases.append((f"sort={sort}", {'sort': sort}))
+    filters = {
+        'department': "Dept 3",
+        'status': "Inactive",
+        'role': "Role 5",
+        'name': "person4",
+        'search': "Surname12"
+    }
+    for key, value in filters.items():
+        cases.append((f"{key}={value}", {key: value}))
+        cases.append((f"{key}={value}&sort=full_name", {key: value, 'sort': 'full_name'}))
+    return cases
+
+
+def stages(plan):
+    """Every stage name in an explain() plan tree"""
+    if isinstance(plan, dict):
+        if 'stage' in plan:
+            yield plan['stage']
+        for value in plan.values():
+            yield from stages(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            yield from stages(value)
+
+
+def explain_page(collection, query, sort_field, direction, cursor=None, limit=20):
+    """Winning plan stages of one keyset page query (as find_page() issues it)"""
+    mongo_filter, fields = keyset_query(sort_field, query, cursor, direction=direction)
+    explained = (
+        collection.find(mongo_filter, fields)
+        .sort([(sort_field, direction), ('_id', direction)])
+        .limit(limit + 1)
+        .explain()
+    )
+    return list(stages(explained['queryPlanner']['winningPlan']))
+
+
+def main(argv=None):
+    """Explain every case and report any collection scan"""
+    parser = argparse.ArgumentParser(description="Check employee list queries use indexes")
+    parser.add_argument('--rows', type=int, default=5000, help="Employees to seed")
+    args = parser.parse_args(argv)
+
+    if not connect_database():
+        return 1
+    collection = User._get_collection()
+    try:
+        User.ensure_indexes()
+        collection.delete_many({'employee_id': {'$regex': f'^{PREFIX}'}})
+        seed(collection, args.rows)
+        sample = collection.find_one({'employee_id': f"{PREFIX}{args.rows // 2:06d}"})
+
+        failures = 0
+        for label, kwargs in filter_cases():
+            query, sort_field, direction = User.list_query(**kwargs)
+            cursor = encode_cursor(sample[sort_field], sample['_id'])
+            for page, page_cursor in (("first page", None), ("next page", cursor)):
+                plan = explain_page(collection, query, sort_field, direction, page_cursor)
+                scanned = 'COLLSCAN' in plan
+                failures += scanned
+                print(f"{'❌' if scanned else '✅'} {label:<40} {page:<10} {' <- '.join(plan)}")
+
+        if failures:
+            print(f"❌ {failures} queries scan the whole collection")
+            return 1
+        print("✅ All employee list queries use an index")
+        return 0
+    finally:
+        collection.delete_many({'employee_id': {'$regex': f'^{PREFIX}'}})
+        disconnect_database()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,399 @@
+"""
+Benchmark Harness
+Seeds the synthetic dataset at each scale, then measures every employee and
+attendance route over HTTP and the controller methods directly: throughput,
+p50/p95/p99 latency and peak RSS. Results are written as JSON and can be
+compared with an earlier run.
+
+The HTTP phase needs the API running against the same database, e.g.:
+    MONGODB_URI=mongodb://localhost:27017/hrms_bench uvicorn app.main:app --port 8000
+Its server-side settings (response cache, executor size, ...) are the
+server's own; restart it between scales, or run it with RESPONSE_CACHE_TTL=0,
+so cached pages from the previous dataset aren't measured. Pass --server-pid
+to record its peak RSS too. The SSE stream never completes, so it isn't timed.
+
+Usage (from the backend directory, against a disposable database):
+    MONGODB_URI=mongodb://localhost:27017/hrms_bench python -m benchmarks.harness \\
+        [--scales 1000,10000,100000] [--years 1] [--requests 200] [--concurrency 8] \\
+        [--base-url http://127.0.0.1:8000 | --no-http] [--server-pid PID] \\
+        [--output benchmark-results.json] [--compare previous.json]
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('MONGODB_URI', 'mongodb://localhost:27017/hrms_bench')
+
+from app.controllers import EmployeeController, AttendanceController, ReportController, DashboardController
+from app.utils import connect_database, disconnect_database
+from benchmarks.dataset import generate, department_names, weekdays
+
+# Relative change in p95 or throughput reported as a regression by --compare
+REGRESSION_THRESHOLD = 0.2
+
+# Scenarios that scan whole departments or collections run fewer times
+MAX_CALLS = {
+    'AttendanceController.export_attendance[week,department]': 20,
+    'ReportController.get_department_report': 20,
+    'ReportController.get_hours_report[month]': 20,
+    'GET /api/attendance/export': 20,
+    'DELETE /api/attendance/cleanup': 5,
+    'DELETE /api/attendance/cleanup?background': 5,
+}
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of sorted samples"""
+    if not samples:
+        return None
+    return samples[min(len(samples) - 1, max(0, int(round(fraction * len(samples))) - 1))]
+
+
+def summarize(target, name, durations, errors, elapsed):
+    """Result entry for one scenario"""
+    durations = sorted(durations)
+    return {
+        'target': target,
+        'name': name,
+        'requests': len(durations),
+        'errors': errors,
+        'seconds': round(elapsed, 3),
+        'throughput_rps': round(len(durations) / elapsed, 1) if elapsed else None,
+        'p50_ms': round(percentile(durations, 0.50) * 1000, 2) if durations else None,
+        'p95_ms': round(percentile(durations, 0.95) * 1000, 2) if durations else None,
+        'p99_ms': round(percentile(durations, 0.99) * 1000, 2) if durations else None
+    }
+
+
+def peak_rss_mb(pid=None):
+    """Peak resident set size of this process, or of pid (Linux /proc)"""
+    if pid is None:
+        kilobytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+        return round(kilobytes / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+    try:
+        with open(f'/proc/{pid}/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+class Context:
+    """Values scenarios build their arguments from"""
+
+    def __init__(self, employees, departments, years):
+        self.employees = employees
+        self.departments = department_names(departments)
+        days = weekdays(years, date.today() - timedelta(days=1))
+        self.last_day = days[-1].date()
+        self.month_from = (self.last_day - timedelta(days=30)).isoformat()
+        self.week_from = (self.last_day - timedelta(days=6)).isoformat()
+        self.today = date.today().isoformat()
+        # Unique per run, so write scenarios never collide with earlier runs
+        self.run = uuid.uuid4().hex[:6].upper()
+        self.job_id = None
+
+    def employee_id(self, index):
+        return f"EMP{index % self.employees:06d}"
+
+    def department(self, index):
+        return self.departments[index % len(self.departments)]
+
+    def bench_id(self, prefix, index):
+        return f"{prefix}{self.run}{index:05d}"
+
+
+# Controller scenarios: (name, callable(context, index))
+CONTROLLER_SCENARIOS = [
+    ('EmployeeController.get_all_employees', lambda c, i: EmployeeController.get_all_employees(limit=100)),
+    ('EmployeeController.get_all_employees[department]',
+     lambda c, i: EmployeeController.get_all_employees(limit=100, department=c.department(i))),
+    ('EmployeeController.get_employee_by_id', lambda c, i: EmployeeController.get_employee_by_id(c.employee_id(i * 7919))),
+    ('EmployeeController.add_employee', lambda c, i: EmployeeController.add_employee({
+        'employee_id': c.bench_id('CB', i), 'full_name': "Bench Person",
+        'email': f"{c.bench_id('cb', i).lower()}@gmail.com", 'department': c.department(i), 'role': "Engineer"
+    })),
+    ('EmployeeController.update_employee',
+     lambda c, i: EmployeeController.update_employee(c.bench_id('CB', i), {'role': "Lead"})),
+    ('EmployeeController.delete_employee', lambda c, i: EmployeeController.delete_employee(c.bench_id('CB', i))),
+    ('AttendanceController.get_all_attendance', lambda c, i: AttendanceController.get_all_attendance(limit=100)),
+    ('AttendanceController.get_all_attendance[range,department]', lambda c, i: AttendanceController.get_all_attendance(
+        limit=100, date_from=c.month_from, date_to=c.last_day.isoformat(), department=c.department(i)
+    )),
+    ('AttendanceController.get_employee_attendance',
+     lambda c, i: AttendanceController.get_employee_attendance(c.employee_id(i * 7919))),
+    ('AttendanceController.get_employee_attendance[month]', lambda c, i: AttendanceController.get_employee_attendance(
+        c.employee_id(i * 7919), date_from=c.month_from, date_to=c.last_day.isoformat()
+    )),
+    ('AttendanceController.get_attendance_by_date',
+     lambda c, i: AttendanceController.get_attendance_by_date(c.last_day.isoformat())),
+    ('AttendanceController.export_attendance[week,department]', lambda c, i: _drain(AttendanceController.export_attendance(
+        'ndjson', c.week_from, c.last_day.isoformat(), c.department(i)
+    ))),
+    ('ReportController.get_monthly_report', lambda c, i: ReportController.get_monthly_report(c.last_day.strftime('%Y-%m'))),
+    ('ReportController.get_department_report', lambda c, i: ReportController.get_department_report()),
+    ('ReportController.get_hours_report[month]',
+     lambda c, i: ReportController.get_hours_report(c.month_from, c.last_day.isoformat())),
+    ('DashboardController.get_summary', lambda c, i: DashboardController.get_summary()),
+]
+
+
+def _drain(result):
+    """Consume a streaming export so its cost is measured"""
+    if result['success']:
+        for _ in result['data']:
+            pass
+    return result
+
+
+def run_controller_scenario(name, call, context, requests):
+    """Time sequential controller calls"""
+    requests = min(requests, MAX_CALLS.get(name, requests))
+    durations = []
+    errors = 0
+    started = time.perf_counter()
+    for index in range(requests):
+        call_started = time.perf_counter()
+        result = call(context, index)
+        durations.append(time.perf_counter() - call_started)
+        errors += 0 if result.get('success') else 1
+    return summarize('controller', name, durations, errors, time.perf_counter() - started)
+
+
+def _multipart_csv(rows):
+    """multipart/form-data body with one CSV file field"""
+    boundary = uuid.uuid4().hex
+    body = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="employees.csv"\r\n'
+        f'Content-Type: text/csv\r\n\r\n' + "\n".join(rows) + f'\r\n--{boundary}--\r\n'
+    ).encode()
+    return body, f'multipart/form-data; boundary={boundary}'
+
+
+def _import_body(context, index):
+    rows = ["employee_id,full_name,email,department,role"]
+    for row in range(10):
+        employee_id = context.bench_id('HI', index * 10 + row)
+        rows.append(f"{employee_id},Bench Person,{employee_id.lower()}@gmail.com,{context.department(row)},Engineer")
+    return _multipart_csv(rows)
+
+
+def _json(payload):
+    return json.dumps(payload).encode(), 'application/json'
+
+
+# HTTP scenarios: (name, method, path(context, index), body(context, index) or None).
+# Order matters: employees are added before they are updated, marked and deleted.
+HTTP_SCENARIOS = [
+    ('GET /api/employees/', 'GET', lambda c, i: '/api/employees/?limit=100', None),
+    ('GET /api/employees/?department', 'GET', lambda c, i: f'/api/employees/?limit=100&department={c.department(i)}', None),
+    ('GET /api/employees/?name&sort', 'GET', lambda c, i: '/api/employees/?limit=100&name=Ma&sort=full_name', None),
+    ('GET /api/employees/{employee_id}', 'GET', lambda c, i: f'/api/employees/{c.employee_id(i * 7919)}', None),
+    ('POST /api/employees/', 'POST', lambda c, i: '/api/employees/', lambda c, i: _json({
+        'employee_id': c.bench_id('HB', i), 'full_name': "Bench Person",
+        'email': f"{c.bench_id('hb', i).lower()}@gmail.com", 'department': c.department(i), 'role': "Engineer"
+    })),
+    ('POST /api/employees/import', 'POST', lambda c, i: '/api/employees/import?format=csv', _import_body),
+    ('PUT /api/employees/{employee_id}', 'PUT',
+     lambda c, i: f"/api/employees/{c.bench_id('HB', i)}", lambda c, i: _json({'role': "Lead"})),
+    ('POST /api/attendance/', 'POST', lambda c, i: f"/api/attendance/?employee_id={c.bench_id('HB', i)}",
+     lambda c, i: _json({'attendance_date': c.today, 'check_in_time': "09:00", 'check_out_time': "17:30"})),
+    ('POST /api/attendance/bulk', 'POST', lambda c, i: '/api/attendance/bulk', lambda c, i: _json({'records': [
+        {'employee_id': c.bench_id('HI', i * 10 + row), 'attendance_date': c.today, 'is_present': True}
+        for row in range(10)
+    ]})),
+    ('GET /api/attendance/', 'GET', lambda c, i: '/api/attendance/?limit=100', None),
+    ('GET /api/attendance/?from&to&department', 'GET', lambda c, i: (
+        f'/api/attendance/?limit=100&from={c.month_from}&to={c.last_day}&department={c.department(i)}'
+    ), None),
+    ('GET /api/attendance/employee/{employee_id}', 'GET',
+     lambda c, i: f'/api/attendance/employee/{c.employee_id(i * 7919)}', None),
+    ('GET /api/attendance/employee/{employee_id}?from&to', 'GET', lambda c, i: (
+        f'/api/attendance/employee/{c.employee_id(i * 7919)}?from={c.month_from}&to={c.last_day}'
+    ), None),
+    ('GET /api/attendance/date/{attendance_date}', 'GET', lambda c, i: f'/api/attendance/date/{c.last_day}', None),
+    ('GET /api/attendance/export', 'GET', lambda c, i: (
+        f'/api/attendance/export?format=ndjson&from={c.week_from}&to={c.last_day}&department={c.department(i)}'
+    ), None),
+    ('DELETE /api/employees/{employee_id}', 'DELETE', lambda c, i: f"/api/employees/{c.bench_id('HB', i)}", None),
+    ('DELETE /api/attendance/cleanup', 'DELETE', lambda c, i: '/api/attendance/cleanup', None),
+    ('DELETE /api/attendance/cleanup?background', 'DELETE', lambda c, i: '/api/attendance/cleanup?background=true', None),
+    ('GET /api/attendance/cleanup/jobs/{job_id}', 'GET', lambda c, i: f'/api/attendance/cleanup/jobs/{c.job_id}', None),
+]
+
+
+def _request(base_url, method, path, body):
+    """One HTTP request; returns (seconds, ok)"""
+    data, content_type = body if body else (None, None)
+    request = urllib.request.Request(base_url + path, data=data, method=method)
+    if content_type:
+        request.add_header('Content-Type', content_type)
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=120) as response:
+            response.read()
+            ok = response.status < 400
+    except urllib.error.HTTPError as e:
+        e.read()
+        ok = False
+    except (urllib.error.URLError, OSError):
+        ok = False
+    return time.perf_counter() - started, ok
+
+
+def run_http_scenario(base_url, scenario, context, requests, concurrency):
+    """Time requests issued by concurrency threads"""
+    name, method, path, body = scenario
+    requests = min(requests, MAX_CALLS.get(name, requests))
+    jobs = [(method, path(context, index), body(context, index) if body else None) for index in range(requests)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(lambda job: _request(base_url, *job), jobs))
+    elapsed = time.perf_counter() - started
+    return summarize('http', name, [seconds for seconds, _ in outcomes], sum(1 for _, ok in outcomes if not ok), elapsed)
+
+
+def start_cleanup_job(base_url):
+    """Id of a background cleanup job for the job polling scenario"""
+    request = urllib.request.Request(base_url + '/api/attendance/cleanup?background=true', method='DELETE')
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return json.loads(response.read())['data']['id']
+
+
+def server_reachable(base_url):
+    """Check the API answers /health"""
+    try:
+        with urllib.request.urlopen(base_url + '/health', timeout=5) as response:
+            return response.status == 200
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+def compare(current, previous_path, threshold=REGRESSION_THRESHOLD):
+    """
+    Print p95/throughput changes against an earlier results file
+
+    Returns:
+        int: Number of scenarios that regressed beyond threshold
+    """
+    with open(previous_path) as handle:
+        previous = json.load(handle)
+    baseline = {
+        (scale['employees'], result['target'], result['name']): result
+        for scale in previous['scales'] for result in scale['results']
+    }
+    regressions = 0
+    print(f"\nCompared with {previous_path} ({previous.get('git_commit') or 'unknown commit'}):")
+    for scale in current['scales']:
+        for result in scale['results']:
+            before = baseline.get((scale['employees'], result['target'], result['name']))
+            if not before or not before['p95_ms'] or not result['p95_ms'] or not before['throughput_rps']:
+                continue
+            p95_change = result['p95_ms'] / before['p95_ms'] - 1
+            rps_change = result['throughput_rps'] / before['throughput_rps'] - 1
+            regressed = p95_change > threshold or rps_change < -threshold
+            regressions += regressed
+            print(f"{'❌' if regressed else '  '} {scale['employees']:>7} {result['name']:<58} "
+                  f"p95 {p95_change:+7.1%}  throughput {rps_change:+7.1%}")
+    return regressions
+
+
+def git_commit():
+    """Current commit of the tree being measured, if available"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results):
+    for result in results:
+        print(f"  {result['target']:<10} {result['name']:<58} {result['throughput_rps'] or 0:>9.1f} req/s  "
+              f"p50 {result['p50_ms'] or 0:>8.2f}  p95 {result['p95_ms'] or 0:>8.2f}  "
+              f"p99 {result['p99_ms'] or 0:>8.2f} ms  errors {result['errors']}")
+
+
+def main(argv=None):
+    """Seed each scale, run every scenario and write the results"""
+    parser = argparse.ArgumentParser(description="HRMS benchmark harness")
+    parser.add_argument('--scales', default="1000,10000,100000", help="Comma separated employee counts")
+    parser.add_argument('--departments', type=int, default=10, help="Departments")
+    parser.add_argument('--years', type=int, default=1, help="Years of attendance history")
+    parser.add_argument('--seed', type=int, default=42, help="Dataset random seed")
+    parser.add_argument('--requests', type=int, default=200, help="Requests/calls per scenario")
+    parser.add_argument('--concurrency', type=int, default=8, help="Concurrent HTTP clients")
+    parser.add_argument('--base-url', default="http://127.0.0.1:8000", help="Running API to measure")
+    parser.add_argument('--no-http', action='store_true', help="Only benchmark controllers")
+    parser.add_argument('--server-pid', type=int, help="API process id, to record its peak RSS")
+    parser.add_argument('--output', default="benchmark-results.json", help="Results file (JSON)")
+    parser.add_argument('--compare', help="Earlier results file to compare with")
+    args = parser.parse_args(argv)
+
+    scales = [int(scale) for scale in args.scales.split(',') if scale]
+    run_http = not args.no_http and server_reachable(args.base_url)
+    if not args.no_http and not run_http:
+        print(f"⚠️ {args.base_url} is not answering; running controller scenarios only")
+
+    if not connect_database():
+        return 1
+    report = {
+        'generated_at': datetime.utcnow().isoformat(),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'compare')},
+        'scales': []
+    }
+    try:
+        for employees in scales:
+            print(f"\n▶ {employees} employees, {args.departments} departments, {args.years} year(s)")
+            dataset = generate(employees, args.departments, args.years, args.seed, drop=True)
+            context = Context(employees, args.departments, args.years)
+
+            results = [
+                run_controller_scenario(name, call, context, min(args.requests, employees))
+                for name, call in CONTROLLER_SCENARIOS
+            ]
+            if run_http:
+                context.job_id = start_cleanup_job(args.base_url)
+                results += [
+                    run_http_scenario(args.base_url, scenario, context, min(args.requests, employees), args.concurrency)
+                    for scenario in HTTP_SCENARIOS
+                ]
+            print_results(results)
+            report['scales'].append({
+                'employees': employees,
+                'dataset': dataset,
+                'peak_rss_mb': {'harness': peak_rss_mb(), 'server': peak_rss_mb(args.server_pid) if args.server_pid else None},
+                'results': results
+            })
+
+        with open(args.output, 'w') as handle:
+            json.dump(report, handle, indent=2)
+        print(f"\n✅ Results written to {args.output}")
+
+        if args.compare:
+            return 1 if compare(report, args.compare) else 0
+        return 0
+    finally:
+        disconnect_database()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
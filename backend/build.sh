@@ -13,4 +13,17 @@ pip install --only-binary=:all: -r requirements.txt 2>/dev/null || \
 pip install --prefer-binary -r requirements.txt || \
 pip install -r requirements.txt
 
+# Build missing indexes (in the background) before new workers start; the
+# models no longer create indexes at runtime. Redundant indexes are dropped
+# separately (manage_indexes --drop-redundant) once the old workers are gone
+if [ -n "$MONGODB_URI" ]; then
+    echo "Making attendance unique per employee and day..."
+    python -m app.commands.migrate_attendance_unique
+    python -m app.commands.backfill_name_keys
+    echo "Syncing MongoDB indexes..."
+    python -m app.commands.manage_indexes --apply
+    # Reports read the rollups; fill them once for attendance marked before they existed
+    python -m app.commands.rebuild_rollups --if-empty
+fi
+
 echo "✅ Build completed successfully!"
@@ -17,6 +17,25 @@ class Settings:
         "mongodb://localhost:27017/hrms"
     )
     
+    # Connection pool and timeouts, shared by the MongoEngine and Motor
+    # clients (0 disables the idle, wait-queue and socket timeouts)
+    MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", 100))
+    MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", 5))
+    MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", 300000))
+    MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", 10000))
+    MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", 10000))
+    MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", 0))
+    MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", 5000))
+    
+    # Readiness probe (/ready): seconds a database ping result is reused,
+    # and how long a ping may take before the worker reports not ready
+    READY_CACHE_SECONDS = float(os.getenv("READY_CACHE_SECONDS", 2))
+    READY_TIMEOUT_SECONDS = float(os.getenv("READY_TIMEOUT_SECONDS", 2))
+    
+    # Data access backend: "mongoengine" (sync Documents on the executor)
+    # or "motor" (native async repositories on the event loop)
+    DATA_BACKEND = os.getenv("DATA_BACKEND", "mongoengine")
+    
     # API Configuration
     API_HOST = os.getenv("API_HOST", "0.0.0.0")
     API_PORT = int(os.getenv("API_PORT", 8000))
@@ -33,11 +52,74 @@ class Settings:
     # Security
     DEBUG = ENVIRONMENT != "production"
     
+    # Pagination for list endpoints
+    DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", 100))
+    MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 1000))
+    
+    # Rows fetched per Mongo round-trip (and per streamed chunk) by exports
+    EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+    
+    # Employee ids checked (and orphaned records deleted) per orphan cleanup batch
+    CLEANUP_BATCH_SIZE = int(os.getenv("CLEANUP_BATCH_SIZE", 1000))
+    
+    # Largest batch accepted by bulk write endpoints
+    BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", 5000))
+    
+    # Employee import: rows validated/inserted per batch, validation threads
+    IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 1000))
+    IMPORT_VALIDATION_WORKERS = int(os.getenv("IMPORT_VALIDATION_WORKERS", 8))
+    
+    # Blocking I/O executor - controller calls run on this bounded pool
+    EXECUTOR_MAX_WORKERS = int(os.getenv("EXECUTOR_MAX_WORKERS", 16))
+    EXECUTOR_QUEUE_SIZE = int(os.getenv("EXECUTOR_QUEUE_SIZE", 256))
+    # "reject" answers 503 when the queue is full, "wait" holds the request
+    EXECUTOR_REJECT_POLICY = os.getenv("EXECUTOR_REJECT_POLICY", "reject")
+    
+    # In-process cache of employees for attendance serialization (entries, seconds to live)
+    EMPLOYEE_CACHE_ENABLED = os.getenv("EMPLOYEE_CACHE_ENABLED", "true").lower() == "true"
+    EMPLOYEE_CACHE_SIZE = int(os.getenv("EMPLOYEE_CACHE_SIZE", 10000))
+    EMPLOYEE_CACHE_TTL = int(os.getenv("EMPLOYEE_CACHE_TTL", 300))
+    
+    # Response cache for list/report reads: "memory" (per worker), "redis"
+    # (shared by all workers, required when running several) or "none"
+    RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+    RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", 60))
+    # Most responses the memory backend keeps per worker (least recently used go first)
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 1000))
+    REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    
+    # Single-flight for read endpoints: concurrent requests with the same
+    # path and query share one controller call and encoded body. Query
+    # parameters listed here (e.g. cache busters) are left out of the key
+    COALESCE_ENABLED = os.getenv("COALESCE_ENABLED", "true").lower() == "true"
+    COALESCE_IGNORED_PARAMS = os.getenv("COALESCE_IGNORED_PARAMS", "_")
+    
+    # Live attendance stream (SSE): events kept for Last-Event-ID resume,
+    # keep-alive interval, and whether a change stream (replica set only)
+    # feeds it instead of in-process hooks
+    ATTENDANCE_EVENT_BUFFER = int(os.getenv("ATTENDANCE_EVENT_BUFFER", 1000))
+    SSE_HEARTBEAT_SECONDS = int(os.getenv("SSE_HEARTBEAT_SECONDS", 15))
+    ATTENDANCE_CHANGE_STREAMS = os.getenv("ATTENDANCE_CHANGE_STREAMS", "false").lower() == "true"
+    
+    # Prometheus metrics on /metrics (request, MongoDB command and pool metrics)
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    
+    # Worked-hours report: scheduled start (HH:MM), minutes after it before a
+    # check-in counts as late, and the working day beyond which time is overtime
+    WORK_START_TIME = os.getenv("WORK_START_TIME", "09:00")
+    LATE_GRACE_MINUTES = int(os.getenv("LATE_GRACE_MINUTES", 10))
+    STANDARD_WORK_MINUTES = int(os.getenv("STANDARD_WORK_MINUTES", 480))
+    
     @classmethod
     def get_cors_origins(cls):
         """Get allowed CORS origins based on environment"""
         return cls.ALLOWED_ORIGINS
     
+    @classmethod
+    def use_async_backend(cls):
+        """Check if the native async (Motor) data backend is selected"""
+        return cls.DATA_BACKEND == "motor"
+    
     @classmethod
     def is_production(cls):
         """Check if running in production"""
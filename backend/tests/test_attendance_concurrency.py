@@ -0,0 +1,54 @@
+"""
+Concurrent attendance marks: the unique (employee, day) index lets exactly
+one of many simultaneous requests through
+"""
+import asyncio
+from datetime import date, datetime
+
+from app.models import Attendance, AttendanceRollup
+from conftest import run, employee_payload
+
+PARALLEL_MARKS = 32
+
+
+def test_parallel_marks_store_one_record(client, database):
+    async def scenario():
+        async with client() as http:
+            created = await http.post('/api/employees/', json=employee_payload(1))
+            assert created.status_code == 201, created.text
+            mark = {'attendance_date': date.today().isoformat(), 'is_present': True, 'check_in_time': '09:00'}
+            return await asyncio.gather(*[
+                http.post('/api/attendance/', params={'employee_id': 'EMP0001'}, json=mark)
+                for _ in range(PARALLEL_MARKS)
+            ])
+
+    responses = run(scenario())
+
+    statuses = sorted(response.status_code for response in responses)
+    assert statuses.count(201) == 1, statuses
+    assert statuses.count(409) == PARALLEL_MARKS - 1, statuses
+    assert Attendance._get_collection().count_documents({}) == 1
+    today = datetime.combine(date.today(), datetime.min.time())
+    rollup = AttendanceRollup._get_collection().find_one({'date': today, 'department': 'Engineering'})
+    assert rollup['total'] == 1 and rollup['present'] == 1
+
+
+def test_parallel_bulk_marks_store_one_record_each(client, database):
+    async def scenario():
+        async with client() as http:
+            for index in range(3):
+                created = await http.post('/api/employees/', json=employee_payload(index))
+                assert created.status_code == 201, created.text
+            body = {'records': [
+                {'employee_id': f"EMP{index:04d}", 'attendance_date': date.today().isoformat()}
+                for index in range(3)
+            ]}
+            return await asyncio.gather(*[
+                http.post('/api/attendance/bulk', json=body) for _ in range(PARALLEL_MARKS // 4)
+            ])
+
+    responses = run(scenario())
+
+    results = [item for response in responses for item in response.json()['data']['results']]
+    assert sum(item['status_code'] == 201 for item in results) == 3
+    assert Attendance._get_collection().count_documents({}) == 3
@@ -0,0 +1,170 @@
+"""
+Attendance listings resolve employees with a batched query: the number of
+users queries stays the same however many records a response holds
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+from prometheus_client import REGISTRY
+
+from config import Settings
+from app.models import User, Attendance
+from conftest import run, MONGODB_TEST_URI
+
+DAY = datetime(2026, 3, 2)
+# Records in the first listing, then added before the second
+SIZES = (3, 40)
+USERS_QUERIES = ('find', 'aggregate')
+
+
+class UsersQueryCounter:
+    """
+    Queries sent to the users collection
+
+    On a real server these are the commands seen by the app's
+    CommandMetricsListener (hrms_mongodb_commands_total); mongomock sends
+    no command events, so there the collection's query methods are counted.
+    """
+
+    def __init__(self, monkeypatch):
+        self._calls = 0
+        if not MONGODB_TEST_URI:
+            from mongomock.collection import Collection
+            for name in USERS_QUERIES:
+                monkeypatch.setattr(Collection, name, self._counting(getattr(Collection, name)))
+
+    def _counting(self, method):
+        def counted(collection, *args, **kwargs):
+            if collection.name == User._get_collection_name():
+                self._calls += 1
+            return method(collection, *args, **kwargs)
+        return counted
+
+    def total(self):
+        if not MONGODB_TEST_URI:
+            return self._calls
+        return sum(
+            REGISTRY.get_sample_value(
+                'hrms_mongodb_commands_total',
+                {'command': command, 'collection': User._get_collection_name(), 'outcome': 'success'}
+            ) or 0
+            for command in USERS_QUERIES
+        )
+
+    def during(self, call):
+        """Queries made while call() runs"""
+        before = self.total()
+        call()
+        return self.total() - before
+
+
+@pytest.fixture
+def users_queries(client, monkeypatch):
+    # Every request must reach the database and resolve its employees there
+    monkeypatch.setattr(Settings, 'RESPONSE_CACHE_BACKEND', 'none')
+    monkeypatch.setattr(Settings, 'EMPLOYEE_CACHE_ENABLED', False)
+    return UsersQueryCounter(monkeypatch)
+
+
+def seed_employees(count, prefix):
+    employees = [{
+        '_id': ObjectId(),
+        'employee_id': f"{prefix}{index:04d}",
+        'full_name': f"Person {prefix}",
+        'full_name_lower': f"person {prefix.lower()}",
+        'email': f"{prefix.lower()}{index}@example.com",
+        'department': 'Engineering',
+        'role': 'Engineer',
+        'status': 'Active'
+    } for index in range(count)]
+    User._get_collection().insert_many(employees)
+    return employees
+
+
+def seed_records(pairs):
+    Attendance._get_collection().insert_many([{
+        'employee_id': employee['_id'],
+        'attendance_date': day,
+        'is_present': True,
+        'check_in_time': day + timedelta(hours=9),
+        'check_out_time': day + timedelta(hours=17),
+        'created_at': day,
+        'updated_at': day
+    } for employee, day in pairs])
+
+
+def get(client, path, **params):
+    async def request():
+        async with client() as http:
+            return await http.get(path, params=params)
+    response = run(request())
+    assert response.status_code == 200, response.text
+    return response.json()['data']
+
+
+def queries_at_two_sizes(client, users_queries, path, seed, **params):
+    """
+    Users queries for a listing of a few records, then of many more
+
+    Returns:
+        tuple: (queries, records returned) for the small and the large listing
+    """
+    counts = []
+    for size in SIZES:
+        seed(size)
+        data = []
+        queries = users_queries.during(lambda: data.extend(get(client, path, **params)))
+        counts.append((queries, len(data)))
+    return counts
+
+
+def test_attendance_list_query_count_is_constant(client, users_queries):
+    def seed(size):
+        seed_records((employee, DAY) for employee in seed_employees(size, f"L{size}"))
+
+    (small, small_records), (large, large_records) = queries_at_two_sizes(
+        client, users_queries, '/api/attendance/', seed, limit=100
+    )
+
+    assert (small_records, large_records) == (SIZES[0], sum(SIZES))
+    assert small == large
+
+
+def test_attendance_by_date_query_count_is_constant(client, users_queries):
+    def seed(size):
+        seed_records((employee, DAY) for employee in seed_employees(size, f"D{size}"))
+
+    (small, small_records), (large, large_records) = queries_at_two_sizes(
+        client, users_queries, f"/api/attendance/date/{DAY.date().isoformat()}", seed
+    )
+
+    assert (small_records, large_records) == (SIZES[0], sum(SIZES))
+    assert small == large
+
+
+def test_employee_attendance_query_count_is_constant(client, users_queries):
+    employee, = seed_employees(1, 'EMP')
+    seeded = []
+
+    def seed(size):
+        seed_records((employee, DAY - timedelta(days=len(seeded) + offset)) for offset in range(size))
+        seeded.extend(range(size))
+
+    (small, small_records), (large, large_records) = queries_at_two_sizes(
+        client, users_queries, '/api/attendance/employee/EMP0000', seed
+    )
+
+    assert (small_records, large_records) == (SIZES[0], sum(SIZES))
+    assert small == large
+
+
+def test_dangling_reference_serializes_as_deleted_employee(client, users_queries):
+    kept, deleted = seed_employees(2, 'DEL')
+    seed_records([(kept, DAY), (deleted, DAY)])
+    User._get_collection().delete_one({'_id': deleted['_id']})
+
+    data = get(client, f"/api/attendance/date/{DAY.date().isoformat()}")
+
+    names = sorted(record['employee_name'] for record in data)
+    assert names == ['Deleted Employee', 'Person DEL']
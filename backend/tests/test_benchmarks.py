@@ -0,0 +1,115 @@
+"""
+Benchmark suite: the dataset generator is reproducible and realistic, the
+harness covers every employee/attendance route, its controller scenarios
+run cleanly, and --compare flags regressions
+"""
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from app.models import User, Attendance, AttendanceRollup
+from app.routes import employee_routes, attendance_routes
+from benchmarks.dataset import generate, weekdays, CHECK_IN_MEAN
+from benchmarks.harness import (
+    CONTROLLER_SCENARIOS, HTTP_SCENARIOS, Context, run_controller_scenario, percentile, summarize, compare
+)
+
+EMPLOYEES = 4
+DEPARTMENTS = 2
+YEARS = 1
+# Long-lived SSE stream: never completes, so the harness can't time it
+UNTIMED_ROUTES = {'GET /api/attendance/stream'}
+
+
+def snapshot():
+    """Seeded data without the generated attendance ids"""
+    users = list(User._get_collection().find({}, sort=[('employee_id', 1)]))
+    records = [
+        {key: value for key, value in record.items() if key != '_id'}
+        for record in Attendance._get_collection().find({}, sort=[('employee_id', 1), ('attendance_date', 1)])
+    ]
+    return users, records
+
+
+@pytest.fixture
+def dataset(database):
+    return generate(EMPLOYEES, DEPARTMENTS, YEARS, seed=7, log=lambda message: None)
+
+
+def test_dataset_shape(dataset):
+    days = weekdays(YEARS, date.today() - timedelta(days=1))
+    users, records = snapshot()
+
+    assert dataset['employees'] == EMPLOYEES and len(users) == EMPLOYEES
+    assert len({user['department'] for user in users}) == DEPARTMENTS
+    assert len(records) == dataset['attendance_records'] == EMPLOYEES * len(days)
+    assert all(user['full_name_lower'] == user['full_name'].lower() for user in users)
+    # History ends yesterday, so today can still be marked
+    assert max(record['attendance_date'] for record in records).date() < date.today()
+
+    present = [record for record in records if record['is_present']]
+    assert 0.85 < len(present) / len(records) < 1
+    check_ins = sorted(
+        (record['check_in_time'] - record['attendance_date']).total_seconds() / 60 for record in present
+    )
+    assert abs(check_ins[len(check_ins) // 2] - CHECK_IN_MEAN) < 15
+    assert all(
+        record['check_out_time'] > record['check_in_time'] for record in present if 'check_out_time' in record
+    )
+    rolled_up = sum(rollup['total'] for rollup in AttendanceRollup._get_collection().find())
+    assert rolled_up == len(records)
+
+
+def test_same_seed_gives_the_same_data(dataset):
+    first = snapshot()
+
+    generate(EMPLOYEES, DEPARTMENTS, YEARS, seed=7, drop=True, log=lambda message: None)
+
+    assert snapshot() == first
+
+
+def test_http_scenarios_cover_every_route():
+    routes = {
+        f"{method} {route.path}"
+        for router in (employee_routes.router, attendance_routes.router)
+        for route in router.routes
+        for method in route.methods
+    }
+    covered = {' '.join(name.split(' ')[:2]).split('?')[0] for name, _, _, _ in HTTP_SCENARIOS}
+
+    assert routes - UNTIMED_ROUTES <= covered
+    assert covered <= routes
+
+
+def test_controller_scenarios_run_without_errors(dataset):
+    context = Context(EMPLOYEES, DEPARTMENTS, YEARS)
+
+    results = [run_controller_scenario(name, call, context, 2) for name, call in CONTROLLER_SCENARIOS]
+
+    assert [result['name'] for result in results if result['errors']] == []
+    assert all(result['requests'] == 2 and result['p99_ms'] is not None for result in results)
+
+
+def test_percentiles_use_nearest_rank():
+    samples = [index / 1000 for index in range(1, 101)]
+
+    assert percentile(samples, 0.50) == 0.050
+    assert percentile(samples, 0.99) == 0.099
+    assert percentile([], 0.5) is None
+    summary = summarize('http', 'GET /api/employees/', list(reversed(samples)), 1, 2.0)
+    assert (summary['p50_ms'], summary['p95_ms'], summary['throughput_rps']) == (50.0, 95.0, 50.0)
+
+
+def test_compare_counts_regressions_beyond_the_threshold(tmp_path):
+    def results(p95_ms, throughput_rps):
+        return {'scales': [{'employees': 1000, 'results': [
+            {'target': 'http', 'name': 'GET /api/employees/', 'p95_ms': p95_ms, 'throughput_rps': throughput_rps}
+        ]}]}
+
+    previous = tmp_path / 'previous.json'
+    previous.write_text(json.dumps(results(10.0, 100.0)))
+
+    assert compare(results(11.0, 95.0), previous) == 0
+    assert compare(results(13.0, 100.0), previous) == 1
+    assert compare(results(10.0, 70.0), previous) == 1
@@ -0,0 +1,139 @@
+"""
+Employee cache: LRU/TTL behaviour, invalidation on update/delete, and
+write paths that don't trust entries another worker may have made stale
+
+The cache only resolves the employees referenced by attendance records
+(by _id); employee_id is the key the controllers invalidate by.
+"""
+from datetime import date
+
+import pytest
+from bson import ObjectId
+
+from app.models import User
+from app.utils import employee_cache
+from app.utils.employee_cache import EmployeeCache, find_employee_documents, get_employee_cache
+from conftest import run, employee_payload
+
+
+def document(index):
+    return {
+        '_id': ObjectId(),
+        'employee_id': f"EMP{index:04d}",
+        'full_name': f"Person {index}",
+        'email': f"emp{index}@example.com"
+    }
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the cache module"""
+    now = [1000.0]
+    monkeypatch.setattr(employee_cache.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_hit_by_pk_returns_a_copy():
+    cache = EmployeeCache(max_size=10, ttl_seconds=60)
+    stored = document(1)
+    cache.put(stored)
+
+    first = cache.get_by_pk(stored['_id'])
+    first['full_name'] = "Changed"
+
+    assert cache.get_by_pk(stored['_id'])['full_name'] == "Person 1"
+    assert cache.get_by_pk(ObjectId()) is None
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 1
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = EmployeeCache(max_size=10, ttl_seconds=60)
+    stored = document(1)
+    cache.put(stored)
+
+    clock[0] += 59
+    assert cache.get_by_pk(stored['_id']) is not None
+    clock[0] += 2
+    assert cache.get_by_pk(stored['_id']) is None
+    assert cache.stats()['size'] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = EmployeeCache(max_size=2, ttl_seconds=60)
+    first, second, third = document(1), document(2), document(3)
+    cache.put(first)
+    cache.put(second)
+    cache.get_by_pk(first['_id'])
+
+    cache.put(third)
+
+    assert cache.get_by_pk(second['_id']) is None
+    assert cache.get_by_pk(first['_id']) is not None and cache.get_by_pk(third['_id']) is not None
+    assert cache.stats()['evictions'] == 1
+
+
+def test_invalidate_by_employee_id_drops_the_entry():
+    cache = EmployeeCache(max_size=10, ttl_seconds=60)
+    stored = document(1)
+    cache.put(stored)
+
+    cache.invalidate('EMP0001')
+
+    assert cache.get_by_pk(stored['_id']) is None
+    assert cache.stats()['size'] == 0
+
+
+def test_disabled_cache_stores_nothing():
+    cache = EmployeeCache(max_size=10, ttl_seconds=60, enabled=False)
+    stored = document(1)
+    cache.put(stored)
+
+    assert cache.get_by_pk(stored['_id']) is None
+    assert cache.stats()['size'] == 0
+
+
+def test_batched_lookup_only_queries_uncached_employees(database):
+    users = User._get_collection()
+    stored = [document(index) for index in range(3)]
+    users.insert_many(stored)
+    pks = [entry['_id'] for entry in stored]
+
+    assert set(find_employee_documents(pks[:2])) == set(pks[:2])
+    users.update_many({}, {'$set': {'full_name': "Renamed"}})
+    found = find_employee_documents(pks)
+
+    # The first two come from the cache, only the third is read again
+    assert [found[pk]['full_name'] for pk in pks] == ["Person 0", "Person 1", "Renamed"]
+
+
+def test_update_invalidates_the_names_in_attendance_listings(client):
+    async def scenario():
+        async with client() as http:
+            await http.post('/api/employees/', json=employee_payload(1))
+            mark = {'attendance_date': date.today().isoformat(), 'is_present': True}
+            await http.post('/api/attendance/', params={'employee_id': 'EMP0001'}, json=mark)
+            before = await http.get('/api/attendance/', params={'_': 1})
+            await http.put('/api/employees/EMP0001', json={'full_name': "Renamed Person"})
+            after = await http.get('/api/attendance/', params={'_': 2})
+            return before.json()['data'], after.json()['data']
+
+    before, after = run(scenario())
+
+    assert before[0]['employee_name'] == employee_payload(1)['full_name']
+    assert after[0]['employee_name'] == "Renamed Person"
+
+
+def test_mark_attendance_ignores_an_entry_stale_from_another_worker(client):
+    async def scenario():
+        async with client() as http:
+            await http.post('/api/employees/', json=employee_payload(1))
+            # Deleted by another worker: this worker's cache is not told
+            stored = User._get_collection().find_one({'employee_id': 'EMP0001'})
+            get_employee_cache().put(stored)
+            User._get_collection().delete_one({'_id': stored['_id']})
+            mark = {'attendance_date': date.today().isoformat(), 'is_present': True}
+            return await http.post('/api/attendance/', params={'employee_id': 'EMP0001'}, json=mark)
+
+    response = run(scenario())
+
+    assert response.status_code == 404
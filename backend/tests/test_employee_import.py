@@ -0,0 +1,56 @@
+"""
+Employee import: malformed rows fail on their own, with a per-row error,
+and only rows the User model accepts are stored
+"""
+import json
+
+from app.models import User
+from conftest import run, employee_payload
+
+
+def upload(client, lines, filename='employees.ndjson'):
+    async def request():
+        async with client() as http:
+            return await http.post(
+                '/api/employees/import',
+                files={'file': (filename, '\n'.join(lines).encode(), 'application/x-ndjson')}
+            )
+    return run(request())
+
+
+def test_malformed_ndjson_rows_are_rejected_per_row(client):
+    rows = [
+        employee_payload(1),
+        dict(employee_payload(2), email=['emp2@example.com']),
+        dict(employee_payload(3), email=3),
+        dict(employee_payload(4), employee_id=4),
+        dict(employee_payload(5), role='R' * 51),
+        dict(employee_payload(6), department={'name': 'Engineering'}),
+        employee_payload(7),
+    ]
+    lines = [json.dumps(row) for row in rows] + ['{"employee_id": ']
+
+    response = upload(client, lines)
+
+    assert response.status_code == 200, response.text
+    data = response.json()['data']
+    assert (data['total'], data['created'], data['failed']) == (8, 2, 6)
+    messages = {error['row']: error['message'] for error in data['errors']}
+    assert messages[2] == messages[3] == "Fields must be strings: email"
+    assert messages[4] == "Fields must be strings: employee_id"
+    assert messages[5].startswith("Invalid role")
+    assert messages[6] == "Fields must be strings: department"
+    assert messages[8].startswith("Invalid JSON")
+    assert sorted(User.objects.distinct('employee_id')) == ['EMP0001', 'EMP0007']
+
+
+def test_imported_rows_match_what_the_model_would_save(client):
+    row = dict(employee_payload(1), full_name="Ann O'Brien", role='')
+
+    response = upload(client, [json.dumps(row)])
+
+    assert response.json()['data']['created'] == 1
+    stored = User._get_collection().find_one({'employee_id': 'EMP0001'})
+    assert stored['full_name_lower'] == "ann o'brien"
+    assert (stored['role'], stored['status']) == ('Employee', 'Active')
+    assert stored['created_at'] == stored['updated_at']
@@ -0,0 +1,110 @@
+"""
+Employee list filters and sorts: query shapes, validation, and (on a real
+server) plans that never scan the whole collection
+"""
+import pytest
+
+from app.models import User
+from app.utils.pagination import encode_cursor
+from benchmarks.explain_employee_queries import PREFIX, seed, filter_cases, explain_page, stages
+from conftest import run, employee_payload
+
+
+def _index_scans(plan):
+    """IXSCAN stages of an explain() plan tree"""
+    if isinstance(plan, dict):
+        if plan.get('stage') == 'IXSCAN':
+            yield plan
+        for value in plan.values():
+            yield from _index_scans(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            yield from _index_scans(value)
+
+
+def test_name_filter_is_a_case_sensitive_prefix_on_the_lowercased_name():
+    query, _, _ = User.list_query(name="O'Br.")
+
+    assert query == {'full_name_lower': {'$regex': r"^o'br\."}}
+
+
+@pytest.mark.parametrize('sort', ['', '-', '-foo', '--full_name', 'email', 'full_name '])
+def test_malformed_sort_is_rejected(sort):
+    with pytest.raises(ValueError):
+        User.list_query(sort=sort)
+
+
+@pytest.mark.parametrize('sort, expected', [
+    (None, ('created_at', -1)),
+    ('full_name', ('full_name', 1)),
+    ('-employee_id', ('employee_id', -1)),
+])
+def test_sort_keys(sort, expected):
+    _, sort_field, direction = User.list_query(sort=sort)
+
+    assert (sort_field, direction) == expected
+
+
+def test_list_filters_over_http(client):
+    people = [
+        ("Ann Lee", 'Engineering', 'Engineer'),
+        ("anna Bell", 'Engineering', 'Manager'),
+        ("Bob Crane", 'Sales', 'Engineer'),
+    ]
+
+    async def scenario():
+        async with client() as http:
+            for index, (name, department, role) in enumerate(people):
+                payload = dict(employee_payload(index), full_name=name, department=department, role=role)
+                created = await http.post('/api/employees/', json=payload)
+                assert created.status_code == 201, created.text
+            # A rename must move the employee between name= results
+            await http.put('/api/employees/EMP0002', json={'full_name': "Annie Crane"})
+            return {
+                label: await http.get('/api/employees/', params=params)
+                for label, params in (
+                    ('name', {'name': 'ANN', 'sort': 'full_name'}),
+                    ('department_role', {'department': 'Engineering', 'role': 'Engineer'}),
+                    ('empty_sort', {'sort': ''}),
+                    ('unknown_sort', {'sort': '-foo'}),
+                )
+            }
+
+    responses = run(scenario())
+
+    names = [employee['full_name'] for employee in responses['name'].json()['data']]
+    assert names == ["Ann Lee", "Annie Crane", "anna Bell"]
+    assert [employee['employee_id'] for employee in responses['department_role'].json()['data']] == ['EMP0000']
+    assert responses['empty_sort'].status_code == 400
+    assert responses['unknown_sort'].status_code == 400
+
+
+def test_list_queries_use_an_index(mongod):
+    collection = User._get_collection()
+    seed(collection, 2000)
+    sample = collection.find_one({'employee_id': f"{PREFIX}{1000:06d}"})
+
+    scans = []
+    for label, kwargs in filter_cases():
+        query, sort_field, direction = User.list_query(**kwargs)
+        cursor = encode_cursor(sample[sort_field], sample['_id'])
+        for page_cursor in (None, cursor):
+            plan = explain_page(collection, query, sort_field, direction, page_cursor)
+            if 'COLLSCAN' in plan:
+                scans.append(f"{label} ({'next' if page_cursor else 'first'} page): {' <- '.join(plan)}")
+
+    assert not scans
+
+
+def test_name_prefix_has_tight_index_bounds(mongod):
+    collection = User._get_collection()
+    seed(collection, 2000)
+    query, _, _ = User.list_query(name='Person4')
+
+    plan = collection.find(query).hint([('full_name_lower', 1)]).explain()['queryPlanner']['winningPlan']
+
+    assert 'COLLSCAN' not in list(stages(plan))
+    bounds = next(_index_scans(plan))['indexBounds']['full_name_lower']
+    assert '["person4", "person5")' in bounds
+    assert '["", {})' not in bounds
+
@@ -0,0 +1,52 @@
+"""
+Memory response cache: entries superseded by version bumps don't pile up
+"""
+import pytest
+
+from app.utils import response_cache
+from app.utils.response_cache import MemoryCacheBackend, ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the cache module"""
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_superseded_versions_stay_bounded():
+    backend = MemoryCacheBackend(max_entries=50)
+    cache = ResponseCache(backend, ttl_seconds=60)
+
+    for version in range(1000):
+        cache.set(cache.key('employees', ['users'], {'limit': 10}), {'success': True, 'data': [version]})
+        cache.bump('users')
+
+    assert len(backend) == 50
+    # Version counters are not evicted with the responses
+    assert int(backend.get('hrms:version:users')) == 1000
+
+
+def test_current_entry_survives_eviction_when_read():
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set('hot', b'1')
+    backend.set('cold', b'2')
+    backend.get('hot')
+
+    backend.set('new', b'3')
+
+    assert backend.get('cold') is None
+    assert backend.get('hot') == b'1' and backend.get('new') == b'3'
+
+
+def test_expired_entries_are_dropped_on_set(clock):
+    backend = MemoryCacheBackend(max_entries=100)
+    for index in range(10):
+        backend.set(f'old{index}', b'x', ttl_seconds=60)
+
+    clock[0] += 61
+    backend.set('fresh', b'y', ttl_seconds=60)
+
+    assert len(backend) == 1
+    assert backend.get('fresh') == b'y'
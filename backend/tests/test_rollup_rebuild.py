@@ -0,0 +1,97 @@
+"""
+Rollup rebuild: recomputes totals from raw attendance without losing or
+double counting marks made while it runs, and backfills only when asked
+"""
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+from app.commands import rebuild_rollups
+from app.models import User, Attendance, AttendanceRollup
+
+DAY = datetime(2026, 3, 2)
+
+
+def seed_employee(department='Engineering'):
+    pk = ObjectId()
+    employee = {
+        '_id': pk,
+        'employee_id': f"R{pk}"[-20:],
+        'email': f"{pk}@example.com",
+        'full_name': "Rollup Person",
+        'department': department
+    }
+    User._get_collection().insert_one(employee)
+    return employee
+
+
+def mark(employee, day=DAY, is_present=True):
+    """A mark as the controllers make it: insert the record, then $inc its rollup"""
+    record = {
+        'employee_id': employee['_id'],
+        'attendance_date': day,
+        'is_present': is_present,
+        'check_in_time': day + timedelta(hours=9),
+        'check_out_time': day + timedelta(hours=17)
+    }
+    Attendance._get_collection().insert_one(record)
+    counts = AttendanceRollup.record_counts(is_present, record['check_in_time'], record['check_out_time'])
+    AttendanceRollup.apply({(day, employee['department']): counts})
+
+
+def rollup(department='Engineering', day=DAY):
+    return AttendanceRollup._get_collection().find_one({'date': day, 'department': department})
+
+
+def test_rebuild_repairs_drifted_totals(database):
+    employees = [seed_employee() for _ in range(3)]
+    for employee in employees:
+        mark(employee)
+    AttendanceRollup._get_collection().update_one({'date': DAY}, {'$inc': {'total': 5, 'present': 5}})
+    AttendanceRollup.apply({(DAY, 'Sales'): AttendanceRollup.record_counts(True)})
+
+    AttendanceRollup.rebuild()
+
+    assert (rollup()['present'], rollup()['total'], rollup()['worked_minutes']) == (3, 3, 3 * 480)
+    # Rollups nothing backs any more are removed
+    assert rollup('Sales') is None
+
+
+def test_mark_during_rebuild_is_neither_lost_nor_double_counted(database, monkeypatch):
+    employees = [seed_employee() for _ in range(3)]
+    mark(employees[0])
+    aggregate = AttendanceRollup._totals_by_day
+    calls = []
+
+    def racing_totals(employee_pks, date_range):
+        totals = aggregate(employee_pks, date_range)
+        if not calls:
+            # Marked after the totals were read, before they are written
+            mark(employees[1])
+            mark(employees[2], day=DAY + timedelta(days=1))
+        calls.append(employee_pks)
+        return totals
+
+    monkeypatch.setattr(AttendanceRollup, '_totals_by_day', staticmethod(racing_totals))
+
+    AttendanceRollup.rebuild()
+
+    assert len(calls) == 2
+    assert rollup()['total'] == 2
+    assert rollup(day=DAY + timedelta(days=1))['total'] == 1
+
+
+def test_if_empty_only_backfills_a_database_without_rollups(database, monkeypatch):
+    monkeypatch.setattr(rebuild_rollups, 'connect_database', lambda: True)
+    monkeypatch.setattr(rebuild_rollups, 'disconnect_database', lambda: True)
+    employee = seed_employee()
+    Attendance._get_collection().insert_one({'employee_id': employee['_id'], 'attendance_date': DAY, 'is_present': True})
+
+    assert rebuild_rollups.main(['--if-empty']) == 0
+    assert rollup()['total'] == 1
+
+    Attendance._get_collection().insert_one(
+        {'employee_id': employee['_id'], 'attendance_date': DAY + timedelta(days=1), 'is_present': True}
+    )
+    assert rebuild_rollups.main(['--if-empty']) == 0
+    assert rollup(day=DAY + timedelta(days=1)) is None
@@ -0,0 +1,54 @@
+"""
+Unique indexes behind the duplicate checks: a worker builds the missing
+ones at warm-up, and stays not ready while one can't be built
+"""
+from datetime import datetime
+
+from bson import ObjectId
+
+from app.models import User, Attendance, AttendanceRollup
+from app.models.attendance_model import UNIQUE_DAY_INDEX
+from app.utils.database import warm_up_database
+from app.utils.readiness import DatabaseReadiness
+from conftest import run
+
+DAY = datetime(2026, 3, 2)
+
+
+def drop_declared_indexes():
+    """A database no deploy step has indexed yet"""
+    for model in (User, Attendance, AttendanceRollup):
+        model._get_collection().drop_indexes()
+
+
+def unique_indexes(model):
+    return {
+        name for name, info in model._get_collection().index_information().items() if info.get('unique')
+    }
+
+
+def test_warm_up_builds_missing_unique_indexes(database):
+    drop_declared_indexes()
+
+    assert warm_up_database()
+
+    assert UNIQUE_DAY_INDEX in unique_indexes(Attendance)
+    assert {'employee_id_1', 'email_1'} <= unique_indexes(User)
+    assert unique_indexes(AttendanceRollup)
+
+
+def test_not_ready_while_duplicates_block_a_unique_index(database):
+    drop_declared_indexes()
+    employee = ObjectId()
+    Attendance._get_collection().insert_many([
+        {'employee_id': employee, 'attendance_date': DAY, 'is_present': True} for _ in range(2)
+    ])
+    readiness = DatabaseReadiness(cache_seconds=0, timeout_seconds=5)
+
+    result = run(readiness.check())
+
+    assert result['ready'] is False and result['warmed_up'] is False
+    assert UNIQUE_DAY_INDEX not in unique_indexes(Attendance)
+    # Once the duplicate is resolved the next probe finishes the warm-up
+    Attendance._get_collection().delete_one({'employee_id': employee})
+    assert run(readiness.check())['ready'] is True
@@ -21,7 +21,17 @@ import {
 /**
  * Attendance Trends Chart - Monthly Bar Chart
  */
-export function AttendanceChart({ attendance = [] }) {
+export function AttendanceChart({ attendance = [], monthly = null }) {
+  // Server-side monthly totals ({month: 'YYYY-MM', present, absent}) take precedence
+  if (monthly) {
+    const monthlyTotals = monthly.map(({ month, present, absent }) => {
+      const [year, monthNumber] = month.split('-').map(Number);
+      const label = new Date(year, monthNumber - 1, 1).toLocaleDateString('en-US', { month: 'short', year: '2-digit' });
+      return { month: label, present, absent };
+    });
+    return <MonthlyAttendanceBars data={monthlyTotals} />;
+  }
+
   // Group attendance data by month from real data
   const today = new Date();
   const monthlyData = {};
@@ -54,10 +64,17 @@ export function AttendanceChart({ attendance = [] }) {
     absent: data.absent,
   }));
 
+  return <MonthlyAttendanceBars data={attendanceData} />;
+}
+
+/**
+ * Present/absent bars per month
+ */
+function MonthlyAttendanceBars({ data }) {
   return (
     <div className="h-[300px] w-full">
       <ResponsiveContainer width="100%" height="100%">
-        <BarChart data={attendanceData} barGap={8}>
+        <BarChart data={data} barGap={8}>
           <CartesianGrid strokeDasharray="4 4" vertical={false} stroke="#e5e7eb" />
           <XAxis dataKey="month" stroke="#6b7280" style={{ fontSize: '12px' }} />
           <YAxis stroke="#6b7280" style={{ fontSize: '12px' }} />
@@ -4,4 +4,5 @@
  */
 export { useFetch } from './useFetch.js';
 export { useForm } from './useForm.js';
+export { usePaginatedFetch } from './usePaginatedFetch.js';
 
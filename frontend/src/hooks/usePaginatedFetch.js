@@ -0,0 +1,75 @@
+/**
+ * usePaginatedFetch Hook
+ * Custom hook for cursor-paged lists that load one page at a time
+ */
+import { useCallback, useEffect, useRef, useState } from 'react';
+
+/**
+ * Custom hook for fetching a paged list on demand
+ * @param {Function} fetchPage - Async function (cursor) => {success, data, nextCursor, error};
+ *   memoize it, a new function starts over from the first page
+ * @returns {Object} {items, loading, loadingMore, error, hasMore, loadMore, reload}
+ */
+export const usePaginatedFetch = (fetchPage) => {
+  const [items, setItems] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [error, setError] = useState(null);
+  // Bumped on every reload/unmount so pages of an older list are dropped
+  const generation = useRef(0);
+
+  const reload = useCallback(async () => {
+    const current = ++generation.current;
+    setLoading(true);
+    setLoadingMore(false);
+    setError(null);
+
+    const result = await fetchPage(null);
+    if (current !== generation.current) return;
+
+    if (result && result.success) {
+      setItems(result.data || []);
+      setNextCursor(result.nextCursor || null);
+    } else {
+      setItems([]);
+      setNextCursor(null);
+      setError(result?.error || 'Failed to fetch data');
+    }
+    setLoading(false);
+  }, [fetchPage]);
+
+  const loadMore = useCallback(async () => {
+    if (!nextCursor || loadingMore) return;
+    const current = generation.current;
+    setLoadingMore(true);
+
+    const result = await fetchPage(nextCursor);
+    if (current !== generation.current) return;
+
+    if (result && result.success) {
+      setItems((previous) => [...previous, ...(result.data || [])]);
+      setNextCursor(result.nextCursor || null);
+    } else {
+      setError(result?.error || 'Failed to fetch data');
+    }
+    setLoadingMore(false);
+  }, [fetchPage, nextCursor, loadingMore]);
+
+  useEffect(() => {
+    reload();
+    return () => {
+      generation.current += 1;
+    };
+  }, [reload]);
+
+  return {
+    items,
+    loading,
+    loadingMore,
+    error,
+    hasMore: Boolean(nextCursor),
+    loadMore,
+    reload,
+  };
+};
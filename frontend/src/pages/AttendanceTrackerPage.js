@@ -2,14 +2,15 @@
  * Attendance Tracker Page
  * Mark and view employee attendance
  */
-import { useCallback, useState } from 'react';
+import { useCallback, useEffect, useState } from 'react';
 import { Alert, AlertDescription, AlertTitle, Badge, Button, Card, CardContent, CardHeader, CardTitle, Input } from '../components/ui';
-import { useFetch } from '../hooks/useFetch.js';
 import { useForm } from '../hooks/useForm.js';
+import { usePaginatedFetch } from '../hooks/usePaginatedFetch.js';
 import {
-  getAllEmployees,
+  getEmployees,
   getEmployeeAttendance,
   markAttendance,
+  subscribeToAttendance,
 } from '../services/index.js';
 
 const AttendanceTrackerPage = () => {
@@ -21,10 +22,17 @@ const AttendanceTrackerPage = () => {
   // Get today's date in YYYY-MM-DD format
   const today = new Date().toISOString().split('T')[0];
 
-  // Fetch all employees
-  const fetchEmployees = useCallback(() => getAllEmployees(), []);
-  const { data: employeesData } = useFetch(fetchEmployees);
-  const employees = employeesData || [];
+  // Fetch employees a page at a time, alphabetically for the select
+  const fetchEmployeesPage = useCallback(
+    (cursor) => getEmployees({ sort: 'full_name', fields: 'employee_id,full_name' }, cursor),
+    []
+  );
+  const {
+    items: employees,
+    loadingMore: loadingMoreEmployees,
+    hasMore: hasMoreEmployees,
+    loadMore: loadMoreEmployees,
+  } = usePaginatedFetch(fetchEmployeesPage);
 
   // Form hook
   const form = useForm(
@@ -77,6 +85,27 @@ const AttendanceTrackerPage = () => {
     }
   };
 
+  // Live updates for the selected employee instead of re-fetching
+  useEffect(() => {
+    if (!selectedEmployeeId) return undefined;
+
+    const upsertRecord = (record) => {
+      if (record.employee_id !== selectedEmployeeId) return;
+      setAttendanceRecords((records) => [record, ...records.filter((r) => r.id !== record.id)]);
+    };
+
+    return subscribeToAttendance({
+      onCreated: upsertRecord,
+      onUpdated: upsertRecord,
+      onReset: async () => {
+        const { success, data } = await getEmployeeAttendance(selectedEmployeeId);
+        if (success) {
+          setAttendanceRecords(data || []);
+        }
+      },
+    });
+  }, [selectedEmployeeId]);
+
   const handleEmployeeChange = (e) => {
     const empId = e.target.value;
     setSelectedEmployeeId(empId);
@@ -142,6 +171,18 @@ const AttendanceTrackerPage = () => {
                         </option>
                       ))}
                     </select>
+                    {hasMoreEmployees && (
+                      <Button
+                        type="button"
+                        variant="link"
+                        size="sm"
+                        onClick={loadMoreEmployees}
+                        disabled={loadingMoreEmployees}
+                        className="px-0"
+                      >
+                        {loadingMoreEmployees ? 'Loading...' : 'Load more employees'}
+                      </Button>
+                    )}
                   </div>
 
                   {selectedEmployeeId && (
@@ -2,37 +2,49 @@
  * Dashboard Page
  * Shows system overview with statistics
  */
-import { useCallback } from 'react';
+import { useCallback, useEffect, useState } from 'react';
 import { AttendanceChart } from '../components/Charts/AttendanceChart.js';
 import { PerformanceScoreChart } from '../components/Charts/PerformanceChart.js';
 import { Alert, AlertDescription, AlertTitle, Card, CardContent, CardDescription, CardHeader, CardTitle } from '../components/ui';
 import { useFetch } from '../hooks/useFetch.js';
-import { getAllAttendance, getAllEmployees } from '../services/index.js';
+import { getDashboardSummary, getRecentAttendance, subscribeToAttendance } from '../services/index.js';
 
 
 const DashboardPage = () => {
   
-  const fetchEmployees = useCallback(async () => {
-    const result = await getAllEmployees();
-    console.log('Employees API Response:', result);
-    console.log('Employees Data:', result.data);
+  // Statistics are aggregated on the server; only the summary is downloaded
+  const fetchSummary = useCallback(async () => {
+    const result = await getDashboardSummary();
+    console.log('Dashboard Summary Response:', result);
     return result;
   }, []);
 
-  const fetchAttendance = useCallback(async () => {
-    const result = await getAllAttendance();
-    console.log('Attendance API Response:', result);
-    console.log('Attendance Data:', result.data);
+  const fetchRecentAttendance = useCallback(async () => {
+    const result = await getRecentAttendance(4);
+    console.log('Recent Attendance Response:', result);
     return result;
   }, []);
 
-  const { data: employees, loading: empLoading, error: empError } = useFetch(fetchEmployees);
-  const { data: attendance, loading: attLoading, error: attError } = useFetch(fetchAttendance);
+  const { data: summary, loading: summaryLoading, error: summaryError } = useFetch(fetchSummary);
+  const { data: recentAttendance, loading: attLoading, error: attError } = useFetch(fetchRecentAttendance);
 
-  const totalEmployees = employees?.length || 0;
-  const totalAttendance = attendance?.length || 0;
+  // Newly marked records arrive over the live stream and go on top
+  const [liveAttendance, setLiveAttendance] = useState([]);
+  useEffect(() => subscribeToAttendance({
+    onCreated: (record) => setLiveAttendance((records) => [record, ...records].slice(0, 4)),
+    onReset: () => setLiveAttendance([]),
+  }), []);
+  const attendance = [
+    ...liveAttendance,
+    ...(recentAttendance || []).filter((record) => !liveAttendance.some((live) => live.id === record.id)),
+  ];
 
-  const hasError = empError || attError;
+  const totalEmployees = summary?.employees.total || 0;
+  const totalAttendance = summary?.attendance.total_records || 0;
+  const presentToday = summary?.attendance.today.present || 0;
+  const departmentCounts = summary?.employees.by_department || {};
+
+  const hasError = summaryError || attError;
 
   return (
     <div className="min-h-screen bg-gradient-to-br from-gray-50 to-white">
@@ -49,7 +61,7 @@ const DashboardPage = () => {
           </p>
         </div>
 
-        {(empLoading || attLoading) && (
+        {(summaryLoading || attLoading) && (
           <div className="flex items-center justify-center py-16">
             <div className="text-center">
               <div className="animate-spin h-8 w-8 border-4 border-[#E85D31] border-t-transparent rounded-full mx-auto mb-4" />
@@ -58,7 +70,7 @@ const DashboardPage = () => {
           </div>
         )}
 
-        {hasError && !empLoading && !attLoading && (
+        {hasError && !summaryLoading && !attLoading && (
           <Alert variant="destructive">
             <AlertTitle>Unable to Connect to Backend</AlertTitle>
             <AlertDescription>
@@ -69,7 +81,7 @@ const DashboardPage = () => {
           </Alert>
         )}
 
-        {!hasError && !empLoading && !attLoading && (
+        {!hasError && !summaryLoading && !attLoading && (
           <>
             {/* Stats Grid - 4 Columns */}
             <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-4 mb-12">
@@ -130,11 +142,7 @@ const DashboardPage = () => {
                       <div className="flex-1">
                         <p className="text-sm text-gray-600 mb-1">Present Today</p>
                         <p className="text-2xl text-gray-900 mb-2 font-semibold">
-                          {attendance?.filter(a => {
-                            const attDate = new Date(a.attendance_date).toDateString();
-                            const today = new Date().toDateString();
-                            return attDate === today && a.is_present;
-                          }).length || 0}
+                          {presentToday}
                         </p>
                         <div className="flex items-center gap-1">
                           <svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round" className="lucide lucide-trending-up size-4 text-green-600">
@@ -143,11 +151,7 @@ const DashboardPage = () => {
                           </svg>
                           <span className="text-sm text-green-600">
                             {totalEmployees > 0 
-                              ? Math.round((attendance?.filter(a => {
-                                  const attDate = new Date(a.attendance_date).toDateString();
-                                  const today = new Date().toDateString();
-                                  return attDate === today && a.is_present;
-                                }).length / totalEmployees) * 100) 
+                              ? Math.round((presentToday / totalEmployees) * 100) 
                               : 0}%
                           </span>
                         </div>
@@ -172,7 +176,7 @@ const DashboardPage = () => {
                       <CardDescription>Monthly attendance overview</CardDescription>
                     </CardHeader>
                     <CardContent className="h-80">
-                      <AttendanceChart attendance={attendance || []} />
+                      <AttendanceChart monthly={summary?.attendance.monthly || []} />
                     </CardContent>
                   </Card>
 
@@ -224,26 +228,19 @@ const DashboardPage = () => {
                     </CardHeader>
                     <CardContent>
                       <div className="space-y-6">
-                        {employees && employees.length > 0 ? (
-                          (() => {
-                            const deptCount = {};
-                            employees.forEach(emp => {
-                              const dept = emp.department || 'Unassigned';
-                              deptCount[dept] = (deptCount[dept] || 0) + 1;
-                            });
-                            return Object.entries(deptCount).map(([dept, count]) => (
-                              <div key={dept}>
-                                <div className="flex justify-between items-center mb-2">
-                                  <p className="text-sm font-medium text-gray-900">{dept}</p>
-                                  <p className="text-sm font-semibold text-[#E85D31]">{count}</p>
-                                </div>
-                                <div className="w-full bg-gray-200 rounded-full h-2">
-                                  <div className="bg-blue-500 h-2 rounded-full" style={{ width: `${Math.min((count / employees.length) * 100, 100)}%` }}></div>
-                                </div>
-                                <p className="text-xs text-gray-500 mt-1">{count} {count === 1 ? 'employee' : 'employees'}</p>
+                        {totalEmployees > 0 ? (
+                          Object.entries(departmentCounts).map(([dept, count]) => (
+                            <div key={dept}>
+                              <div className="flex justify-between items-center mb-2">
+                                <p className="text-sm font-medium text-gray-900">{dept || 'Unassigned'}</p>
+                                <p className="text-sm font-semibold text-[#E85D31]">{count}</p>
+                              </div>
+                              <div className="w-full bg-gray-200 rounded-full h-2">
+                                <div className="bg-blue-500 h-2 rounded-full" style={{ width: `${Math.min((count / totalEmployees) * 100, 100)}%` }}></div>
                               </div>
-                            ));
-                          })()
+                              <p className="text-xs text-gray-500 mt-1">{count} {count === 1 ? 'employee' : 'employees'}</p>
+                            </div>
+                          ))
                         ) : (
                           <p className="text-sm text-gray-500 text-center py-4">No employee data</p>
                         )}
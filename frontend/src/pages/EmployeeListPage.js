@@ -4,17 +4,16 @@
  */
 import React, { useCallback, useState } from 'react';
 import { Alert, AlertDescription, AlertTitle, Avatar, AvatarFallback, Badge, Button, Card, Dialog, DialogContent, DialogFooter, DialogTitle, DropdownMenu, DropdownMenuContent, DropdownMenuItem, DropdownMenuSeparator, DropdownMenuTrigger, Input } from '../components/ui';
-import { useFetch } from '../hooks/useFetch.js';
 import { useForm } from '../hooks/useForm.js';
+import { usePaginatedFetch } from '../hooks/usePaginatedFetch.js';
 import {
     addEmployee,
     deleteEmployee,
-    getAllEmployees,
+    getEmployees,
     updateEmployee,
 } from '../services/index.js';
 
 const EmployeeListPage = () => {
-  const [employees, setEmployees] = useState([]);
   const [isModalOpen, setIsModalOpen] = useState(false);
   const [editingEmployee, setEditingEmployee] = useState(null);
   const [submitError, setSubmitError] = useState('');
@@ -22,6 +21,10 @@ const EmployeeListPage = () => {
   const [searchQuery, setSearchQuery] = useState('');
   const [departmentFilter, setDepartmentFilter] = useState('All Department');
   const [statusFilter, setStatusFilter] = useState('All Status');
+  // Filters sent to the server, trailing the inputs by the debounce delay
+  const [filters, setFilters] = useState({});
+  // Departments seen on any loaded page, so a filter keeps its options
+  const [departments, setDepartments] = useState([]);
 
   // Avatar color variations based on initials
   const getAvatarColor = (name) => {
@@ -39,24 +42,38 @@ const EmployeeListPage = () => {
     return colors[hash % colors.length];
   };
 
-  // Fetch all employees
-  const fetchEmployees = useCallback(() => getAllEmployees(), []);
-  const { data: fetchedEmployees, loading: loadingEmployees } = useFetch(fetchEmployees);
+  // Fetch employees a page at a time; a filter change starts over from the first page
+  const fetchEmployeesPage = useCallback((cursor) => getEmployees(filters, cursor), [filters]);
+  const {
+    items: employees,
+    loading: loadingEmployees,
+    loadingMore: loadingMoreEmployees,
+    hasMore: hasMoreEmployees,
+    loadMore: loadMoreEmployees,
+    reload: refetchEmployees,
+  } = usePaginatedFetch(fetchEmployeesPage);
+  const hasFilters = Object.keys(filters).length > 0;
 
-  // Function to refetch employees from API
-  const refetchEmployees = async () => {
-    const response = await getAllEmployees();
-    if (response && response.success && response.data) {
-      setEmployees(Array.isArray(response.data) ? response.data : []);
-    }
-  };
+  React.useEffect(() => {
+    setDepartments((known) => [...new Set([...known, ...employees.map((emp) => emp.department)])].sort());
+  }, [employees]);
 
+  // Filter on the server (indexed queries) instead of in the browser
   React.useEffect(() => {
-    if (fetchedEmployees) {
-      // Ensure employees is always an array
-      setEmployees(Array.isArray(fetchedEmployees) ? fetchedEmployees : []);
-    }
-  }, [fetchedEmployees]);
+    const nextFilters = Object.fromEntries(Object.entries({
+      name: searchQuery.trim(),
+      department: departmentFilter === 'All Department' ? '' : departmentFilter,
+      status: statusFilter === 'All Status' ? '' : statusFilter,
+    }).filter(([, value]) => value));
+
+    // Debounced so typing a name sends one request, not one per keystroke
+    const timer = setTimeout(() => {
+      setFilters((current) => (
+        JSON.stringify(current) === JSON.stringify(nextFilters) ? current : nextFilters
+      ));
+    }, 300);
+    return () => clearTimeout(timer);
+  }, [searchQuery, departmentFilter, statusFilter]);
 
   // Form hook
   const form = useForm(
@@ -174,7 +191,9 @@ const EmployeeListPage = () => {
             <h1 className="text-4xl lg:text-5xl font-light tracking-tight mb-2 text-gray-900">
               Employee Management
             </h1>
-            <p className="text-base text-gray-600">{employees.length} total employees</p>
+            <p className="text-base text-gray-600">
+              {employees.length}{hasMoreEmployees ? '+' : ''} {hasFilters ? 'matching' : 'total'} employees
+            </p>
           </div>
           <Button onClick={handleAddClick} className="bg-[#E85D31] hover:bg-[#d54920]">
             + Add Employee
@@ -196,7 +215,7 @@ const EmployeeListPage = () => {
         )}
 
         {/* Search and Filter Section */}
-        {!loadingEmployees && employees.length > 0 && (
+        {(hasFilters || employees.length > 0) && (
           <div className="mb-8 flex gap-2 items-center w-full">
             {/* Search Bar */}
             <div className="relative flex-1">
@@ -205,7 +224,7 @@ const EmployeeListPage = () => {
               </svg>
               <input
                 type="text"
-                placeholder="Search employees..."
+                placeholder="Search by name..."
                 value={searchQuery}
                 onChange={(e) => setSearchQuery(e.target.value)}
                 className="w-full pl-9 pr-3 py-2 border border-gray-200 rounded-md focus:outline-none focus:border-blue-500 focus:ring-1 focus:ring-blue-50 bg-white hover:border-gray-300 transition-colors text-sm"
@@ -221,7 +240,7 @@ const EmployeeListPage = () => {
                 className="px-3 py-2 border border-gray-200 rounded-md focus:outline-none focus:border-blue-500 focus:ring-1 focus:ring-blue-50 bg-white text-sm font-medium text-gray-700 cursor-pointer hover:border-gray-300 transition-colors min-w-[140px]"
               >
                 <option value="All Department">All Department</option>
-                {Array.isArray(employees) && [...new Set(employees.map(emp => emp.department))].sort().map((dept) => (
+                {departments.map((dept) => (
                   <option key={dept} value={dept}>{dept}</option>
                 ))}
               </select>
@@ -245,7 +264,7 @@ const EmployeeListPage = () => {
           <div className="flex items-center justify-center py-12">
             <p className="text-gray-500">Loading employees...</p>
           </div>
-        ) : employees.length === 0 ? (
+        ) : employees.length === 0 && !hasFilters ? (
           <div className="text-center py-12">
             <p className="text-gray-500 mb-4">No employees found</p>
             <Button onClick={handleAddClick}>Add Your First Employee</Button>
@@ -254,30 +273,7 @@ const EmployeeListPage = () => {
           <>
             {/* Filtered Employee Grid */}
             {(() => {
-              const employeesArray = Array.isArray(employees) ? employees : [];
-              const filteredEmployees = employeesArray.filter((employee) => {
-                // Search filter
-                const searchLower = searchQuery.toLowerCase();
-                const matchesSearch =
-                  !searchQuery ||
-                  employee.full_name.toLowerCase().includes(searchLower) ||
-                  employee.email.toLowerCase().includes(searchLower) ||
-                  employee.role.toLowerCase().includes(searchLower);
-
-                // Department filter
-                const matchesDepartment =
-                  departmentFilter === 'All Department' ||
-                  employee.department === departmentFilter;
-
-                // Status filter
-                const matchesStatus =
-                  statusFilter === 'All Status' ||
-                  (employee.status || 'Active') === statusFilter;
-
-                return matchesSearch && matchesDepartment && matchesStatus;
-              });
-
-              if (filteredEmployees.length === 0) {
+              if (employees.length === 0) {
                 return (
                   <div className="text-center py-12">
                     <p className="text-gray-500">No employees match your filters</p>
@@ -287,7 +283,7 @@ const EmployeeListPage = () => {
 
               return (
                 <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">
-                  {filteredEmployees.map((employee) => (
+                  {employees.map((employee) => (
                     <Card key={employee.id} className="hover:shadow-lg transition-shadow overflow-visible">
                       {/* Header with Avatar and Menu */}
                       <div className="p-5 flex justify-between items-start border-b border-gray-100">
@@ -372,6 +368,14 @@ const EmployeeListPage = () => {
                 </div>
               );
             })()}
+
+            {hasMoreEmployees && (
+              <div className="flex justify-center mt-8">
+                <Button variant="outline" onClick={loadMoreEmployees} disabled={loadingMoreEmployees}>
+                  {loadingMoreEmployees ? 'Loading...' : 'Load more'}
+                </Button>
+              </div>
+            )}
           </>
         )}
 
@@ -5,6 +5,16 @@
 
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000';
 const ATTENDANCE_ENDPOINT = `${API_BASE_URL}/api/attendance/`;
+const PAGE_SIZE = 50;
+
+// Add the set filters (skipping empty values) as query parameters
+const appendFilters = (url, filters) => {
+  Object.entries(filters).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== '') {
+      url.searchParams.append(key, value);
+    }
+  });
+};
 
 /**
  * Mark attendance for an employee
@@ -50,37 +60,81 @@ export const markAttendance = async (employeeId, attendanceData) => {
 };
 
 /**
- * Get all attendance records
- * @returns {Promise<{success: boolean, data: Array|null, error: string|null}>}
+ * Get one page of attendance records, newest first
+ * @param {Object} filters - from / to (YYYY-MM-DD, inclusive), department, is_present
+ * @param {string|null} cursor - next_cursor of the previous page, null for the first
+ * @returns {Promise<{success: boolean, data: Array|null, nextCursor: string|null, error: string|null}>}
  */
-export const getAllAttendance = async () => {
+export const getAttendance = async (filters = {}, cursor = null) => {
   try {
-    console.log('📤 Fetching attendance from:', ATTENDANCE_ENDPOINT);
-    const response = await fetch(ATTENDANCE_ENDPOINT);
-    
+    const url = new URL(ATTENDANCE_ENDPOINT);
+    url.searchParams.append('limit', PAGE_SIZE);
+    appendFilters(url, filters);
+    if (cursor) {
+      url.searchParams.append('cursor', cursor);
+    }
+
+    console.log('📤 Fetching attendance from:', url.toString());
+    const response = await fetch(url.toString());
     console.log('📥 Response Status:', response.status);
-    console.log('📥 Response Headers:', Object.fromEntries(response.headers));
-    
+
     const result = await response.json();
-    console.log('📥 Response Body:', result);
 
     if (!response.ok) {
       console.error('❌ API Error:', result.message);
       return {
         success: false,
         data: null,
+        nextCursor: null,
         error: result.message || 'Failed to fetch attendance',
       };
     }
 
-    console.log('✅ Success! Data:', result.data);
     return {
       success: true,
       data: result.data || [],
+      nextCursor: result.next_cursor || null,
       error: null,
     };
   } catch (error) {
     console.error('❌ Network Error:', error);
+    return {
+      success: false,
+      data: null,
+      nextCursor: null,
+      error: error.message || 'Network error',
+    };
+  }
+};
+
+/**
+ * Get the most recent attendance records (a single small page)
+ * @param {number} limit - Number of records to fetch
+ * @returns {Promise<{success: boolean, data: Array|null, error: string|null}>}
+ */
+export const getRecentAttendance = async (limit = 4) => {
+  try {
+    const url = new URL(ATTENDANCE_ENDPOINT);
+    url.searchParams.append('limit', limit);
+    url.searchParams.append('fields', 'employee_name,is_present,attendance_date');
+
+    const response = await fetch(url.toString());
+    const result = await response.json();
+
+    if (!response.ok) {
+      return {
+        success: false,
+        data: null,
+        error: result.message || 'Failed to fetch attendance',
+      };
+    }
+
+    return {
+      success: true,
+      data: result.data || [],
+      error: null,
+    };
+  } catch (error) {
     return {
       success: false,
       data: null,
@@ -92,11 +146,14 @@ export const getAllAttendance = async () => {
 /**
  * Get attendance for specific employee
  * @param {string} employeeId - Employee ID
+ * @param {Object} filters - from / to (YYYY-MM-DD, inclusive), is_present
  * @returns {Promise<{success: boolean, data: Array|null, error: string|null}>}
  */
-export const getEmployeeAttendance = async (employeeId) => {
+export const getEmployeeAttendance = async (employeeId, filters = {}) => {
   try {
-    const response = await fetch(`${ATTENDANCE_ENDPOINT}employee/${employeeId}`);
+    const url = new URL(`${ATTENDANCE_ENDPOINT}employee/${employeeId}`);
+    appendFilters(url, filters);
+    const response = await fetch(url.toString());
     const result = await response.json();
 
     if (!response.ok) {
@@ -124,11 +181,14 @@ export const getEmployeeAttendance = async (employeeId) => {
 /**
  * Get attendance by date
  * @param {string} attendanceDate - Date in YYYY-MM-DD format
+ * @param {Object} filters - department, is_present
  * @returns {Promise<{success: boolean, data: Array|null, error: string|null}>}
  */
-export const getAttendanceByDate = async (attendanceDate) => {
+export const getAttendanceByDate = async (attendanceDate, filters = {}) => {
   try {
-    const response = await fetch(`${ATTENDANCE_ENDPOINT}date/${attendanceDate}`);
+    const url = new URL(`${ATTENDANCE_ENDPOINT}date/${attendanceDate}`);
+    appendFilters(url, filters);
+    const response = await fetch(url.toString());
     const result = await response.json();
 
     if (!response.ok) {
@@ -152,3 +212,28 @@ export const getAttendanceByDate = async (attendanceDate) => {
     };
   }
 };
+
+/**
+ * Subscribe to live attendance changes (Server-Sent Events)
+ * The browser reconnects on its own and resumes from the last event id.
+ * @param {Object} handlers - Callbacks for stream events
+ * @param {Function} handlers.onCreated - Called with each newly marked record
+ * @param {Function} handlers.onUpdated - Called with each updated record
+ * @param {Function} handlers.onReset - Called when records must be refetched
+ * @returns {Function} Unsubscribe function
+ */
+export const subscribeToAttendance = ({ onCreated, onUpdated, onReset } = {}) => {
+  const source = new EventSource(`${ATTENDANCE_ENDPOINT}stream`);
+
+  if (onCreated) {
+    source.addEventListener('created', (event) => onCreated(JSON.parse(event.data)));
+  }
+  if (onUpdated) {
+    source.addEventListener('updated', (event) => onUpdated(JSON.parse(event.data)));
+  }
+  if (onReset) {
+    source.addEventListener('reset', () => onReset());
+  }
+
+  return () => source.close();
+};
@@ -0,0 +1,38 @@
+/**
+ * Dashboard Service
+ * Handles API calls for the dashboard overview
+ */
+
+const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000';
+const DASHBOARD_ENDPOINT = `${API_BASE_URL}/api/dashboard`;
+
+/**
+ * Get headcount and attendance statistics computed on the server
+ * @returns {Promise<{success: boolean, data: Object|null, error: string|null}>}
+ */
+export const getDashboardSummary = async () => {
+  try {
+    const response = await fetch(`${DASHBOARD_ENDPOINT}/summary`);
+    const result = await response.json();
+
+    if (!response.ok) {
+      return {
+        success: false,
+        data: null,
+        error: result.message || 'Failed to fetch dashboard summary',
+      };
+    }
+
+    return {
+      success: true,
+      data: result.data,
+      error: null,
+    };
+  } catch (error) {
+    return {
+      success: false,
+      data: null,
+      error: error.message || 'Network error',
+    };
+  }
+};
@@ -5,6 +5,7 @@
 
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000';
 const EMPLOYEES_ENDPOINT = `${API_BASE_URL}/api/employees`;
+const PAGE_SIZE = 48;
 
 /**
  * Add a new employee
@@ -46,33 +47,44 @@ export const addEmployee = async (employeeData) => {
 };
 
 /**
- * Get all employees
- * @returns {Promise<{success: boolean, data: Array|null, error: string|null}>}
+ * Get one page of employees, optionally filtered on the server
+ * @param {Object} filters - department, status, role, name (prefix), search, sort, fields
+ * @param {string|null} cursor - next_cursor of the previous page, null for the first
+ * @returns {Promise<{success: boolean, data: Array|null, nextCursor: string|null, error: string|null}>}
  */
-export const getAllEmployees = async () => {
+export const getEmployees = async (filters = {}, cursor = null) => {
   try {
-    console.log('📤 Fetching employees from:', EMPLOYEES_ENDPOINT);
-    const response = await fetch(EMPLOYEES_ENDPOINT);
-    
+    const url = new URL(EMPLOYEES_ENDPOINT);
+    url.searchParams.append('limit', PAGE_SIZE);
+    Object.entries(filters).forEach(([key, value]) => {
+      if (value) {
+        url.searchParams.append(key, value);
+      }
+    });
+    if (cursor) {
+      url.searchParams.append('cursor', cursor);
+    }
+
+    console.log('📤 Fetching employees from:', url.toString());
+    const response = await fetch(url.toString());
     console.log('📥 Response Status:', response.status);
-    console.log('📥 Response Headers:', Object.fromEntries(response.headers));
-    
+
     const result = await response.json();
-    console.log('📥 Response Body:', result);
 
     if (!response.ok) {
       console.error('❌ API Error:', result.message);
       return {
         success: false,
         data: null,
+        nextCursor: null,
         error: result.message || 'Failed to fetch employees',
       };
     }
 
-    console.log('✅ Success! Data:', result.data);
     return {
       success: true,
       data: result.data || [],
+      nextCursor: result.next_cursor || null,
       error: null,
     };
   } catch (error) {
@@ -80,6 +92,7 @@ export const getAllEmployees = async () => {
     return {
       success: false,
       data: null,
+      nextCursor: null,
       error: error.message || 'Network error',
     };
   }
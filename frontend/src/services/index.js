@@ -3,5 +3,5 @@
  * Exports all service modules
  */
 export * from './attendanceService.js';
+export * from './dashboardService.js';
 export * from './employeeService.js';
-